@@ -1,7 +1,9 @@
 
-import random, math
+import random, math, collections, itertools
 import Stats
 
+max_advantage = 7 * 99
+
 class Game(object):
     
     """The Game class.
@@ -17,6 +19,14 @@ class Game(object):
         team2: The second Team to play.
         era: A string representing the era in which this game takes place;
             expected to be "season" or "playoff" (future: "preseason"?).
+        engine: A string for how the game is played: "minute" plays a shot
+            every minute, "lineup" plays a shot every minute on the teams' 
+            shot tables (simulate_lineups), and "event" samples the minutes
+            goals happen in and fills in the rest of the stats in bulk.
+        scoreboard: A Stats.Scoreboard keeping the game's stats until they
+            are added to the era at the end of the game.
+        rng: The random.Random (or the random module) every random draw in
+            the game comes from.
             
     Future:
         Home vs Away with an advantage for Home
@@ -27,7 +37,9 @@ class Game(object):
         Way for human player to interact
     """
     
-    def __init__(self, team1, team2, era = "season"):
+    __slots__ = ("team1", "team2", "era", "engine", "scoreboard", "rng", "olines", "dlines")
+    
+    def __init__(self, team1, team2, era = "season", engine = "minute", rng = None):
         """Inits a Game class.
         
         Args:
@@ -35,6 +47,10 @@ class Game(object):
             team2: A Team object (away team).
             era: A string representing the era in which this game takes place;
                 expected to be "season" or "playoff" (future: "preseason"?).
+            engine: A string for how the game is played; "minute" (default),
+                "lineup", or "event".
+            rng: A random.Random to draw from, so that the game can be 
+                replayed from its seed; if None, the random module is used.
             
         Returns:
             None
@@ -42,30 +58,48 @@ class Game(object):
         self.team1 = team1
         self.team2 = team2
         self.era = era
+        self.engine = engine
+        self.scoreboard = Stats.Scoreboard()
+        self.rng = rng if rng is not None else random
         self.olines = ["L1", "L2", "L3", "L4"]
         self.dlines = ["D1", "D2", "D3"]
         
-    def get_lines(self, offense, defense):
-        """Get the lines on the ice for a shot.
+    def choose_lines(self):
+        """Choose the line combinations on the ice for a shot.
         
         The lines are chosen randomly from all possible offensive and 
         defensive lines (goalies are fixed).
         
+        Args:
+            None
+            
+        Returns:
+            A tuple of two integers in [0, 12); the first is the offense's
+            line combination and the second is the defense's. A combination
+            c is offensive line c // 3 with defensive line c % 3.
+        """
+        return (self.rng.randrange(12), self.rng.randrange(12))
+        
+    def get_lines(self, offense, defense, combos = None):
+        """Get the lines on the ice for a shot.
+        
         Args:
             offense: The Team that will take the shot.
             defense: The Team that is on defense.
+            combos: A tuple of the offense's and the defense's line 
+                combinations (as from choose_lines); if None, they are chosen
+                randomly.
             
         Returns:
             A tuple of lists of players; the first list is the offensive 
             players on the ice for the shot and the second list is the 
             defensive players.
         """
-        offoline = random.choice(self.olines)
-        offdline = random.choice(self.dlines)
-        oline = [player for player in offense.get_line(offoline) + offense.get_line(offdline)]
-        defoline = random.choice(self.olines)
-        defdline = random.choice(self.dlines)
-        dline = [player for player in defense.get_line(defoline) + defense.get_line(defdline)]
+        if combos is None:
+            combos = self.choose_lines()
+        ocombo, dcombo = combos
+        oline = offense.get_line(self.olines[ocombo // 3]) + offense.get_line(self.dlines[ocombo % 3])
+        dline = defense.get_line(self.olines[dcombo // 3]) + defense.get_line(self.dlines[dcombo % 3])
         dline.append(defense.get_line("G")[0])
         return (oline, dline)
         
@@ -93,16 +127,29 @@ class Game(object):
         dscore = 0
         for player in dline:
             dscore += player.rating
-        dadv = dscore - oscore
-        prob = 1 / (1 + math.exp(0.05 * dadv))
-        luck = random.random()
-        if prob > luck:
-            return "Goal"
-        else:
-            return "Miss"
+        return get_shot_result(dscore - oscore, self.rng)
+        
+    def simulate_combo_shot(self, offense, defense, combos):
+        """Get the randomized result of a shot for the given line combinations.
+        
+        This is simulate_shot, but the ratings come from the teams' cached 
+        line strengths rather than from adding up the players on the ice.
+        
+        Args:
+            offense: The Team that will take the shot.
+            defense: The Team that is on defense.
+            combos: A tuple of the offense's and the defense's line 
+                combinations (as from choose_lines).
+                
+        Returns:
+            A String with the result; either Goal or Miss.
+        """
+        oscore = offense.get_line_strengths()[combos[0]]
+        dscore = defense.get_line_strengths()[combos[1]] + defense.get_goalie_strength()
+        return get_shot_result(dscore - oscore, self.rng)
             
     def process_result(self, offense, defense, oline, dline, result):
-        """For the given result, update the team and player stats.
+        """For the given result, update the game's scoreboard.
         
         Note that we choose the shooter at this point (for v1, who is shooting
         does not change the scoring probability).
@@ -117,24 +164,66 @@ class Game(object):
         Returns:
             None
         """
+        board = self.scoreboard
         for player in oline + dline:
-            player.add_stat("game", "Minutes", 1)
+            board.add_stat_id(player, Stats.MINUTES, 1)
         offgoalie = offense.get_line("G")[0]
-        offgoalie.add_stat("game", "Minutes", 1)
-        shooter = oline.pop(random.randrange(len(oline)))
-        shooter.add_stat("game", "Shots", 1)
+        board.add_stat_id(offgoalie, Stats.MINUTES, 1)
+        shooter = oline.pop(self.rng.randrange(len(oline)))
+        board.add_stat_id(shooter, Stats.SHOTS, 1)
         defgoalie = dline[-1]
         if result == "Goal":
-            shooter.add_stat("game", "Goals", 1)
-            defgoalie.add_stat("game", "Goals Allowed", 1)
-            offense.add_stat("game", "Goals For", 1)
-            defense.add_stat("game", "Goals Against", 1)
-            numassists = random.randrange(3)
+            board.add_stat_id(shooter, Stats.GOALS, 1)
+            board.add_stat_id(defgoalie, Stats.GOALS_ALLOWED, 1)
+            board.add_team_stat_id(offense, Stats.GOALS_FOR, 1)
+            board.add_team_stat_id(defense, Stats.GOALS_AGAINST, 1)
+            numassists = self.rng.randrange(3)
             for i in range(numassists):
-                p = oline.pop(random.randrange(len(oline)))
-                p.add_stat("game", "Assists", 1)
+                p = oline.pop(self.rng.randrange(len(oline)))
+                board.add_stat_id(p, Stats.ASSISTS, 1)
         elif result == "Miss":
-            defgoalie.add_stat("game", "Saves", 1)
+            board.add_stat_id(defgoalie, Stats.SAVES, 1)
+        
+    def get_player_stat(self, player, stat):
+        """Get the amount of the given stat the player has in this game so far.
+        
+        Args:
+            player: The Player to get the stat for.
+            stat: The statistic to be returned:
+                v1: Goals, Assists, Minutes, Shots, Saves, Goals Allowed
+                
+        Returns:
+            The amount of the given stat the player has in this game.
+        """
+        return self.scoreboard.get_stat(player, stat)
+        
+    def get_team_stat(self, team, stat):
+        """Get the amount of the given stat the team has in this game so far.
+        
+        Args:
+            team: The Team to get the stat for.
+            stat: The statistic to be returned:
+                v1: Wins, Losses, Ties, Goals For, Goals Against
+                
+        Returns:
+            The amount of the given stat the team has in this game.
+        """
+        return self.scoreboard.get_team_stat(team, stat)
+        
+    def get_roster_total(self, team, stat):
+        """Get the total of the given stat in this game for the players on the
+        team's roster.
+        
+        Args:
+            team: The Team whose roster to total.
+            stat: The statistic to total.
+                v1: Goals, Assists, Minutes, Shots, Saves, Goals Allowed
+                
+        Returns:
+            An integer, the total amount of the given stat that the players on
+            the roster have in this game.
+        """
+        return sum(self.get_player_stat(p, stat) for p in team.get_full_roster())
         
     def play_minute(self):
         """Simulate a minute of play.
@@ -149,10 +238,11 @@ class Game(object):
             None
         """
         teams = [self.team1, self.team2]
-        offense = teams.pop(random.randrange(2))
+        offense = teams.pop(self.rng.randrange(2))
         defense = teams[0]
-        oline, dline = self.get_lines(offense, defense)
-        result = self.simulate_shot(oline, dline)
+        combos = self.choose_lines()
+        result = self.simulate_combo_shot(offense, defense, combos)
+        oline, dline = self.get_lines(offense, defense, combos)
         self.process_result(offense, defense, oline, dline, result)
         
     def play_period(self):
@@ -187,7 +277,7 @@ class Game(object):
             minutes = 5
         for i in range(minutes):
             self.play_minute()
-            if self.team1.get_stat("game", "Goals For") != self.team2.get_stat("game", "Goals For"):
+            if self.get_team_stat(self.team1, "Goals For") != self.get_team_stat(self.team2, "Goals For"):
                 return
                 
     def determine_game_result(self):
@@ -199,18 +289,40 @@ class Game(object):
         Returns:
             None
         """
-        if self.team1.get_stat("game", "Goals For") > self.team2.get_stat("game", "Goals For"):
-            self.team1.add_stat("game", "Wins", 1)
-            self.team2.add_stat("game", "Losses", 1)
-        elif self.team1.get_stat("game", "Goals For") < self.team2.get_stat("game", "Goals For"):
-            self.team1.add_stat("game", "Losses", 1)
-            self.team2.add_stat("game", "Wins", 1)
+        goals1 = self.get_team_stat(self.team1, "Goals For")
+        goals2 = self.get_team_stat(self.team2, "Goals For")
+        board = self.scoreboard
+        if goals1 > goals2:
+            board.add_team_stat_id(self.team1, Stats.WINS, 1)
+            board.add_team_stat_id(self.team2, Stats.LOSSES, 1)
+        elif goals1 < goals2:
+            board.add_team_stat_id(self.team1, Stats.LOSSES, 1)
+            board.add_team_stat_id(self.team2, Stats.WINS, 1)
         else:
-            self.team1.add_stat("game", "Ties", 1)
-            self.team2.add_stat("game", "Ties", 1)
+            board.add_team_stat_id(self.team1, Stats.TIES, 1)
+            board.add_team_stat_id(self.team2, Stats.TIES, 1)
             
+    def get_winner(self):
+        """Get the winner of the game from its scoreboard.
+        
+        This must be called before update_stats clears the scoreboard.
+        
+        Args:
+            None
+        
+        Returns:
+            The Team that won, or None if the game was tied.
+        """
+        if self.get_team_stat(self.team1, "Wins"):
+            return self.team1
+        if self.get_team_stat(self.team2, "Wins"):
+            return self.team2
+        return None
+        
     def update_stats(self):
-        """Update team and player stats from the game to the wider era.
+        """Add the game's stats to the wider era and clear the scoreboard.
+        
+        Only the players who played in the game are updated.
         
         Args:
             None
@@ -219,21 +331,55 @@ class Game(object):
             None
         """
         if self.era == "playoff":
-            self.team1.update_stats("game", "playoff")
-            self.team2.update_stats("game", "playoff")
-            for player in self.team1.get_full_roster() + self.team2.get_full_roster():
-                player.update_stats("game", "playoff")
+            self.scoreboard.flush(Stats.PLAYOFF)
+        else:
+            self.scoreboard.flush(Stats.SEASON)
+    
+    def play_game_tallies(self):
+        """Play the game with the lineup or event engine.
+        
+        The game's stats are filled in from the tallies of simulate_tables
+        rather than minute by minute, and the result is determined the same
+        way.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        table1 = get_shot_table(self.team1, self.team2)
+        table2 = get_shot_table(self.team2, self.team1)
+        tally1, tally2 = simulate_tables(table1, table2, self.era, self.engine, self.rng)
+        apply_tally(self.scoreboard, self.team1, get_lineup_players(self.team1), tally1, tally2)
+        apply_tally(self.scoreboard, self.team2, get_lineup_players(self.team2), tally2, tally1)
+    
+    def simulate_game(self):
+        """Play the game without updating the wider era.
+        
+        Play three periods. If the game is tied, play overtime. Determine the
+        result. With the lineup and event engines, the whole game is played
+        on tallies. Afterwards, the game's stats are on its scoreboard.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        if self.engine in ("lineup", "event"):
+            self.play_game_tallies()
         else:
-            self.team1.update_stats("game", "season")
-            self.team2.update_stats("game", "season")
-            for player in self.team1.get_full_roster() + self.team2.get_full_roster():
-                player.update_stats("game", "season")
+            for i in range(3):
+                self.play_period()
+            if self.get_team_stat(self.team1, "Goals For") == self.get_team_stat(self.team2, "Goals For"):
+                self.play_overtime()
+            self.determine_game_result()
     
     def play_game(self):
         """Play the game.
         
-        Play three periods. If the game is tied, play overtime. Update the 
-        stats.
+        Simulate the game, then update the stats.
         
         Args:
             None
@@ -241,10 +387,593 @@ class Game(object):
         Returns:
             None
         """
-        for i in range(3):
-            self.play_period()
-        if self.team1.get_stat("game", "Goals For") == self.team2.get_stat("game", "Goals For"):
-            self.play_overtime()
-        self.determine_game_result()
+        self.simulate_game()
         self.update_stats()
-        
\ No newline at end of file
+        
+
+def set_shot_coefficient(coefficient):
+    """Set the coefficient of the shot probability function and rebuild the
+    shot probability table.
+    
+    The probability of a goal is 1 / (1 + exp(coefficient * dadv)), where 
+    dadv is the defense's rating sum minus the offense's. Ratings are integers
+    in [0, 100), so dadv is an integer in (-max_advantage, max_advantage) and 
+    we keep the probability for every such value in the global variable 
+    shot_prob_table, indexed by dadv + max_advantage. This is called when this
+    module is imported or ran.
+    
+    Args:
+        coefficient: A number; larger values make the difference in ratings
+            matter more.
+            
+    Returns:
+        None
+    """
+    global shot_coefficient, shot_prob_table
+    shot_coefficient = coefficient
+    shot_prob_table = [get_goal_probability(coefficient * dadv) 
+        for dadv in range(-max_advantage, max_advantage + 1)]
+        
+def get_goal_probability(x):
+    """Get 1 / (1 + exp(x)) without overflowing for large x.
+    
+    Args:
+        x: A number, the shot coefficient times the defensive advantage.
+        
+    Returns:
+        A float in [0, 1].
+    """
+    e = math.exp(-abs(x))
+    if x > 0:
+        return e / (1 + e)
+    return 1 / (1 + e)
+        
+def get_shot_prob(dadv):
+    """Get the probability of a goal with the given defensive advantage.
+    
+    This looks the probability up in shot_prob_table; advantages outside of
+    the table (from ratings outside [0, 100), which are not enforced) are 
+    computed directly.
+    
+    Args:
+        dadv: The defense's rating sum (including the goalie) minus the 
+            offense's rating sum.
+            
+    Returns:
+        A float, the probability that the shot is a goal.
+    """
+    if type(dadv) is int and -max_advantage <= dadv <= max_advantage:
+        return shot_prob_table[dadv + max_advantage]
+    return get_goal_probability(shot_coefficient * dadv)
+
+def get_shot_result(dadv, rng = random):
+    """Get the randomized result of a shot with the given defensive advantage.
+    
+    We compare a random number between 0 and 1 to the probability of a goal
+    (from get_shot_prob). If the random number is less than the probability,
+    then we have a goal.
+    
+    Args:
+        dadv: The defense's rating sum (including the goalie) minus the 
+            offense's rating sum.
+        rng: The random.Random (or the random module) to draw from.
+            
+    Returns:
+        A String with the result; either Goal or Miss.
+    """
+    prob = get_shot_prob(dadv)
+    luck = rng.random()
+    if prob > luck:
+        return "Goal"
+    else:
+        return "Miss"
+        
+def get_lineup_players(team):
+    """Get the players of a team in the slot order used by the batch engine.
+    
+    Slots 0-11 are L1 thru L4 (C, LW, RW for each line), slots 12-17 are D1
+    thru D3 (two per line), and slot 18 is the goalie.
+    
+    Args:
+        team: The Team to get the players for.
+        
+    Returns:
+        A list of 19 Players in slot order.
+    """
+    players = []
+    for line in ["L1", "L2", "L3", "L4", "D1", "D2", "D3", "G"]:
+        players += team.get_line(line)[:3 if line[0] == "L" else 2]
+    return players[:19]
+    
+def get_shot_table(offense, defense):
+    """Get the probability of a goal for every combination of lines.
+    
+    The table is indexed by ocombo * 12 + dcombo, where ocombo and dcombo are
+    the offense's and the defense's line combinations (as in 
+    Game.choose_lines). The probability is the same function used by 
+    Game.simulate_shot.
+    
+    Args:
+        offense: The Team on offense.
+        defense: The Team on defense.
+            
+    Returns:
+        A list of 144 floats, the probability of a goal for each combination.
+    """
+    goalie = defense.get_goalie_strength()
+    dscores = [s + goalie for s in defense.get_line_strengths()]
+    return [get_shot_prob(dscore - oscore) 
+        for oscore in offense.get_line_strengths() for dscore in dscores]
+    
+def simulate_lineups(table1, table2, era = "season", rng = random):
+    """Simulate a game between two teams from their shot tables.
+    
+    This plays the same game as Game.play_game (a shot a minute, sudden death
+    overtime), but only keeps integer tallies for each lineup slot rather than
+    updating the players and teams directly.
+    
+    Args:
+        table1: The shot table (as from get_shot_table) with the first team on
+            offense.
+        table2: The shot table with the second team on offense.
+        era: A string representing the era in which this game takes place;
+            expected to be "season" or "playoff".
+        rng: The random.Random (or the random module) to draw from.
+            
+    Returns:
+        A two-element list of tallies, one per team. Each tally is a list of
+        integers: minutes for L1 thru L4 and D1 thru D3 (0-6), shots for slots
+        0-17 (7-24), goals for slots 0-17 (25-42), assists for slots 0-17
+        (43-60), saves (61), goals allowed (62), goals for (63), and minutes 
+        played in the game (64).
+    """
+    tables = (table1, table2)
+    tallies = ([0] * 65, [0] * 65)
+    rnd = rng.random
+    minutes = 0
+    overtime = 10000 if era == "playoff" else 5
+    while minutes < 60 + overtime:
+        if minutes >= 60 and tallies[0][63] != tallies[1][63]:
+            break
+        minutes += 1
+        r = int(rnd() * 288)
+        side, combo = divmod(r, 144)
+        off = tallies[side]
+        de = tallies[1 - side]
+        ocombo, dcombo = divmod(combo, 12)
+        oline, odline = divmod(ocombo, 3)
+        doline, ddline = divmod(dcombo, 3)
+        off[oline] += 1
+        off[4 + odline] += 1
+        de[doline] += 1
+        de[4 + ddline] += 1
+        skaters = [3 * oline, 3 * oline + 1, 3 * oline + 2, 
+            12 + 2 * odline, 13 + 2 * odline]
+        shooter = skaters.pop(int(rnd() * 5))
+        off[7 + shooter] += 1
+        if rnd() < tables[side][combo]:
+            off[25 + shooter] += 1
+            off[63] += 1
+            de[62] += 1
+            for p in rng.sample(skaters, rng.randrange(3)):
+                off[43 + p] += 1
+        else:
+            de[61] += 1
+    tallies[0][64] = minutes
+    tallies[1][64] = minutes
+    return tallies
+    
+def get_goal_gap(prob, rng = random):
+    """Get the number of minutes until the next goal.
+    
+    This is a draw from the geometric distribution; each minute is a goal 
+    with the given probability.
+    
+    Args:
+        prob: The probability of a goal in any one minute.
+        rng: The random.Random (or the random module) to draw from.
+        
+    Returns:
+        The number of minutes (at least 1) until and including the minute of
+        the next goal, or infinity if there can be no goal.
+    """
+    if prob <= 0:
+        return float('inf')
+    if prob >= 1:
+        return 1
+    return 1 + int(math.log(1 - rng.random()) / math.log(1 - prob))
+    
+def get_event_outcomes():
+    """Get what happens to the tallies in each of the event engine's outcomes.
+    
+    The event engine draws a minute as one of 1440 outcomes: the team on 
+    offense (2), the offense's line combination (12), the defense's line 
+    combination (12), and which of the five skaters on offense took the shot
+    (5), in that order. This is called when this module is imported or ran.
+    
+    Args:
+        None
+        
+    Returns:
+        A list of 1440 tuples: the side on offense (0 or 1), the tally indices
+        of the offense's offensive and defensive lines and of the defense's 
+        offensive and defensive lines, the shooter's slot, and a list of the
+        slots of the other four skaters on offense.
+    """
+    outcomes = []
+    for side in range(2):
+        for ocombo in range(12):
+            oline, odline = divmod(ocombo, 3)
+            for dcombo in range(12):
+                doline, ddline = divmod(dcombo, 3)
+                for shot in range(5):
+                    skaters = [3 * oline, 3 * oline + 1, 3 * oline + 2, 
+                        12 + 2 * odline, 13 + 2 * odline]
+                    shooter = skaters.pop(shot)
+                    outcomes.append((side, oline, 4 + odline, doline, 
+                        4 + ddline, shooter, skaters))
+    return outcomes
+    
+def get_event_table(table1, table2):
+    """Get what the event engine needs to know about a pairing.
+    
+    Args:
+        table1: The shot table (as from get_shot_table) with the first team on
+            offense.
+        table2: The shot table with the second team on offense.
+        
+    Returns:
+        A tuple of the probability of a goal in any one minute, the 
+        cumulative weights of the 1440 outcomes given a goal, and the 
+        cumulative weights given no goal.
+    """
+    goal_weights = [prob for prob in table1 + table2 for shot in range(5)]
+    goal_cum = list(itertools.accumulate(goal_weights))
+    quiet_cum = list(itertools.accumulate(1 - prob for prob in goal_weights))
+    return (goal_cum[-1] / 1440, goal_cum, quiet_cum)
+    
+def simulate_lineups_events(event_table, era = "season", rng = random):
+    """Simulate a game between two teams by sampling when the goals happen.
+    
+    Every minute is the same draw (a random team on offense, random lines for
+    both teams), so the number of minutes until the next goal is geometric.
+    We draw the goal minutes and what happened in them, and then what happened
+    in all of the other minutes at once, conditioned on there not being a 
+    goal. Sudden death overtime is a single draw.
+    
+    This plays the same game as simulate_lineups and returns the same tallies.
+    
+    Args:
+        event_table: The pairing's event table (as from get_event_table).
+        era: A string representing the era in which this game takes place;
+            expected to be "season" or "playoff".
+        rng: The random.Random (or the random module) to draw from.
+            
+    Returns:
+        A two-element list of tallies, one per team, as from simulate_lineups.
+    """
+    prob, goal_cum, quiet_cum = event_table
+    outcomes = range(1440)
+    goal_minutes = 0
+    minute = get_goal_gap(prob, rng)
+    while minute <= 60:
+        goal_minutes += 1
+        minute += get_goal_gap(prob, rng)
+    goals = rng.choices(outcomes, cum_weights = goal_cum, k = goal_minutes)
+    minutes = 60
+    score = [0, 0]
+    for goal in goals:
+        score[goal // 720] += 1
+    if score[0] == score[1]:
+        overtime = 10000 if era == "playoff" else 5
+        gap = get_goal_gap(prob, rng)
+        if gap <= overtime:
+            goals += rng.choices(outcomes, cum_weights = goal_cum)
+            minutes += gap
+        else:
+            minutes += overtime
+    quiet = rng.choices(outcomes, cum_weights = quiet_cum, k = minutes - len(goals))
+    
+    tallies = ([0] * 65, [0] * 65)
+    for outcome, n in collections.Counter(quiet).items():
+        side, oline, odline, doline, ddline, shooter, others = event_outcomes[outcome]
+        off = tallies[side]
+        de = tallies[1 - side]
+        off[oline] += n
+        off[odline] += n
+        de[doline] += n
+        de[ddline] += n
+        off[7 + shooter] += n
+        de[61] += n
+    for outcome in goals:
+        side, oline, odline, doline, ddline, shooter, others = event_outcomes[outcome]
+        off = tallies[side]
+        de = tallies[1 - side]
+        off[oline] += 1
+        off[odline] += 1
+        de[doline] += 1
+        de[ddline] += 1
+        off[7 + shooter] += 1
+        off[25 + shooter] += 1
+        off[63] += 1
+        de[62] += 1
+        for p in rng.sample(others, rng.randrange(3)):
+            off[43 + p] += 1
+    tallies[0][64] = minutes
+    tallies[1][64] = minutes
+    return tallies
+    
+def get_goal_rates(team1, team2):
+    """Get the probability that each team scores in any one minute.
+    
+    Every minute is the same draw: a random team on offense and random lines
+    for both teams, so this is half the average of each team's shot table.
+    
+    Args:
+        team1: The first Team.
+        team2: The second Team.
+        
+    Returns:
+        A tuple of two floats, the probability of a goal by team1 and by 
+        team2 in a minute.
+    """
+    rate1 = sum(get_shot_table(team1, team2)) / 288
+    rate2 = sum(get_shot_table(team2, team1)) / 288
+    return (rate1, rate2)
+    
+def get_margin_distribution(rate1, rate2, minutes = 60):
+    """Get the distribution of the goal margin after the given minutes.
+    
+    Args:
+        rate1: The probability that the first team scores in a minute.
+        rate2: The probability that the second team scores in a minute.
+        minutes: The number of minutes played (60 for regulation).
+        
+    Returns:
+        A list of 2 * minutes + 1 floats; entry i is the probability that the
+        first team leads by i - minutes goals.
+    """
+    quiet = 1 - rate1 - rate2
+    dist = [1.0]
+    for minute in range(minutes):
+        dist = [rate2 * x + quiet * y + rate1 * z for x, y, z in 
+            zip(dist + [0.0, 0.0], [0.0] + dist + [0.0], [0.0, 0.0] + dist)]
+    return dist
+    
+def get_result_probabilities(rate1, rate2, era = "season", margin = None):
+    """Get the exact probabilities of each result of a game.
+    
+    A game tied after regulation goes to sudden death overtime, which lasts 
+    5 minutes (non-playoff) or 10000 minutes (playoff).
+    
+    Args:
+        rate1: The probability that the first team scores in a minute.
+        rate2: The probability that the second team scores in a minute.
+        era: A string representing the era in which the game takes place;
+            expected to be "season" or "playoff".
+        margin: The regulation margin distribution (as from 
+            get_margin_distribution), if it has already been computed.
+            
+    Returns:
+        A tuple of three floats, the probabilities that the first team wins,
+        loses, and ties.
+    """
+    if margin is None:
+        margin = get_margin_distribution(rate1, rate2)
+    win = sum(margin[61:])
+    loss = sum(margin[:60])
+    tie = margin[60]
+    rate = rate1 + rate2
+    if rate <= 0:
+        return (win, loss, tie)
+    overtime = 10000 if era == "playoff" else 5
+    overtime_goal = tie * (1 - (1 - rate) ** overtime)
+    return (win + overtime_goal * rate1 / rate, loss + overtime_goal * rate2 / rate, 
+        tie - overtime_goal)
+    
+def get_final_margin_distribution(rate1, rate2, era = "season", margin = None):
+    """Get the exact distribution of a game's final goal margin.
+    
+    This is the regulation margin with a game tied after regulation moved
+    one goal either way when overtime is decided.
+    
+    Args:
+        rate1: The probability that the first team scores in a minute.
+        rate2: The probability that the second team scores in a minute.
+        era: A string representing the era in which the game takes place;
+            expected to be "season" or "playoff".
+        margin: The regulation margin distribution (as from 
+            get_margin_distribution), if it has already been computed.
+            
+    Returns:
+        A list of 121 floats; entry i is the probability that the first team
+        wins by i - 60 goals.
+    """
+    if margin is None:
+        margin = get_margin_distribution(rate1, rate2)
+    final = list(margin)
+    win, loss, tie = get_result_probabilities(rate1, rate2, era, margin)
+    final[61] += win - sum(margin[61:])
+    final[59] += loss - sum(margin[:60])
+    final[60] = tie
+    return final
+    
+def get_goal_distribution(rate1, rate2, minutes = 60):
+    """Get the exact joint distribution of each team's goals.
+    
+    Each minute at most one team scores, with the same chances every minute,
+    so the goals are multinomial over the minutes (and each team's goals on
+    their own are binomial).
+    
+    Args:
+        rate1: The probability that the first team scores in a minute.
+        rate2: The probability that the second team scores in a minute.
+        minutes: The number of minutes played (60 for regulation).
+        
+    Returns:
+        A list of lists; entry [a][b] is the probability that the first team
+        scores a goals and the second b (zero where a + b > minutes).
+    """
+    quiet = 1 - rate1 - rate2
+    dist = [[0.0] * (minutes + 1) for a in range(minutes + 1)]
+    for a in range(minutes + 1):
+        for b in range(minutes + 1 - a):
+            dist[a][b] = (math.comb(minutes, a) * math.comb(minutes - a, b) * 
+                rate1 ** a * rate2 ** b * quiet ** (minutes - a - b))
+    return dist
+    
+def get_matchup_distribution(team1, team2, era = "season"):
+    """Get the exact distribution of a game's outcome without playing it.
+    
+    This is what the game engines sample from, so it can preview a matchup
+    or check an engine against the expected results.
+    
+    Args:
+        team1: The first Team.
+        team2: The second Team.
+        era: A string representing the era in which the game takes place;
+            expected to be "season" or "playoff".
+            
+    Returns:
+        A dictionary with the keys:
+            Regulation: The joint distribution of regulation goals, as from
+                get_goal_distribution.
+            Goals For, Goals Against: Lists; entry n is the probability that
+                team1 (Goals For) or team2 (Goals Against) scores n goals in
+                regulation.
+            Overtime: The probability that the game goes to overtime.
+            Wins, Losses, Ties: The probabilities of each result for team1.
+            Scores: A dictionary of the form {(goals1, goals2): probability}
+                of the final scores, overtime included.
+    """
+    rate1, rate2 = get_goal_rates(team1, team2)
+    regulation = get_goal_distribution(rate1, rate2)
+    wins, losses, ties = get_result_probabilities(rate1, rate2, era)
+    rate = rate1 + rate2
+    overtime = 10000 if era == "playoff" else 5
+    overtime_goal = 1 - (1 - rate) ** overtime if rate > 0 else 0.0
+    scores = {}
+    for a, row in enumerate(regulation):
+        for b, prob in enumerate(row):
+            if prob == 0:
+                continue
+            if a == b and rate > 0:
+                scores[(a + 1, b)] = scores.get((a + 1, b), 0.0) + prob * overtime_goal * rate1 / rate
+                scores[(a, b + 1)] = scores.get((a, b + 1), 0.0) + prob * overtime_goal * rate2 / rate
+                prob *= 1 - overtime_goal
+            scores[(a, b)] = scores.get((a, b), 0.0) + prob
+    return {
+        "Regulation": regulation,
+        "Goals For": [sum(row) for row in regulation],
+        "Goals Against": [sum(row[b] for row in regulation) for b in range(61)],
+        "Overtime": sum(regulation[a][a] for a in range(31)),
+        "Wins": wins, "Losses": losses, "Ties": ties,
+        "Scores": scores}
+    
+def simulate_tables(table1, table2, era = "season", engine = "lineup", rng = random):
+    """Simulate a game between two teams from their shot tables.
+    
+    This only needs the shot tables, so it can be run in another process.
+    
+    Args:
+        table1: The shot table (as from get_shot_table) with the first team on
+            offense.
+        table2: The shot table with the second team on offense.
+        era: A string representing the era in which this game takes place;
+            expected to be "season" or "playoff".
+        engine: A string for how the game is played; "lineup" 
+            (simulate_lineups) or "event" (simulate_lineups_events).
+        rng: The random.Random (or the random module) to draw from.
+        
+    Returns:
+        A two-element list of tallies, one per team, as from simulate_lineups.
+    """
+    if engine == "event":
+        return simulate_lineups_events(get_event_table(table1, table2), era, rng)
+    return simulate_lineups(table1, table2, era, rng)
+    
+def apply_tally(scoreboard, team, players, tally, against):
+    """Add a tally from simulate_lineups to a scoreboard.
+    
+    Args:
+        scoreboard: The Stats.Scoreboard to add the tally to.
+        team: The Team the tally belongs to.
+        players: The Team's players in slot order (from get_lineup_players).
+        tally: The Team's tally from simulate_lineups.
+        against: The opponent's tally from simulate_lineups.
+        
+    Returns:
+        None
+    """
+    for slot in range(18):
+        player = players[slot]
+        line = slot // 3 if slot < 12 else 4 + (slot - 12) // 2
+        scoreboard.add_stat_id(player, Stats.MINUTES, tally[line])
+        scoreboard.add_stat_id(player, Stats.SHOTS, tally[7 + slot])
+        scoreboard.add_stat_id(player, Stats.GOALS, tally[25 + slot])
+        scoreboard.add_stat_id(player, Stats.ASSISTS, tally[43 + slot])
+    goalie = players[18]
+    scoreboard.add_stat_id(goalie, Stats.MINUTES, tally[64])
+    scoreboard.add_stat_id(goalie, Stats.SAVES, tally[61])
+    scoreboard.add_stat_id(goalie, Stats.GOALS_ALLOWED, tally[62])
+    scoreboard.add_team_stat_id(team, Stats.GOALS_FOR, tally[63])
+    scoreboard.add_team_stat_id(team, Stats.GOALS_AGAINST, against[63])
+    if tally[63] > against[63]:
+        scoreboard.add_team_stat_id(team, Stats.WINS, 1)
+    elif tally[63] < against[63]:
+        scoreboard.add_team_stat_id(team, Stats.LOSSES, 1)
+    else:
+        scoreboard.add_team_stat_id(team, Stats.TIES, 1)
+    
+def play_games_batch(matchups, era = "season", engine = "minute", rng = None):
+    """Play many games at once and update the stats of the teams involved.
+    
+    The lines of each team are read once, the shot probabilities for every
+    combination of lines are computed once per pairing from the teams' cached
+    line strengths (so Monte Carlo replicas of the same matchup share them), 
+    and each game is simulated on integer tallies. The tallies of every game
+    go on one Stats.Scoreboard, which is added to the players' and teams' 
+    stats for the given era once, after the last game.
+    
+    Args:
+        matchups: A list of two-element lists of Teams; a day from a Season's
+            schedule, for example. A team may appear in more than one matchup.
+        era: A string representing the era in which the games take place;
+            expected to be "season" or "playoff".
+        engine: A string for how the games are played; "minute" (default)
+            or "event" (as in Game).
+        rng: A random.Random to draw from; if None, the random module is 
+            used.
+            
+    Returns:
+        A list of two-element tuples with the goals scored by each team in 
+        each game, in the order of matchups.
+    """
+    if rng is None:
+        rng = random
+    scoreboard = Stats.Scoreboard()
+    lineups = {}
+    tables = {}
+    scores = []
+    for team1, team2 in matchups:
+        for team in (team1, team2):
+            if team not in lineups:
+                lineups[team] = get_lineup_players(team)
+        if (team1, team2) not in tables:
+            table1 = get_shot_table(team1, team2)
+            table2 = get_shot_table(team2, team1)
+            event_table = get_event_table(table1, table2) if engine == "event" else None
+            tables[(team1, team2)] = (table1, table2, event_table)
+        table1, table2, event_table = tables[(team1, team2)]
+        if engine == "event":
+            tally1, tally2 = simulate_lineups_events(event_table, era, rng)
+        else:
+            tally1, tally2 = simulate_lineups(table1, table2, era, rng)
+        apply_tally(scoreboard, team1, lineups[team1], tally1, tally2)
+        apply_tally(scoreboard, team2, lineups[team2], tally2, tally1)
+        scores.append((tally1[63], tally2[63]))
+    scoreboard.flush(era)
+    return scores
+    
+set_shot_coefficient(0.05)
+event_outcomes = get_event_outcomes()
@@ -0,0 +1,377 @@
+import array
+import Stats
+
+class History(object):
+    
+    """The History class.
+    
+    This is the class that keeps every season's stat lines once the season
+    is over, so they are not lost when season stats are folded into career
+    stats. It is append-only: a League records a season at its end, and the
+    lines are never changed afterwards.
+    
+    Class Attributes:
+        eras: The list of strings with the eras kept for each line (season
+            and playoff).
+    
+    Attributes:
+        players: A StatsArchive of the players' lines.
+        teams: A StatsArchive of the teams' lines.
+    """
+    
+    __slots__ = ("players", "teams")
+    
+    eras = ["season", "playoff"]
+    
+    def __init__(self):
+        """Inits an empty History.
+        
+        Args:
+            None
+        
+        Returns:
+            None
+        """
+        self.players = StatsArchive(Stats.PlayerStats.stat_names)
+        self.teams = StatsArchive(Stats.TeamStats.stat_names)
+    
+    def record_season(self, year, teams, former = None):
+        """Add the season and playoff lines of the given teams, of the 
+        players on their rosters, and of the given former players.
+        
+        This must be called before the season's stats are zeroed. Players
+        with nothing in the season or playoff are skipped.
+        
+        Args:
+            year: An integer, the year of the season.
+            teams: A list of Teams.
+            former: A dictionary of the form {player: team} with the players
+                no longer on those rosters who may have played in the season,
+                and the Team (or None) to credit each line to.
+        
+        Returns:
+            None
+        """
+        for team in teams:
+            self.teams.add_line(team, year, team, team.stats)
+            for player in team.get_full_roster():
+                self.players.add_line(player, year, team, player.stats)
+        if former is not None:
+            for player, team in former.items():
+                self.players.add_line(player, year, team, player.stats)
+    
+    def get_player_history(self, player):
+        """Get every line of a player.
+        
+        Args:
+            player: A Player.
+        
+        Returns:
+            A list of dictionaries, one per season in order, of the form
+            {"Year": year, "Team": team, "season": {stat: amount},
+            "playoff": {stat: amount}}.
+        """
+        return self.players.get_lines(self.players.get_records(owner = player))
+    
+    def get_team_history(self, team):
+        """Get every line of a team.
+        
+        Args:
+            team: A Team.
+        
+        Returns:
+            A list of dictionaries, one per season in order, as from
+            get_player_history.
+        """
+        return self.teams.get_lines(self.teams.get_records(owner = team))
+    
+    def get_team_players(self, team, year = None):
+        """Get the lines of the players who played for a team.
+        
+        Args:
+            team: A Team.
+            year: An integer, a season to look at, or None for every season.
+        
+        Returns:
+            A list of dictionaries as from get_player_history, each with the
+            Player under the key "Player".
+        """
+        return self.players.get_lines(self.players.get_records(team = team, year = year))
+    
+    def get_season(self, year):
+        """Get the lines of every team and player for a season.
+        
+        Args:
+            year: An integer, the year of the season.
+        
+        Returns:
+            A tuple of two lists of dictionaries as from get_team_players,
+            the teams' lines (with the Team under "Player") and the players'.
+        """
+        return (self.teams.get_lines(self.teams.get_records(year = year)),
+            self.players.get_lines(self.players.get_records(year = year)))
+    
+    def get_stat(self, owner, stat, era = "season"):
+        """Get a player's or team's amount of a stat in every season.
+        
+        Args:
+            owner: A Player or Team.
+            stat: A string for the statistic.
+            era: A string for the era, season or playoff.
+        
+        Returns:
+            A list of (year, amount) tuples, in season order.
+        """
+        archive = self.teams if isinstance(owner.stats, Stats.TeamStats) else self.players
+        return [(archive.get_year(r), archive.get_amount(r, stat, era))
+            for r in archive.get_records(owner = owner)]
+    
+    def get_season_leaders(self, year, stat, era = "season", n = float('inf')):
+        """Get the players with the most of a stat in a season.
+        
+        Args:
+            year: An integer, the year of the season.
+            stat: A string for the statistic.
+            era: A string for the era, season or playoff.
+            n: The number of players to get; float('inf') for all of them.
+        
+        Returns:
+            A list of (Player, amount) tuples from most to least.
+        """
+        archive = self.players
+        ranking = sorted(((archive.get_owner(r), archive.get_amount(r, stat, era))
+            for r in archive.get_records(year = year)),
+            key = lambda x: x[1], reverse = True)
+        if n == float('inf'):
+            return ranking
+        return ranking[:n]
+
+
+class StatsArchive(object):
+    
+    """The StatsArchive class.
+    
+    This is the class that holds the archived lines of players (or teams).
+    Each line is a record in a handful of flat integer arrays; the owners
+    and teams are kept once each and referred to by number.
+    
+    Class Attributes:
+        None
+    
+    Attributes:
+        stats: The list of strings with the stat names, in line order.
+        stat_index: A dictionary of the form {stat: index in stats}.
+        width: The number of amounts in a line (a stat line per era).
+        owners: A list of the owners (Players or Teams) with lines.
+        owner_ids: A dictionary of the form {owner: index in owners}.
+        teams: A list of the Teams the lines were made with (None for a
+            line of a player on no team).
+        team_ids: A dictionary of the form {team: index in teams}.
+        record_owners: An array with the owner number of each record.
+        record_years: An array with the year of each record.
+        record_teams: An array with the team number of each record.
+        values: An array with the amounts of each record; record r's are at
+            r * width thru (r + 1) * width - 1, the season line and then the
+            playoff line.
+        by_owner: A dictionary of the form {owner number: array of records}.
+        by_team: A dictionary of the form {team number: array of records}.
+        by_year: A dictionary of the form {year: array of records}.
+    """
+    
+    __slots__ = ("stats", "stat_index", "width", "owners", "owner_ids", "teams", 
+        "team_ids", "record_owners", "record_years", "record_teams", "values", 
+        "by_owner", "by_team", "by_year")
+    
+    def __init__(self, stats):
+        """Inits an empty StatsArchive.
+        
+        Args:
+            stats: The list of strings with the stat names kept.
+        
+        Returns:
+            None
+        """
+        self.stats = list(stats)
+        self.stat_index = {stat: i for i, stat in enumerate(self.stats)}
+        self.width = len(self.stats) * len(History.eras)
+        self.owners = []
+        self.owner_ids = {}
+        self.teams = []
+        self.team_ids = {}
+        self.record_owners = array.array("i")
+        self.record_years = array.array("i")
+        self.record_teams = array.array("i")
+        self.values = array.array(Stats.StatsStore.typecode)
+        self.by_owner = {}
+        self.by_team = {}
+        self.by_year = {}
+    
+    def add_line(self, owner, year, team, stats):
+        """Add an owner's season and playoff line, unless both are empty.
+        
+        Args:
+            owner: The Player or Team the line belongs to.
+            year: An integer, the year of the season.
+            team: The Team the line was made with.
+            stats: The owner's PlayerStats or TeamStats.
+        
+        Returns:
+            None
+        """
+        store = stats.store
+        start = stats.row * store.width
+        line = array.array(Stats.StatsStore.typecode)
+        for era in History.eras:
+            line.extend(store.columns[Stats.get_era_id(era)][start:start + store.width])
+        if not any(line):
+            return
+        record = len(self.record_owners)
+        owner_id = self.get_id(owner, self.owners, self.owner_ids)
+        team_id = self.get_id(team, self.teams, self.team_ids)
+        self.record_owners.append(owner_id)
+        self.record_years.append(year)
+        self.record_teams.append(team_id)
+        self.values.extend(line)
+        for index, key in ((self.by_owner, owner_id), (self.by_team, team_id), (self.by_year, year)):
+            if key not in index:
+                index[key] = array.array("i")
+            index[key].append(record)
+    
+    def set_records(self, owners, teams, record_owners, record_years, record_teams, values):
+        """Replace every record with the given ones and index them.
+        
+        This is how a saved archive is restored; the arguments are the
+        attributes of the same names.
+        
+        Args:
+            owners: A list of the owners (Players or Teams) with lines.
+            teams: A list of the Teams the lines were made with.
+            record_owners: An array with the owner number of each record.
+            record_years: An array with the year of each record.
+            record_teams: An array with the team number of each record.
+            values: An array with the amounts of each record.
+        
+        Returns:
+            None
+        """
+        self.owners = owners
+        self.owner_ids = {owner: i for i, owner in enumerate(owners)}
+        self.teams = teams
+        self.team_ids = {team: i for i, team in enumerate(teams)}
+        self.record_owners = record_owners
+        self.record_years = record_years
+        self.record_teams = record_teams
+        self.values = values
+        self.by_owner = {}
+        self.by_team = {}
+        self.by_year = {}
+        for record in range(len(record_owners)):
+            for index, key in ((self.by_owner, record_owners[record]),
+                (self.by_team, record_teams[record]), (self.by_year, record_years[record])):
+                if key not in index:
+                    index[key] = array.array("i")
+                index[key].append(record)
+    
+    def get_id(self, item, items, ids):
+        """Get the number of an owner or team, adding it if it is new.
+        
+        Args:
+            item: The owner or team.
+            items: The list it is kept in.
+            ids: The dictionary of the form {item: index in items}.
+        
+        Returns:
+            An integer, the item's number.
+        """
+        item_id = ids.get(item)
+        if item_id is None:
+            item_id = len(items)
+            items.append(item)
+            ids[item] = item_id
+        return item_id
+    
+    def get_records(self, owner = None, team = None, year = None):
+        """Get the records matching every given filter.
+        
+        Args:
+            owner: A Player or Team, or None for any.
+            team: A Team, or None for any.
+            year: An integer year, or None for any.
+        
+        Returns:
+            A list of record numbers, in the order they were added.
+        """
+        candidates = []
+        if owner is not None:
+            candidates.append(self.by_owner.get(self.owner_ids.get(owner), ()))
+        if team is not None:
+            candidates.append(self.by_team.get(self.team_ids.get(team), ()))
+        if year is not None:
+            candidates.append(self.by_year.get(year, ()))
+        if not candidates:
+            return list(range(len(self.record_owners)))
+        records = min(candidates, key = len)
+        return [r for r in records
+            if (owner is None or self.owners[self.record_owners[r]] is owner)
+            and (team is None or self.teams[self.record_teams[r]] is team)
+            and (year is None or self.record_years[r] == year)]
+    
+    def get_owner(self, record):
+        """Get the owner of a record.
+        
+        Args:
+            record: A record number.
+        
+        Returns:
+            The Player or Team.
+        """
+        return self.owners[self.record_owners[record]]
+    
+    def get_year(self, record):
+        """Get the year of a record.
+        
+        Args:
+            record: A record number.
+        
+        Returns:
+            An integer, the year.
+        """
+        return self.record_years[record]
+    
+    def get_amount(self, record, stat, era = "season"):
+        """Get the amount of a stat in a record.
+        
+        Args:
+            record: A record number.
+            stat: A string for the statistic.
+            era: A string for the era, season or playoff.
+        
+        Returns:
+            An integer, the amount.
+        """
+        offset = History.eras.index(era) * len(self.stats) + self.stat_index[stat]
+        return self.values[record * self.width + offset]
+    
+    def get_lines(self, records):
+        """Get the given records as dictionaries.
+        
+        Args:
+            records: A list of record numbers.
+        
+        Returns:
+            A list of dictionaries of the form {"Player": owner, "Year": year,
+            "Team": team, "season": {stat: amount}, "playoff": {stat:
+            amount}}.
+        """
+        n = len(self.stats)
+        lines = []
+        for r in records:
+            start = r * self.width
+            line = {
+                "Player": self.owners[self.record_owners[r]],
+                "Year": self.record_years[r],
+                "Team": self.teams[self.record_teams[r]]}
+            for e, era in enumerate(History.eras):
+                line[era] = dict(zip(self.stats, self.values[start + e * n:start + (e + 1) * n]))
+            lines.append(line)
+        return lines
@@ -1,5 +1,9 @@
-import random
+import random, math, array, bisect, itertools, struct, sys, concurrent.futures
 import Game
+import History
+import LeagueContext
+import Player
+import Stats
 import Team
 
 class League(object):
@@ -14,18 +18,42 @@ class League(object):
         conf_names: The list of strings which are conference names in a leauge
             (American and National).
         div_names: The list of strings which are division names in a conference
-            (North, South, East, West).
+            (North, South, East, West), unless the League is made with others.
+        checkpoint_magic: The bytes every file written by save starts with.
+        checkpoint_version: An integer, the version of the save format.
+        checkpoint_lines: The list of strings with the lines save writes, 
+            in the order it writes them.
         
     Attributes:
-        teams: The list of Teams in the league (we expect exactly 32).
+        teams: The list of Teams in the league, in conference and division 
+            order (32 by default).
         team_align: A dictionary in the form {Conf: {Div: [Teams in the Div]}}
         date: A three-element list of integers representing the current year,
             day, and game (all 0-based).
         season: A Season object representing the current season.
-        playoff: A Playoff object representing the current playoff.        
+        playoff: A Playoff object representing the current playoff.
+        calendar: The Calendar of the current year's games.
+        slot: An integer, the calendar slot of the current date.        
+        seed: The league's root seed; every season's schedule, every game, 
+            and every offseason draws from its own random.Random derived from
+            it, so a league replays exactly given its seed and starting teams.
+        engine: A string for the Game engine the league's games are played
+            with: "lineup" (default), "event", or "minute".
+        executor: The concurrent.futures.ProcessPoolExecutor play_day uses,
+            or None until it is first needed.
+        executor_workers: The number of worker processes in executor.
+        player_stats: The Stats.StatsStore holding the stats of the players
+            on the league's teams.
+        team_stats: The Stats.StatsStore holding the stats of the league's
+            teams.
+        leaders: The Stats.Leaderboards ranking the players in player_stats.
+        standings: The Standings ranking the teams by their season record.
+        history: The History.History of every finished season's stat lines.
+        context: The LeagueContext.LeagueContext the league's players and 
+            teams are registered in, or None if they use the global 
+            registries.
             
     Future:
-        Year over year records saved
         Awards
         Drafts
         Retirement
@@ -35,29 +63,95 @@ class League(object):
         Team Records
         Dates to Match IRL Schedules
         Team Stats in Standings
-        Tiebreakers
-        Malleable Conferences/Divisions
-        Schedules for different sizes of league
+        Malleable Conferences
     """
 
     conf_names = ["American", "National"]
     div_names = ["North", "South", "East", "West"]
+    checkpoint_magic = b"HSIM"
+    checkpoint_version = 2
+    checkpoint_lines = Team.Lines.olines + Team.Lines.dlines + ["G", "Scratch"]
     
-    def __init__(self, teams):
+    def __init__(self, teams, seed = None, engine = "lineup", div_names = None, 
+        context = None):
         """Inits a League class.
         
         Args:
-            teams: A list of 32 Team objects.
+            teams: A list of Team objects, in conference and division order; 
+                each conference has the same number of divisions and each 
+                division the same number of teams.
+            seed: An integer (or string) root seed for the league's random
+                draws; if None, one is chosen at random.
+            engine: A string for the Game engine to play games with; 
+                "lineup" (default), "event", or "minute". Only "lineup" and 
+                "event" games can be played in worker processes.
+            div_names: A list of strings, the division names in each 
+                conference; if None, League.div_names.
+            context: The LeagueContext.LeagueContext the teams were made in,
+                if any.
             
         Returns:
             None
+            
+        Raises:
+            ValueError: the teams do not divide evenly into the divisions, or
+                a conference has fewer than the 8 teams its playoff needs.
         """
+        if div_names is not None:
+            self.div_names = div_names
+        divisions = len(League.conf_names) * len(self.div_names)
+        if len(teams) % divisions or len(teams) // len(League.conf_names) < 8:
+            raise ValueError("%d teams cannot fill %d divisions with 8 teams per conference" % 
+                (len(teams), divisions))
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.context = context
+        self.engine = engine
+        self.executor = None
+        self.executor_workers = 0
         self.teams = teams
+        self.player_stats = Stats.StatsStore(Stats.PlayerStats.stat_names)
+        self.team_stats = Stats.StatsStore(Stats.TeamStats.stat_names)
+        for team in teams:
+            self.team_stats.adopt(team.stats)
+            team.player_store = self.player_stats
+            for player in team.get_full_roster():
+                self.player_stats.adopt(player.stats)
+        self.leaders = Stats.Leaderboards(self.player_stats)
         self.team_align = self.get_team_alignment()
+        self.standings = Standings(self)
+        self.history = History.History()
         self.date = [0, 0, 0] #year, day, game
-        self.season = Season(self.teams)
+        self.season = self.get_season()
+        self.calendar = Calendar(self.season)
+        self.slot = 0
         self.playoff = None        
         
+    def get_rng(self, *keys):
+        """Get the random stream for the given part of the league.
+        
+        Args:
+            keys: The integers and strings naming the stream; for example,
+                "season", year or "game", year, day, game.
+                
+        Returns:
+            A random.Random seeded from the league's seed and the keys. The
+            same keys always give the same stream.
+        """
+        return derive_rng(self.seed, *keys)
+        
+    def get_game_rng(self, date):
+        """Get the random stream for the game on the given date.
+        
+        Args:
+            date: A list of three integers representing a year, day, and game.
+            
+        Returns:
+            A random.Random for the game on that date.
+        """
+        return self.get_rng("game", date[0], date[1], date[2])
+        
     def get_team_alignment(self):
         """Take the list of teams and get the dictionary of conferences and
         divisions.
@@ -68,93 +162,64 @@ class League(object):
         Returns:
             A list of teams in their divisions in their conferences.
         """
-        team_align = {
-            "American": {
-                "North": self.teams[:4], 
-                "South": self.teams[4:8],
-                "East": self.teams[8:12],
-                "West": self.teams[12:16] },
-            "National": {
-                "North": self.teams[16:20],
-                "South": self.teams[20:24],
-                "East": self.teams[24:28],
-                "West": self.teams[28:] }
-                }
+        size = len(self.teams) // (len(League.conf_names) * len(self.div_names))
+        team_align = {}
+        i = 0
+        for conf in League.conf_names:
+            team_align[conf] = {}
+            for div in self.div_names:
+                team_align[conf][div] = self.teams[i:i + size]
+                i += size
         return team_align
         
+    def get_season(self):
+        """Get the regular season for the current year.
+        
+        Args:
+            None
+            
+        Returns:
+            A Season of the league's teams.
+        """
+        return Season(self.teams, self.get_rng("season", self.date[0]), 
+            len(League.conf_names), len(self.div_names))
+        
     def start_new_season(self):
-        """Get a new regular season.
+        """Get a new regular season and its calendar.
         
         Args:
             None
         Returns:
             None
         """
-        self.season = Season(self.teams)
+        self.season = self.get_season()
+        self.calendar = Calendar(self.season)
+        self.slot = 0
     
-    def advance_date(self):
-        """Move the date one game forward.
+    def advance_date(self, games = 1):
+        """Move the date the given number of games forward.
         
-        We assume 16 games per regular season day (day < 80). We assume 8 games
-        per playoff rd 1 day (day < 88), 4 per playoff rd 2 day (day < 96), 2
-        per playoff rd 3 day (day < 104), and 1 per playoff rd 4 day 
-        (day < 112).
+        The date follows the calendar's slots. Whenever it reaches a slot
+        with hooks (the start of the playoffs, the starts of later rounds, 
+        and the end of the year), they are run in order; the slots in 
+        between are passed over at once. The date never moves past the end 
+        of the year.
         
         Args:
-            None
+            games: The number of games to move forward.
             
         Returns:
             None
         """
-        d = self.date
-        if d[1] < 80:
-            if d[2] < 15:
-                d[2] += 1
-            else:
-                d[2] = 0
-                d[1] += 1
-                if d[1] == 80:
-                    #print("start playoff rd 1")
-                    self.start_playoffs()
-        elif d[1] < 87:
-            if d[2] < 7:
-                d[2] += 1
-            else:
-                d[2] = 0
-                d[1] += 1
-                if d[1] > 83:
-                    self.update_playoffs()
-                if d[1] == 87:
-                    #print("start playoff rd 2")
-                    self.start_next_playoff_round()
-        elif d[1] < 94:
-            if d[2] < 3:
-                d[2] += 1
-            else:
-                d[2] = 0
-                d[1] += 1
-                if d[1] > 90:
-                    self.update_playoffs()
-                if d[1] == 94:
-                    #print("start playoff rd 3")
-                    self.start_next_playoff_round()
-        elif d[1] < 101:
-            if d[2] == 0:
-                d[2] += 1
-            else:
-                d[2] = 0
-                d[1] += 1
-                if d[1] > 97:
-                    self.update_playoffs()
-                if d[1] == 101:
-                    #print("start playoff rd 4")
-                    self.start_next_playoff_round()
-        elif d[1] < 108:
-            d[1] += 1
-            if d[1] > 104:
-                self.update_playoffs()
-            if d[1] == 108:
-                self.end_season()
+        target = self.slot + games
+        year = self.date[0]
+        while self.slot < target:
+            self.slot = min(target, self.calendar.get_next_hook(self.slot))
+            self.date[1], self.date[2] = self.calendar.get_date(self.slot)
+            for hook in self.calendar.hooks.get(self.slot, ()):
+                getattr(self, hook)()
+            if self.date[0] != year:
+                return
         
     def get_next_game(self):
         """Get a list of two teams to play in the next game.
@@ -165,7 +230,7 @@ class League(object):
         Returns:
             A list of two teams that are scheduled to play next.
         """
-        if self.date[1] < 80:
+        if self.date[1] < self.season.days:
             return self.season.get_next_game(self.date)
         else:
             return self.playoff.get_next_game(self.date)
@@ -179,15 +244,477 @@ class League(object):
         Returns:
             None
         """
-        matchup = self.get_next_game()
+        matchup, era = self.get_scheduled_game(self.date)
         if matchup != [None, None]:
-            if self.date[1] < 80:
-                g = Game.Game(matchup[0], matchup[1])
-            else:
-                g = Game.Game(matchup[0], matchup[1], era = "playoff")
-            g.play_game()
+            rng = self.get_game_rng(self.date)
+            g = Game.Game(matchup[0], matchup[1], era, self.engine, rng)
+            g.simulate_game()
+            if era == "playoff":
+                self.playoff.add_result(g.get_winner())
+            g.update_stats()
         self.advance_date()
         
+    def get_scheduled_game(self, date):
+        """Get the matchup and era of the game on the given date.
+        
+        Args:
+            date: A list of three integers representing a year, day, and game
+                of the current season.
+                
+        Returns:
+            A tuple of a list of two Teams (or [None, None] if the game is
+            not necessary) and a string for the era, "season" or "playoff".
+        """
+        if date[1] < self.season.days:
+            return (self.season.get_next_game(date), "season")
+        else:
+            return (self.playoff.get_next_game(date), "playoff")
+            
+    def get_day_length(self):
+        """Get the number of games scheduled on the current day.
+        
+        Args:
+            None
+            
+        Returns:
+            An integer, the number of games (including unnecessary playoff 
+            games) on the current day.
+        """
+        return self.calendar.get_day_length(self.date[1])
+            
+    def play_day(self, workers = None):
+        """Simulate the rest of the current day's games and advance the date.
+        
+        The games on a day involve different teams, so they can be played at
+        the same time. With more than one worker, they are played in a pool
+        of worker processes from just their shot tables (Game.simulate_tables)
+        and the tallies are added to the stats here before the date moves on.
+        Each game draws from its own stream (get_game_rng), so the results 
+        are the same for any number of workers, and the same as playing the
+        games one at a time with play_next_game.
+        
+        Args:
+            workers: The number of worker processes to use; if None or 1, the
+                games are played in this process.
+                
+        Returns:
+            None
+        """
+        if self.engine not in ("lineup", "event"):
+            for i in range(self.get_day_length() - self.date[2]):
+                self.play_next_game()
+            return
+        year, day, first = self.date
+        era = "season" if day < self.season.days else "playoff"
+        matchups = []
+        tasks = []
+        for game in range(first, self.get_day_length()):
+            matchup = self.get_scheduled_game([year, day, game])[0]
+            if matchup != [None, None]:
+                table1 = Game.get_shot_table(matchup[0], matchup[1])
+                table2 = Game.get_shot_table(matchup[1], matchup[0])
+                matchups.append(matchup)
+                tasks.append((table1, table2, era, self.engine, self.seed, (year, day, game)))
+        if workers is not None and workers > 1 and len(tasks) > 1:
+            chunksize = -(-len(tasks) // workers)
+            tallies = list(self.get_executor(workers).map(simulate_scheduled_game, tasks, chunksize = chunksize))
+        else:
+            tallies = [simulate_scheduled_game(task) for task in tasks]
+        scoreboard = Stats.Scoreboard()
+        for matchup, (tally1, tally2) in zip(matchups, tallies):
+            team1, team2 = matchup
+            Game.apply_tally(scoreboard, team1, Game.get_lineup_players(team1), tally1, tally2)
+            Game.apply_tally(scoreboard, team2, Game.get_lineup_players(team2), tally2, tally1)
+            if era == "playoff":
+                self.playoff.add_result(team1 if tally1[63] > tally2[63] else team2)
+        scoreboard.flush(era)
+        self.advance_date(self.get_day_length() - first)
+            
+    def get_executor(self, workers):
+        """Get the pool of worker processes for play_day.
+        
+        The pool is kept between days; a new one is made if the number of
+        workers changes.
+        
+        Args:
+            workers: The number of worker processes.
+            
+        Returns:
+            A concurrent.futures.ProcessPoolExecutor with that many workers.
+        """
+        if self.executor is None or self.executor_workers != workers:
+            self.close()
+            self.executor = concurrent.futures.ProcessPoolExecutor(max_workers = workers)
+            self.executor_workers = workers
+        return self.executor
+        
+    def close(self):
+        """Shut down the league's worker processes, if there are any.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+            self.executor_workers = 0
+        
+    def save(self, path):
+        """Write the league's whole state to a checkpoint file.
+        
+        The file is binary (see write_array and write_strings): the players'
+        and teams' attributes, rosters and lines, the stats stores, and the
+        history are written as flat arrays of numbers, with players and teams
+        referred to by their index, rather than as an object graph. With the
+        seed, date, schedule order and playoff series, this is everything 
+        League.load needs to carry on exactly where the league left off.
+        
+        Args:
+            path: The path of the file to write.
+            
+        Returns:
+            None
+        """
+        players = [p for team in self.teams for p in team.get_full_roster()]
+        player_ids = {p: i for i, p in enumerate(players)}
+        for p in itertools.chain(self.history.players.owners, self.player_stats.owners):
+            if p is not None and p not in player_ids:
+                player_ids[p] = len(players)
+                players.append(p)
+        team_ids = {team: i for i, team in enumerate(self.teams)}
+        rosters = array.array("i")
+        lines = array.array("i")
+        for team in self.teams:
+            for pos in Team.Roster.positions:
+                add_group(rosters, team.roster.roster[pos], player_ids)
+            for line in League.checkpoint_lines:
+                add_group(lines, team.get_line(line), player_ids)
+            add_group(lines, team.released, player_ids)
+        playoff = array.array("i")
+        if self.playoff is not None:
+            playoff.extend([self.playoff.round, self.playoff.start])
+            add_group(playoff, self.playoff.am_teams, team_ids)
+            add_group(playoff, self.playoff.na_teams, team_ids)
+            for s in self.playoff.series:
+                playoff.extend([team_ids[s.team1], team_ids[s.team2], s.wins1, s.wins2, 
+                    -1 if s.winner is None else team_ids[s.winner]])
+        with open(path, "wb") as f:
+            f.write(League.checkpoint_magic + struct.pack("<H", League.checkpoint_version))
+            write_strings(f, [type(self.seed).__name__, str(self.seed), self.engine])
+            write_strings(f, self.div_names)
+            write_strings(f, [team.name for team in self.teams])
+            write_strings(f, [p.name for p in players])
+            write_strings(f, [p.position for p in players])
+            write_array(f, array.array("i", (p.age for p in players)))
+            write_array(f, array.array("i", (p.rating for p in players)))
+            write_array(f, array.array("i", (team_ids.get(p.team, -1) for p in players)))
+            for owners, store in ((players, self.player_stats), (self.teams, self.team_stats)):
+                write_array(f, array.array("i", 
+                    (o.stats.row if o.stats.store is store else -1 for o in owners)))
+                for column in store.columns:
+                    write_array(f, column)
+                write_array(f, array.array("i", store.free))
+            write_array(f, rosters)
+            write_array(f, lines)
+            for archive, ids in ((self.history.players, player_ids), (self.history.teams, team_ids)):
+                write_array(f, array.array("i", (ids[o] for o in archive.owners)))
+                write_array(f, array.array("i", (team_ids.get(t, -1) for t in archive.teams)))
+                for values in (archive.record_owners, archive.record_years, 
+                    archive.record_teams, archive.values):
+                    write_array(f, values)
+            write_array(f, array.array("i", self.date + [self.slot]))
+            write_array(f, self.season.day_order)
+            write_array(f, playoff)
+            context = self.context
+            if context is None:
+                write_array(f, array.array("i"))
+                write_strings(f, [])
+                write_strings(f, [])
+                write_array(f, array.array("i"))
+            else:
+                write_array(f, array.array("i", [context.team_name_round]))
+                write_strings(f, context.team_names)
+                write_strings(f, list(context.player_name_counts))
+                write_array(f, array.array("i", context.player_name_counts.values()))
+        
+    @classmethod
+    def load(cls, path):
+        """Make a league from a checkpoint file written by save.
+        
+        The players and teams are made in a new LeagueContext.LeagueContext
+        (so the names cannot clash with those already in memory), with the 
+        name pool and counters the saved league's context had. The season's 
+        calendar, the standings, and the leaderboards are rebuilt from the 
+        loaded state rather than read. Players in the history but on no 
+        roster keep their stats in the league's store, as they were saved; 
+        rows of players that were not saved are freed.
+        
+        Args:
+            path: The path of the file to read.
+            
+        Returns:
+            The loaded League, at the date it was saved on.
+            
+        Raises:
+            ValueError: the file is not a checkpoint this version can read.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(League.checkpoint_magic)) != League.checkpoint_magic:
+                raise ValueError("%s is not a league checkpoint" % path)
+            version = struct.unpack("<H", f.read(2))[0]
+            if version != League.checkpoint_version:
+                raise ValueError("Cannot read checkpoint version %d" % version)
+            seed_type, seed, engine = read_strings(f)
+            div_names = read_strings(f)
+            team_names = read_strings(f)
+            names = read_strings(f)
+            positions = read_strings(f)
+            ages = read_array(f)
+            ratings = read_array(f)
+            player_teams = read_array(f)
+            stores = []
+            for i in range(2):
+                rows = read_array(f)
+                columns = [read_array(f) for era in Stats.StatsStore.eras]
+                stores.append((rows, columns, read_array(f)))
+            rosters = iter(read_array(f))
+            lines = iter(read_array(f))
+            archives = [[read_array(f) for i in range(6)] for archive in range(2)]
+            date = read_array(f)
+            day_order = read_array(f)
+            playoff = read_array(f)
+            name_round = read_array(f)
+            team_name_pool = read_strings(f)
+            count_names = read_strings(f)
+            counts = read_array(f)
+        context = LeagueContext.LeagueContext()
+        Stats.PlayerStats.default_store.reserve(len(names))
+        players = [Player.Player(names[i], ages[i], positions[i], ratings[i], context = context)
+            for i in range(len(names))]
+        teams = [Team.Team(name, context) for name in team_names]
+        for p, t in zip(players, player_teams):
+            if t >= 0:
+                p.team = teams[t]
+        for team in teams:
+            for pos in Team.Roster.positions:
+                team.roster.roster[pos] = read_group(rosters, players)
+            for line in League.checkpoint_lines:
+                team.roster.lines.lines[line] = read_group(lines, players)
+            team.roster.invalidate_strengths()
+            team.released = read_group(lines, players)
+        league = cls(teams, int(seed) if seed_type == "int" else seed, engine, div_names, context)
+        for owners, store, (rows, columns, free) in zip((players, teams), 
+            (league.player_stats, league.team_stats), stores):
+            store.columns = columns
+            store.owners = [None] * (len(columns[0]) // store.width)
+            store.free = list(free)
+            store.all_dirty = True
+            for owner, row in zip(owners, rows):
+                if row >= 0:
+                    if owner.stats.store is not store:
+                        owner.stats.store.release_row(owner.stats.row)
+                        owner.stats.store = store
+                    owner.stats.row = row
+                    store.owners[row] = owner
+            free = set(free)
+            for row, owner in enumerate(store.owners):
+                if owner is None and row not in free:
+                    store.release_row(row)
+        for archive, owners, (owner_ids, team_ids, *records) in zip(
+            (league.history.players, league.history.teams), (players, teams), archives):
+            archive.set_records([owners[i] for i in owner_ids], [None if i < 0 else teams[i] for i in team_ids], *records)
+        league.date = list(date[:3])
+        league.slot = date[3]
+        league.season = league.get_season()
+        league.season.day_order = day_order
+        league.calendar = Calendar(league.season)
+        if playoff:
+            values = iter(playoff)
+            round, start = next(values), next(values)
+            am_teams = read_group(values, teams)
+            na_teams = read_group(values, teams)
+            series = []
+            for team1, team2, wins1, wins2, winner in zip(*[values] * 5):
+                s = Series(teams[team1], teams[team2])
+                s.wins1 = wins1
+                s.wins2 = wins2
+                s.winner = None if winner < 0 else teams[winner]
+                series.append(s)
+            league.playoff = Playoff(am_teams, na_teams, start, round, series)
+        if name_round:
+            context.team_name_round = name_round[0]
+            context.team_names = team_name_pool
+            context.player_name_counts = dict(zip(count_names, counts))
+        else:
+            used = set(team_names)
+            context.team_names = [name for name in context.team_names if name not in used]
+        league.standings.rebuild()
+        return league
+        
+    def replay_game(self, date):
+        """Replay the game on the given date of the current season.
+        
+        The game is played again from its own random stream, without 
+        touching any stats; as long as the teams' lines have not changed 
+        since, it is the same game.
+        
+        Args:
+            date: A list of three integers representing the year, day, and
+                game of a game already played this season.
+                
+        Returns:
+            The replayed Game, with its stats on its scoreboard, or None if 
+            there was no game on that date.
+        """
+        matchup, era = self.get_scheduled_game(date)
+        if matchup == [None, None]:
+            return None
+        g = Game.Game(matchup[0], matchup[1], era, self.engine, self.get_game_rng(date))
+        g.simulate_game()
+        return g
+        
+    def project(self, n_replicas, workers = None):
+        """Project the rest of the season and the playoffs from the current
+        date.
+        
+        Each replica plays the rest of the regular season schedule and the 
+        playoff bracket (with the same seeding rules as get_playoff_teams) 
+        from the current standings and, during the playoffs, the current 
+        series scores. A regular season game's final goal margin is drawn 
+        from its exact distribution (Game.get_final_margin_distribution), 
+        so teams are ranked by points, wins, and goal differential as in 
+        the Standings, and a playoff game's winner from its exact 
+        probability; these are worked out once per pairing, so a replica 
+        costs one draw per game. No stats are touched. Replica r draws from the 
+        stream get_rng("project", year, day, game, r), so the projection is
+        the same for any number of workers.
+        
+        Args:
+            n_replicas: The number of times to play out the rest of the year.
+            workers: The number of worker processes to split the replicas 
+                among (see play_day); if None or 1, they are played here.
+                
+        Returns:
+            A dictionary of the form {team: {"Wins": {wins: probability},
+            "Points": {points: probability}, "Seed": {seed: probability}, 
+            "Rounds": [probabilities]}}, where 
+            seed is 1 thru 8 within the conference or None for missing the
+            playoffs, and Rounds holds the probabilities of reaching playoff
+            rounds 1 thru 4 and of winning the final.
+        """
+        state = self.get_projection_state()
+        if workers is not None and workers > 1 and n_replicas > 1:
+            step = -(-n_replicas // workers)
+            tasks = [(state, first, min(first + step, n_replicas)) 
+                for first in range(0, n_replicas, step)]
+            counts = list(self.get_executor(workers).map(project_replicas, tasks))
+        else:
+            counts = [project_replicas((state, 0, n_replicas))]
+        projection = {}
+        for i, team in enumerate(self.teams):
+            wins = {}
+            points = {}
+            seeds = {}
+            rounds = [0] * 5
+            for win_counts, point_counts, seed_counts, round_counts in counts:
+                for w, n in win_counts[i].items():
+                    wins[w] = wins.get(w, 0) + n
+                for p, n in point_counts[i].items():
+                    points[p] = points.get(p, 0) + n
+                for seed, n in seed_counts[i].items():
+                    seeds[seed] = seeds.get(seed, 0) + n
+                for r in range(5):
+                    rounds[r] += round_counts[i][r]
+            projection[team] = {
+                "Wins": {w: n / n_replicas for w, n in sorted(wins.items())},
+                "Points": {p: n / n_replicas for p, n in sorted(points.items())},
+                "Seed": {seed: n / n_replicas for seed, n in seeds.items()},
+                "Rounds": [n / n_replicas for n in rounds]}
+        return projection
+        
+    def get_projection_state(self):
+        """Get the current state of the year as plain data for project.
+        
+        Teams are referred to by their index in self.teams.
+        
+        Args:
+            None
+            
+        Returns:
+            A dictionary with the keys:
+                seed, date: The league's seed and a copy of the date.
+                align: A list (per conference) of lists (per division) of 
+                    team indices.
+                wins, ties, differentials: Lists of each team's regular 
+                    season wins, ties, and goal differential so far.
+                remaining: A list of (index, index) regular season games yet
+                    to be played.
+                season_margins: A dictionary {(i, j): cumulative 
+                    probabilities} of the final margin of team i over team j
+                    (entry k is the chance of a margin of k - 60 or less).
+                playoff_probs: A list of lists; [i][j] is the probability that
+                    team i beats team j in a playoff game.
+                playoff: None during the regular season, otherwise a tuple of
+                    the round, the American and National team indices still 
+                    in (in seed order), the current round's series as 
+                    (i, j, wins of i, wins of j), and a list of the round each
+                    team has reached so far (0 for none).
+        """
+        index = {team: i for i, team in enumerate(self.teams)}
+        n = len(self.teams)
+        rates = [[0.0] * n for i in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                rates[i][j], rates[j][i] = Game.get_goal_rates(self.teams[i], self.teams[j])
+        playoff_probs = [[0.0] * n for i in range(n)]
+        season_margins = {}
+        for i in range(n):
+            for j in range(i + 1, n):
+                margin = Game.get_margin_distribution(rates[i][j], rates[j][i])
+                season_margins[(i, j)] = margin
+                win = Game.get_result_probabilities(rates[i][j], rates[j][i], "playoff", margin)[0]
+                playoff_probs[i][j] = win
+                playoff_probs[j][i] = 1 - win
+        year, day, first = self.date
+        remaining = []
+        if day < self.season.days:
+            for d in range(day, self.season.days):
+                for matchup in self.season.get_day(d)[first if d == day else 0:]:
+                    remaining.append((index[matchup[0]], index[matchup[1]]))
+        final_margins = {}
+        for i, j in set(remaining):
+            if i < j:
+                final = Game.get_final_margin_distribution(rates[i][j], rates[j][i], 
+                    "season", season_margins[(i, j)])
+            else:
+                final = Game.get_final_margin_distribution(rates[j][i], rates[i][j], 
+                    "season", season_margins[(j, i)])[::-1]
+            final_margins[(i, j)] = list(itertools.accumulate(final))
+        playoff = None
+        if day >= self.season.days:
+            series = [(index[s.team1], index[s.team2], s.wins1, s.wins2) 
+                for s in self.playoff.series if s.winner is None]
+            reached = [0] * n
+            for team in self.get_playoff_teams("American") + self.get_playoff_teams("National"):
+                reached[index[team]] = team.get_stat("playoff", "Wins") // 4 + 1
+            playoff = (self.playoff.round, 
+                [index[team] for team in self.playoff.am_teams],
+                [index[team] for team in self.playoff.na_teams], 
+                series, reached)
+        align = [[[index[team] for team in self.team_align[conf][div]] 
+            for div in self.div_names] for conf in League.conf_names]
+        return {
+            "seed": self.seed, "date": list(self.date), "align": align,
+            "wins": [team.get_stat("season", "Wins") for team in self.teams],
+            "ties": [team.get_stat("season", "Ties") for team in self.teams],
+            "differentials": [team.get_stat("season", "Goals For") - 
+                team.get_stat("season", "Goals Against") for team in self.teams],
+            "remaining": remaining, "season_margins": final_margins,
+            "playoff_probs": playoff_probs, "playoff": playoff}
+        
     def compare_dates(self, date1, date2):
         """Get the boolean if date1 is larger than date2.
         
@@ -216,24 +743,60 @@ class League(object):
                 else:
                     return None
         
-    def simulate_to_day(self, enddate):
+    def simulate_to_day(self, enddate, workers = None):
         """Simulate games and offseason until enddate.
         
         Args:
             enddate: A list of three integers representing the year, day, and
                 game to simulate until.
+            workers: The number of worker processes to play whole days with
+                (see play_day); if None, games are played one at a time.
         
         Returns:
             None
         """
-        while self.compare_dates(enddate, self.date):
-            self.play_next_game()
+        while self.date[0] < enddate[0]:
+            self.simulate_to_slot(len(self.calendar.days), workers)
+        if self.date[0] == enddate[0]:
+            self.simulate_to_slot(self.calendar.get_slot(enddate[1], enddate[2]), workers)
+            
+    def simulate_to_slot(self, slot, workers = None):
+        """Simulate games until the given slot of this year's calendar.
+        
+        Runs of unnecessary playoff games are passed over together, up to the
+        next calendar hook.
+        
+        Args:
+            slot: An integer, the calendar slot to stop at; the number of 
+                slots finishes the year.
+            workers: The number of worker processes to play whole days with
+                (see play_day); if None, games are played one at a time.
+                
+        Returns:
+            None
+        """
+        year = self.date[0]
+        while self.date[0] == year and self.slot < slot:
+            if workers is not None and self.calendar.starts[self.date[1] + 1] <= slot:
+                self.play_day(workers)
+                continue
+            end = min(slot, self.calendar.get_next_hook(self.slot))
+            skip = 0
+            while (self.slot + skip < end and self.get_scheduled_game(
+                [year] + list(self.calendar.get_date(self.slot + skip)))[0] == [None, None]):
+                skip += 1
+            if skip:
+                self.advance_date(skip)
+            else:
+                self.play_next_game()
             
     def get_playoff_teams(self, conf):
         """For the given conference, get the ordered list of playoff teams.
         
-        We take the division winners as the top four seeds, then the next four
-        teams from the conference. There is no tie breaker.
+        We take the division winners as the top seeds (the best eight, if 
+        there are more), then the next teams from the conference up to eight.
+        Teams are ranked as in the Standings: by points, then wins, then goal
+        differential.
         
         Args:
             conf: The conference to get playoff teams for.
@@ -241,15 +804,10 @@ class League(object):
         Returns:
             A list of Teams in their playoff seed rankings,
         """
-        div_winners = []
-        non_div_winners = []
-        for div in League.div_names:
-            r = self.order_teams_by_record(self.team_align[conf][div])
-            div_winners.append(r.pop(0))
-            non_div_winners += r
-        seeds = self.order_teams_by_record(div_winners)
-        wildcard_rank = self.order_teams_by_record(non_div_winners)
-        seeds += wildcard_rank[:4]
+        div_winners = [self.standings.get_ranking(conf, div)[0] for div in self.div_names]
+        seeds = self.order_teams_by_record(div_winners)[:8]
+        wildcards = [team for team in self.standings.get_ranking(conf) if team not in div_winners]
+        seeds += wildcards[:8 - len(seeds)]
         return seeds
         
     def start_playoffs(self):
@@ -265,21 +823,7 @@ class League(object):
         """
         am_teams = self.get_playoff_teams("American")
         na_teams = self.get_playoff_teams("National")
-        self.playoff = Playoff(am_teams, na_teams)
-        
-    def update_playoffs(self):
-        """Determine if any of the scheduled playoff games for this round are
-        now unnecessary.
-        
-        Any unnecessary games remain on the schedule but as [None, None].
-        
-        Args:
-            None
-        
-        Returns:
-            None
-        """
-        self.playoff.update_playoffs(self.date)
+        self.playoff = Playoff(am_teams, na_teams, self.season.days)
         
     def start_next_playoff_round(self):
         """Start the next playoff round.
@@ -293,21 +837,18 @@ class League(object):
         self.playoff.get_next_round()
         
     def order_teams_by_record(self, teams):
-        #TODO: v2 - order by points
         """Take a list of Teams and order them by their regular season record.
         
-        Specifically, we order them by number of regular season wins.
+        Specifically, we order them by points (two for a win, one for a tie),
+        then wins, then goal differential, as in the Standings.
         
         Args:
             teams: A list of Teams
             
         Returns:
-            The list of Teams sorted by number of regular season wins.
+            The list of Teams sorted by regular season record.
         """
-        ranking = sorted(teams, 
-                        key = lambda x: x.get_stat("season", "Wins"), 
-                        reverse = True)
-        return ranking
+        return sorted(teams, key = self.standings.get_key)
         
     def show_standings(self):
         """Get a printable string of the standings for the league.
@@ -317,48 +858,58 @@ class League(object):
         
         Returns:
             A printable string of the standings for every team in the league
-            in order of Wins, sorted by conference and division.
+            in order of points, sorted by conference and division.
         """
         s = ""
         for conf in League.conf_names:
             s += conf + "\n"
-            for div in League.div_names:
+            for div in self.div_names:
                 s += div + "\n"
-                div_rank = self.order_teams_by_record(self.team_align[conf][div])
-                for team in div_rank:
+                for team in self.standings.get_ranking(conf, div):
                     s += team.name.ljust(14) 
                     s += str(team.get_stat("season", "Wins"))
                     s += "-"
                     s += str(team.get_stat("season", "Losses"))
                     s += "-"
                     s += str(team.get_stat("season", "Ties"))
+                    s += str(-self.standings.get_key(team)[0]).rjust(5)
                     s += "\n"
                 s += "\n"
         return s
         
-    def get_league_leaders(self, era, stat):
-        """Get a list of the Players on a team in order from most to least of 
-        the given stat for the given era.
+    def get_league_leaders(self, era, stat, n = float('inf')):
+        """Get a list of the Players in the league in order from most to least
+        of the given stat for the given era.
         
-        Note that we do not filter out skaters for goalie stats.
+        Only players on one of the league's teams are listed, not those who
+        have been removed from their team. Note that we do not filter out 
+        skaters for goalie stats. The rankings are kept up to date as stats 
+        change (see Stats.Leaderboards), so this does not sort the league; 
+        players with the same amount stay in the order they joined the league.
         
         Args:
             era: A string for the era to get statistics for:
                 game, season, playoff, career
             stat: The statistic to get the leaders for:
                 v1: Goals, Assists, Minutes, Shots, Saves, and Goals Allowed
+            n: The number of players to get; float('inf') for all of them.
                 
         Returns:
             A list of Players in order from most to least of the given stat for
             the given era.
         """
-        players = []
-        for team in self.teams:
-            players += team.get_full_roster()
-        ranking = sorted(players, 
-                        key = lambda x: x.get_stat(era, stat), 
-                        reverse = True)
-        return ranking
+        return self.leaders.get_leaders(era, stat, n, self.is_rostered)
+        
+    def is_rostered(self, player):
+        """Check whether a player is on one of the league's teams.
+        
+        Args:
+            player: A Player.
+            
+        Returns:
+            True if the player's team is in the league.
+        """
+        return player.team is not None and player.team.player_store is self.player_stats
         
     def show_league_leaders(self, era, stat, n):
         """Get a printable string showing the top n players for the given
@@ -379,11 +930,7 @@ class League(object):
             A printable string showing the n leaders' name, team, and amount of
             the given stat.
         """
-        ranking = self.get_league_leaders(era, stat)
-        if n == float('inf'):
-            leaders = ranking
-        else:
-            leaders = ranking[:n]
+        leaders = self.get_league_leaders(era, stat, n)
         s = "Player".ljust(25)
         s += "Team".rjust(14)
         s += stat.rjust(8)
@@ -399,11 +946,29 @@ class League(object):
         #TODO: v2
         pass
         
+    def get_former_players(self):
+        """Get the players with stats in the league who are on none of its
+        rosters, with the team each played for last.
+        
+        That is the team a player was last released by this season, or else
+        the player's current team (None for a free agent).
+        
+        Args:
+            None
+            
+        Returns:
+            A dictionary of the form {player: team}, in stats store order.
+        """
+        rostered = set(p for team in self.teams for p in team.get_full_roster())
+        released = {p: team for team in self.teams for p in team.released}
+        return {p: released.get(p, p.team) for p in self.player_stats.owners 
+            if p is not None and p not in rostered}
+        
     def end_season(self):
         """Perform end of season tasks.
         
-        For v1, there is no awards/offseason. So we only age year and start a
-        new season.
+        For v1, there is no awards/offseason. So we only record the season in
+        the history, age year, and start a new season.
         
         Args:
             None
@@ -412,8 +977,15 @@ class League(object):
             None
         """
         self.playoff.end_playoff()
+        self.history.record_season(self.date[0], self.teams, self.get_former_players())
+        for team in self.teams:
+            team.released = []
+        rng = self.get_rng("offseason", self.date[0])
+        for store in (self.player_stats, self.team_stats):
+            store.update_era("season", "career")
+            store.zero_era("playoff")
         for team in self.teams:
-            team.age_year()
+            team.age_year(rng, stats = False)
         self.date[0] += 1
         self.date[1] = 0
         self.date[2] = 0
@@ -422,6 +994,264 @@ class League(object):
         self.start_new_season()
         
 
+class Standings(object):
+    
+    """The Standings class.
+    
+    This is the class that ranks a league's teams by their regular season
+    record: by points (two for a win, one for a tie), then wins, then goal 
+    differential, then the league's team order. The rankings of the league,
+    each conference, and each division are kept sorted; before each read, 
+    only the teams whose stats changed since the last read are moved.
+    
+    Class Attributes:
+        None
+        
+    Attributes:
+        store: The Stats.StatsStore holding the teams' stats.
+        order: A dictionary of the form {team: index in the league's teams}.
+        groups: A dictionary of the form {group: sorted list of keys}, where
+            a group is None (the league), a conference name, or a tuple of a
+            conference and division name.
+        team_groups: A dictionary of the form {team: list of its groups}.
+        keys: A dictionary of the form {team: its current key}.
+    """
+    
+    def __init__(self, league):
+        """Inits a Standings class.
+        
+        Args:
+            league: The League whose teams are ranked.
+            
+        Returns:
+            None
+        """
+        self.store = league.team_stats
+        self.order = {team: i for i, team in enumerate(league.teams)}
+        self.team_groups = {}
+        for conf in League.conf_names:
+            for div in league.div_names:
+                for team in league.team_align[conf][div]:
+                    self.team_groups[team] = [None, conf, (conf, div)]
+        self.rebuild()
+        
+    def rebuild(self):
+        """Rank every team afresh.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.store.take_dirty()
+        self.keys = {team: self.get_current_key(team) for team in self.order}
+        self.groups = {}
+        for team, groups in self.team_groups.items():
+            for group in groups:
+                self.groups.setdefault(group, []).append(self.keys[team])
+        for keys in self.groups.values():
+            keys.sort()
+            
+    def get_current_key(self, team):
+        """Get the sort key of a team from its stats.
+        
+        Args:
+            team: A Team in the league.
+            
+        Returns:
+            A tuple of negated points, wins, and goal differential, then the
+            team's index and the team; sorting keys puts the best team first.
+        """
+        stats = team.stats
+        wins = stats.get_stat_id(Stats.SEASON, Stats.WINS)
+        ties = stats.get_stat_id(Stats.SEASON, Stats.TIES)
+        differential = (stats.get_stat_id(Stats.SEASON, Stats.GOALS_FOR) - 
+            stats.get_stat_id(Stats.SEASON, Stats.GOALS_AGAINST))
+        return (-(2 * wins + ties), -wins, -differential, self.order[team], team)
+        
+    def refresh(self):
+        """Move the teams whose stats changed to their current places.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        rows, all_dirty = self.store.take_dirty()
+        if all_dirty:
+            self.rebuild()
+            return
+        owners = self.store.owners
+        for row in rows:
+            team = owners[row]
+            if team not in self.keys:
+                continue
+            old = self.keys[team]
+            new = self.get_current_key(team)
+            if new == old:
+                continue
+            self.keys[team] = new
+            for group in self.team_groups[team]:
+                keys = self.groups[group]
+                del keys[bisect.bisect_left(keys, old)]
+                bisect.insort(keys, new)
+                
+    def get_key(self, team):
+        """Get the current sort key of a team (see get_current_key).
+        
+        Args:
+            team: A Team in the league.
+            
+        Returns:
+            The team's key.
+        """
+        self.refresh()
+        return self.keys[team]
+        
+    def get_ranking(self, conf = None, div = None):
+        """Get the teams of the league, a conference, or a division in order.
+        
+        Args:
+            conf: A conference name, or None for the whole league.
+            div: A division name in conf, or None for the whole conference.
+            
+        Returns:
+            A list of Teams from first to last.
+        """
+        self.refresh()
+        group = (conf, div) if div is not None else conf
+        return [key[-1] for key in self.groups[group]]
+        
+    def get_rank(self, team, conf = None, div = None):
+        """Get a team's place in the league, a conference, or a division.
+        
+        Args:
+            team: A Team in the league.
+            conf: A conference name, or None for the whole league.
+            div: A division name in conf, or None for the whole conference.
+            
+        Returns:
+            An integer, the team's 0-based place.
+        """
+        self.refresh()
+        group = (conf, div) if div is not None else conf
+        return bisect.bisect_left(self.groups[group], self.keys[team])
+        
+        
+class Calendar(object):
+    
+    """The Calendar class.
+    
+    This is the class that lays out a year as a flat list of slots, one per
+    scheduled game: the regular season's days, then the 7 days of each of
+    the 4 playoff rounds (with their 'if necessary' games). The League's 
+    date is a slot; the things that happen between days (starting the 
+    playoffs, starting the next round, and ending the year) are hooks on the
+    slot they happen at.
+    
+    Class Attributes:
+        round_games: The list of the number of games per day in each playoff
+            round.
+        series_length: The number of days in a playoff round.
+        
+    Attributes:
+        days: An array with the day of each slot.
+        starts: An array with the first slot of each day, and the number of 
+            slots at the end.
+        round_starts: A list of the first day of the regular season and of 
+            each playoff round, and the number of days at the end.
+        hooks: A dictionary of the form {slot: list of names of League 
+            methods}, run when the date reaches slot.
+        hook_slots: An array of the slots with hooks, in order.
+    """
+    
+    __slots__ = ("days", "starts", "round_starts", "hooks", "hook_slots")
+    
+    round_games = [8, 4, 2, 1]
+    series_length = 7
+    
+    def __init__(self, season):
+        """Inits a Calendar class.
+        
+        Args:
+            season: The Season of the year.
+            
+        Returns:
+            None
+        """
+        lengths = [season.get_day_length(day) for day in range(season.days)]
+        self.round_starts = [0, season.days]
+        for games in Calendar.round_games:
+            lengths += [games] * Calendar.series_length
+            self.round_starts.append(len(lengths))
+        self.starts = array.array("I", itertools.accumulate(lengths, initial = 0))
+        self.days = array.array("I")
+        for day, games in enumerate(lengths):
+            self.days.extend(array.array("I", [day]) * games)
+        self.hooks = {self.starts[season.days]: ["start_playoffs"]}
+        rounds = len(Calendar.round_games)
+        for r in range(rounds):
+            self.hooks[self.starts[self.round_starts[r + 2]]] = [
+                "start_next_playoff_round" if r < rounds - 1 else "end_season"]
+        self.hook_slots = array.array("I", sorted(self.hooks))
+        
+    def get_slot(self, day, game):
+        """Get the slot of a day and game.
+        
+        Args:
+            day: An integer, the day of the year.
+            game: An integer, the game of the day.
+            
+        Returns:
+            An integer, the slot of the game; a game past the end of its day
+            is the next day's first, and a day past the end of the year is
+            the number of slots.
+        """
+        if day >= len(self.starts) - 1:
+            return self.starts[-1]
+        return min(self.starts[day] + game, self.starts[day + 1])
+        
+    def get_date(self, slot):
+        """Get the day and game of a slot.
+        
+        Args:
+            slot: An integer, a slot of the year, or the number of slots.
+            
+        Returns:
+            A tuple of two integers, the day and the game of the day; the 
+            number of slots is game 0 of the day after the last.
+        """
+        if slot >= len(self.days):
+            return (len(self.starts) - 1, 0)
+        day = self.days[slot]
+        return (day, slot - self.starts[day])
+        
+    def get_day_length(self, day):
+        """Get the number of games on a day.
+        
+        Args:
+            day: An integer, the day of the year.
+            
+        Returns:
+            An integer, the number of games (including unnecessary playoff
+            games) on the day.
+        """
+        return self.starts[day + 1] - self.starts[day]
+        
+    def get_next_hook(self, slot):
+        """Get the first slot with hooks after the given slot.
+        
+        Args:
+            slot: An integer, a slot of the year.
+            
+        Returns:
+            An integer, the next slot with hooks.
+        """
+        return self.hook_slots[bisect.bisect_right(self.hook_slots, slot)]
+        
+        
 class Season(object):
     
     """The Season class.
@@ -436,12 +1266,18 @@ class Season(object):
             (North, South, East, West).
             
     Attributes:
-        team_align: A dictionary in the form {Conf: {Div: [Teams in the Div]}}
-        schedule: A list of lists (days) of lists (matchups) of two Teams.
+        teams: The list of Teams, in conference and division order.
+        rng: The random.Random (or random module) the schedule is shuffled 
+            with.
+        matchups, starts: The numeric schedule (see get_schedule_template) 
+            shared by every season of the same shape.
+        days: The number of days in the season.
+        day_order: An array with the template day played on each day of this
+            season.
+        built_schedule: The schedule as lists of Teams once it has been 
+            read through schedule, otherwise None.
         
     Future:
-        Arbitrary conferences/divisions
-        Arbitrary number of teams
         Year-over-year stats
         All star game
         Awards
@@ -452,25 +1288,55 @@ class Season(object):
     conf_names = ["American", "National"]
     div_names = ["North", "South", "East", "West"]
     
-    def __init__(self, teams):
+    def __init__(self, teams, rng = None, conferences = 2, divisions = 4):
         """Inits a Season class.
         
         Args:
-            team_align: A dictionary in the form 
-                {Conf: {Div: [Teams in the Div]}}
+            teams: A list of Teams, in conference and division order, that
+                divide evenly into the divisions.
+            rng: A random.Random to shuffle the schedule with; if None, the 
+                random module is used.
+            conferences: The number of conferences.
+            divisions: The number of divisions in each conference.
                 
         Returns:
             None
         """
         self.teams = teams
-        self.schedule = self.get_schedule()
+        self.rng = rng if rng is not None else random
+        self.matchups, self.starts = get_schedule_template(conferences, divisions, 
+            len(teams) // (conferences * divisions))
+        self.days = len(self.starts) - 1
+        self.day_order = self.get_day_order()
+        self.built_schedule = None
+        
+    @property
+    def schedule(self):
+        """The season as a list of lists (days) of lists (matchups) of two 
+        Teams; it is only built the first time it is read."""
+        if self.built_schedule is None:
+            self.built_schedule = self.get_schedule()
+        return self.built_schedule
+        
+    def get_day_order(self):
+        """Get a new order to play the template's days in.
+        
+        Args:
+            None
+            
+        Returns:
+            An array of the template day to play on each day of the season.
+        """
+        order = list(range(self.days))
+        self.rng.shuffle(order)
+        return array.array("I", order)
         
     def get_schedule(self):
-        """Gets a new schedule.
+        """Gets the schedule as lists of Teams.
         
-        We assume 32 teams in 2 conferences in 4 divisions each. We play
-        2 inter-conference games, 3 intra-conference games, and 4 
-        intra-division games, for 80 total.
+        Each team plays 4 games against each team in its division, 3 against
+        each other team in its conference, and 2 against each team in the
+        other conferences (see get_league_schedule).
         
         Args:
             None
@@ -479,14 +1345,34 @@ class Season(object):
             A list of lists of lists, representing the season; the inner list
             is the day, the inner inner list is the matchup: two teams.
         """
-        numsched = RegularSeasonSchedule()
-        schedule = []
-        for numday in numsched:
-            schedule.append([])
-            for nummatch in numday:
-                schedule[-1].append([self.teams[nummatch[0]], self.teams[nummatch[1]]])
-        random.shuffle(schedule)
-        return schedule
+        return [self.get_day(day) for day in range(self.days)]
+        
+    def get_day(self, day):
+        """Get the matchups of a day.
+        
+        Args:
+            day: An integer, the day of the season.
+            
+        Returns:
+            A list of lists of two Teams, the day's games in order.
+        """
+        matchups = self.matchups
+        teams = self.teams
+        template_day = self.day_order[day]
+        return [[teams[matchups[2 * g]], teams[matchups[2 * g + 1]]] 
+            for g in range(self.starts[template_day], self.starts[template_day + 1])]
+        
+    def get_day_length(self, day):
+        """Get the number of games on a day.
+        
+        Args:
+            day: An integer, the day of the season.
+            
+        Returns:
+            An integer, the number of games.
+        """
+        template_day = self.day_order[day]
+        return self.starts[template_day + 1] - self.starts[template_day]
         
     def get_next_game(self, date):
         """Get a list of two Teams that play on date.
@@ -498,33 +1384,46 @@ class Season(object):
         Returns:
             A list of two Teams that play on the given date.
         """
-        return self.schedule[date[1]][date[2]]
+        g = self.starts[self.day_order[date[1]]] + date[2]
+        return [self.teams[self.matchups[2 * g]], self.teams[self.matchups[2 * g + 1]]]
         
         
 class Playoff(object):
     
     """The Playoff class.
     
-    This class is a container around a playoff. It keeps track of the schedule
-    and has playoff-specific items in it.
+    This class is a container around a playoff. It keeps track of the series
+    of the current round and has playoff-specific items in it. Each series
+    is updated as its games finish, and its games are scheduled from it: a
+    day of the round has one game per series, or [None, None] once the 
+    series is over.
     
     Class Attributes:
         conf_names: The list of strings which are conference names in a leauge
             (American and National).
         div_names: The list of strings which are division names in a conference
             (North, South, East, West).
+        pairings: A dictionary of the form {round: seed pairs}; the seeds 
+            still in each conference meet in these pairs in rounds 1 thru 3.
             
     Attributes:
         am_teams: A list of Teams in seeded order from the American conference.
         na_teams: A list of Teams in seeded order from the National conference.
         round: An integer, 1 thru 4, representing the current playoff round.
-        schedule: The schedule of games for the current round.    
+        start: The day of the year the playoff starts on.
+        series: A list of the Series of the current round, in game order.
+        team_series: A dictionary of the form {team: its Series} for the
+            current round.
+        game_probs: A dictionary of the form {(team1, team2): probability} 
+            caching the chance that team1 beats team2 in a game, for the
+            analysis methods; it assumes lines do not change mid-playoff.
     """
     
     conf_names = ["American", "National"]
     div_names = ["North", "South", "East", "West"]
+    pairings = {1: ((0, 7), (1, 6), (2, 5), (3, 4)), 2: ((0, 3), (1, 2)), 3: ((0, 1),)}
     
-    def __init__(self, am_teams, na_teams):
+    def __init__(self, am_teams, na_teams, start = 80, round = 1, series = None):
         """Inits a Playoff class.
         
         Args:
@@ -532,107 +1431,75 @@ class Playoff(object):
                 conference.
             na_teams: A list of Teams in seeded order from the National 
                 conference.
+            start: The day of the year the playoff starts on, the day after
+                the regular season.
+            round: The current round; 1 for a new playoff.
+            series: The list of Series of the current round, if it is under
+                way (as when a saved league is loaded); if None, the round's
+                series are made from the teams.
                 
         Returns:
             None
         """
         self.am_teams = am_teams
         self.na_teams = na_teams
-        self.round = 1
-        self.schedule = self.get_rd1_schedule()
+        self.round = round
+        self.start = start
+        self.game_probs = {}
+        if series is None:
+            self.start_round()
+        else:
+            self.set_series(series)
         
-    def get_rd1_schedule(self):
-        """Get the schedule for the first round of the playoffs.
+    def get_round_series(self):
+        """Get the series of the current round.
         
-        We assume am_teams and na_teams are in seeded order. We include 'if 
-        necessary' games and use a 7 game series.
+        We assume am_teams and na_teams are in seeded order. Rounds 1 thru 3
+        are played within each conference (see pairings), and round 4 between
+        the conference winners.
         
         Args:
             None
             
         Returns:
-            A list of lists of lists; the each item in the list represents a
-            day and each day's lists is a two-element list of Teams to 
-            represent a game.
+            A list of new Series, American ones first.
         """
-        day = [
-            [self.am_teams[0], self.am_teams[7]], 
-            [self.am_teams[1], self.am_teams[6]],
-            [self.am_teams[2], self.am_teams[5]],
-            [self.am_teams[3], self.am_teams[4]],
-            [self.na_teams[0], self.na_teams[7]],
-            [self.na_teams[1], self.na_teams[6]],
-            [self.na_teams[2], self.na_teams[5]],
-            [self.na_teams[3], self.na_teams[4]]]
-        rd1 = [list(day) for i in range(7)]
-        return rd1
-        
-    def get_rd2_schedule(self):
-        """Get the schedule for the second round of the playoffs.
+        if self.round == 4:
+            return [Series(self.am_teams[0], self.na_teams[0])]
+        return [Series(teams[a], teams[b]) 
+            for teams in (self.am_teams, self.na_teams)
+            for a, b in Playoff.pairings[self.round]]
         
-        We assume am_teams and na_teams are in seeded order and 4 Teams long
-        each. We include 'if necessary' games and use a 7 game series.
+    def start_round(self):
+        """Set up the series of the current round.
         
         Args:
             None
-        
+            
         Returns:
-            A list of lists of lists; the each item in the list represents a
-            day and each day's lists is a two-element list of Teams to 
-            represent a game.
-        """
-        day = [
-            [self.am_teams[0], self.am_teams[3]],
-            [self.am_teams[1], self.am_teams[2]],
-            [self.na_teams[0], self.na_teams[3]],
-            [self.na_teams[1], self.na_teams[2]]]
-        rd2 = [list(day) for i in range(7)]
-        return rd2
-        
-    def get_rd3_schedule(self):
-        """Get the schedule for the third round of the playoffs.
-        
-        We assume am_teams and na_teams are in seeded order and 2 Teams long
-        each. We include 'if necessary' games and use a 7 game series.
-        
-        Args:
             None
-        
-        Returns:
-            A list of lists of lists; the each item in the list represents a
-            day and each day's lists is a two-element list of Teams to 
-            represent a game.
         """
-        day = [
-            [self.am_teams[0], self.am_teams[1]],
-            [self.na_teams[0], self.na_teams[1]]]
-        rd3 = [list(day) for i in range(7)]
-        return rd3
-        
-    def get_rd4_schedule(self):
-        """Get the schedule for the fourth round of the playoffs.
+        self.set_series(self.get_round_series())
         
-        We assume am_teams and na_teams are one Team each. We include 
-        'if necessary' games and use a 7 game series.
+    def set_series(self, series):
+        """Make the given series the ones of the current round.
         
         Args:
-            None
-        
+            series: A list of Series, in game order.
+            
         Returns:
-            A list of lists of lists; the each item in the list represents a
-            day and each day's lists is a two-element list of Teams to 
-            represent a game.
+            None
         """
-        day = [
-            [self.am_teams[0], self.na_teams[0]]]
-        rd4 = [list(day) for i in range(7)]
-        return rd4
+        self.series = series
+        self.team_series = {}
+        for s in series:
+            self.team_series[s.team1] = s
+            self.team_series[s.team2] = s
         
     def get_next_game(self, date):
         """Get a list of two teams representing the next matchup to be played.
         
-        We keep the entire playoff schedule in the Playoff's schedule, so we 
-        only have to subtract 80 to get the correct day.
+        Each day of the current round has one game per series, in order.
         
         Args:
             date: A list of three integers, the first representing the year 
@@ -640,12 +1507,36 @@ class Playoff(object):
                 third representing the game of the day.
                 
         Returns:
-            A list of two Teams that play on the given date.
+            A list of two Teams that play on the given date, or [None, None]
+            if their series is over.
+        """
+        series = self.series[date[2]]
+        if series.winner is not None:
+            return [None, None]
+        return [series.team1, series.team2]
+        
+    def add_result(self, winner):
+        """Add a game's result to its series.
+        
+        If this ends the series, the loser is out of the playoff.
+        
+        Args:
+            winner: The Team that won the game.
+            
+        Returns:
+            None
         """
-        return self.schedule[date[1] - 80][date[2]]
+        series = self.team_series[winner]
+        series.add_win(winner)
+        if series.winner is not None:
+            loser = series.get_loser()
+            if loser in self.am_teams:
+                self.am_teams.remove(loser)
+            else:
+                self.na_teams.remove(loser)
         
     def get_next_round(self):
-        """Add the next playoff round's schedule to this object's schedule.
+        """Move on to the next playoff round.
         
         Args:
             None
@@ -654,12 +1545,7 @@ class Playoff(object):
             None
         """
         self.round += 1
-        if self.round == 2:
-            self.schedule += self.get_rd2_schedule()
-        elif self.round == 3:
-            self.schedule += self.get_rd3_schedule()
-        else:
-            self.schedule += self.get_rd4_schedule()
+        self.start_round()
         
     def get_matchup_score(self, team1, team2):
         """Get a dictionary of the form {team: current playoff round wins} for
@@ -673,53 +1559,119 @@ class Playoff(object):
             A dictionary of the form {team: current round wins} for the given
             teams.
         """
-        expected_wins = 4 * (self.round - 1)
-        team1_cur_wins = team1.get_stat("playoff", "Wins") - expected_wins
-        team2_cur_wins = team2.get_stat("playoff", "Wins") - expected_wins
-        score = {team1: team1_cur_wins, team2: team2_cur_wins}
-        return score
+        series = self.team_series[team1]
+        return {team1: series.get_wins(team1), team2: series.get_wins(team2)}
         
-    def update_playoffs(self, date):
-        """Check each matchup in the current round to see if the rest of the
-        games are unnecessary.
+    def get_game_probability(self, team1, team2):
+        """Get the exact probability that team1 beats team2 in a playoff game.
+        
+        Args:
+            team1: A Team.
+            team2: A Team.
+            
+        Returns:
+            A float, the probability that team1 wins (playoff games cannot
+            be tied).
+        """
+        if (team1, team2) not in self.game_probs:
+            rate1, rate2 = Game.get_goal_rates(team1, team2)
+            win = Game.get_result_probabilities(rate1, rate2, "playoff")[0]
+            self.game_probs[(team1, team2)] = win
+            self.game_probs[(team2, team1)] = 1 - win
+        return self.game_probs[(team1, team2)]
         
-        If the games are unnecessary, we replace the teams in them with None.
-        We use the given date to know to replace all teams following it.
+    def get_series_probabilities(self):
+        """Get the exact probability of each team winning its current series.
         
         Args:
-            date: A list of three integers, the first representing the year 
-                (not relevant here), the second representing the day, and the
-                third representing the game of the day.
+            None
             
         Returns:
+            A dictionary of the form {team: probability} for the teams in the
+            current round's live series.
+        """
+        probs = {}
+        for team1, team2, prob in self.get_current_series():
+            probs[team1] = prob
+            probs[team2] = 1 - prob
+        return probs
+        
+    def get_current_series(self):
+        """Get the live series of the current round and their odds.
+        
+        Args:
             None
+            
+        Returns:
+            A list of tuples of two Teams and the probability that the first
+            wins the series from its current score.
         """
-        playoff_day = date[1] - 80
-        games = self.schedule[-1]
-        losers = []
-        games_to_remove = []
-        for game in games:
-            if game != [None, None]:
-                score = self.get_matchup_score(game[0], game[1])
-                #if self.round == 4:
-                    #print(str(score))
-                if score[game[0]] == 4:
-                    losers.append(game[1])
-                    games_to_remove.append(game)
-                elif score[game[1]] == 4:
-                    losers.append(game[0])
-                    games_to_remove.append(game)
-        for team in losers:
-            #print('lost: ' + str(team))
-            if team in self.am_teams:
-                self.am_teams.remove(team)
-            elif team in self.na_teams:
-                self.na_teams.remove(team)
-        #for team in self.am_teams + self.na_teams:
-            #print('still in: ' + str(team))
-        for i in range(date[1] - 80, len(self.schedule)):
-            for game in games_to_remove:
-                self.schedule[i][self.schedule[i].index(game)] = [None, None]
+        current = []
+        for series in self.series:
+            if series.winner is None:
+                p = self.get_game_probability(series.team1, series.team2)
+                current.append((series.team1, series.team2, 
+                    get_series_probability(p, series.wins1, series.wins2)))
+        return current
+        
+    def get_advancement_probabilities(self):
+        """Get the exact probability of each team reaching each round.
+        
+        Nothing is simulated: every way the current and later rounds can go
+        is weighed with the series probabilities, reseeding each round by
+        seed order as get_rd2_schedule and get_rd3_schedule do.
+        
+        Args:
+            None
+            
+        Returns:
+            A dictionary of the form {team: [probabilities]} for the teams 
+            still in, with the probabilities of reaching rounds 1 thru 4 and
+            of winning the final.
+        """
+        reach = {team: [0.0] * 5 for team in self.am_teams + self.na_teams}
+        current = self.get_current_series()
+        pairings = {2: ((0, 3), (1, 2)), 3: ((0, 1),)}
+        finalists = []
+        for teams in (self.am_teams, self.na_teams):
+            for team in teams:
+                for r in range(self.round):
+                    reach[team][r] = 1.0
+            if self.round == 4:
+                finalists.append({teams[0]: 1.0})
+                continue
+            series = [s for s in current if s[0] in teams]
+            outcomes = get_round_outcomes(teams, series, 1.0)
+            for rnd in range(self.round + 1, 4):
+                new = []
+                for remaining, prob in outcomes:
+                    for team in remaining:
+                        reach[team][rnd - 1] += prob
+                    series = []
+                    for a, b in pairings[rnd]:
+                        p = self.get_game_probability(remaining[a], remaining[b])
+                        series.append((remaining[a], remaining[b], get_series_probability(p)))
+                    new += get_round_outcomes(remaining, series, prob)
+                outcomes = new
+            champs = {}
+            for remaining, prob in outcomes:
+                champs[remaining[0]] = champs.get(remaining[0], 0.0) + prob
+            for team, prob in champs.items():
+                reach[team][3] += prob
+            finalists.append(champs)
+        if self.round == 4:
+            for team1, team2, p in current:
+                reach[team1][4] = p
+                reach[team2][4] = 1 - p
+            if self.series[0].winner is not None:
+                reach[self.series[0].winner][4] = 1.0
+        else:
+            for team1, prob1 in finalists[0].items():
+                for team2, prob2 in finalists[1].items():
+                    p = get_series_probability(self.get_game_probability(team1, team2))
+                    reach[team1][4] += prob1 * prob2 * p
+                    reach[team2][4] += prob1 * prob2 * (1 - p)
+        return reach
         
     def end_playoff(self):
         """Perform end of playoff tasks.
@@ -735,6 +1687,101 @@ class Playoff(object):
         pass
         
 
+class Series(object):
+    
+    """The Series class.
+    
+    This is the class that keeps the state of a best-of-seven playoff series
+    between two teams.
+    
+    Class Attributes:
+        wins_needed: The number of wins that takes a series (4).
+        
+    Attributes:
+        team1: The higher seeded Team.
+        team2: The lower seeded Team.
+        wins1: An integer, team1's wins in the series.
+        wins2: An integer, team2's wins in the series.
+        winner: The Team that won the series, or None while it goes on.
+    """
+    
+    __slots__ = ("team1", "team2", "wins1", "wins2", "winner")
+    
+    wins_needed = 4
+    
+    def __init__(self, team1, team2):
+        """Inits a Series class with no games played.
+        
+        Args:
+            team1: The higher seeded Team.
+            team2: The lower seeded Team.
+            
+        Returns:
+            None
+        """
+        self.team1 = team1
+        self.team2 = team2
+        self.wins1 = 0
+        self.wins2 = 0
+        self.winner = None
+        
+    def add_win(self, team):
+        """Add a win for one of the teams.
+        
+        Args:
+            team: The Team that won a game of the series.
+            
+        Returns:
+            None
+        """
+        if team is self.team1:
+            self.wins1 += 1
+            if self.wins1 == Series.wins_needed:
+                self.winner = team
+        else:
+            self.wins2 += 1
+            if self.wins2 == Series.wins_needed:
+                self.winner = team
+                
+    def get_wins(self, team):
+        """Get one of the teams' wins in the series.
+        
+        Args:
+            team: team1 or team2.
+            
+        Returns:
+            An integer, the team's wins.
+        """
+        return self.wins1 if team is self.team1 else self.wins2
+        
+    def get_loser(self):
+        """Get the Team that lost the series.
+        
+        Args:
+            None
+            
+        Returns:
+            The Team that lost, or None while the series goes on.
+        """
+        if self.winner is None:
+            return None
+        return self.team2 if self.winner is self.team1 else self.team1
+        
+    def get_games_remaining(self):
+        """Get the most games the series can still take.
+        
+        Args:
+            None
+            
+        Returns:
+            An integer, the games left if it goes the distance; 0 once it is
+            over.
+        """
+        if self.winner is not None:
+            return 0
+        return 2 * Series.wins_needed - 1 - self.wins1 - self.wins2
+        
+        
 def RegularSeasonSchedule():
     """Get a numeric regular season schedule for 32 teams in 4 divisions in
     two conferences.
@@ -751,143 +1798,518 @@ def RegularSeasonSchedule():
         A list of lists of lists; the middle list represents days, and the 
         innermost list represents matchups on that day, in integers.
     """
-    def get_intradiv(d):
-        """Get the schedule for an intradivisional round for a division.
+    return get_league_schedule(2, 4, 4)
+    
+def get_round_robin(items):
+    """Get the rounds of a single round robin between the given items.
+    
+    This uses the circle method: the first item stays put while the others
+    rotate around it. With an odd number of items, one sits out each round.
+    
+    Args:
+        items: A list of the items to be matched up.
         
-        That is, for four items, get a list of lists of lists; each middle
-        list represents a day, and each innermost list represents a matchup.
+    Returns:
+        A list of lists (rounds) of two-element lists (matchups); the item 
+        earlier in items is first in each matchup.
+    """
+    n = len(items) + len(items) % 2
+    rounds = []
+    for r in range(n - 1):
+        others = [(i + r) % (n - 1) + 1 for i in range(n - 1)]
+        pairs = [(0, others[0])] + [(others[i], others[-i]) for i in range(1, n // 2)]
+        rounds.append([[items[min(pair)], items[max(pair)]] 
+            for pair in pairs if max(pair) < len(items)])
+    return rounds
+    
+def get_rotation(items1, items2):
+    """Get the rounds in which every item of items1 meets every item of 
+    items2 once.
+    
+    Args:
+        items1: A list of items.
+        items2: A list of items, as long as items1.
         
-        Args:
-            d: A list of four items to be matched up.
+    Returns:
+        A list of lists (rounds) of two-element lists (matchups); in round r,
+        items1[i] meets items2[(i + r) % len(items2)].
+    """
+    k = len(items2)
+    return [[[items1[i], items2[(i + r) % k]] for i in range(len(items1))] 
+        for r in range(k)]
+    
+def get_league_schedule(conferences, divisions, teams, intradiv = 4, 
+    intraconf = 3, interconf = 2):
+    """Get a numeric regular season schedule for a league of any size.
+    
+    Teams are numbered conference by conference and division by division, 
+    so team t is in division t // teams and conference 
+    t // (divisions * teams). Each team plays:
+        intradiv games against each team in its division
+        intraconf games against each other team in its conference
+        interconf games against each team in the other conferences.
+    Every round robin is played so that no team plays twice in a day; when a
+    conference, division, or group of divisions is odd, the odd one out sits
+    out instead. The time taken is linear in the number of games.
+    
+    Args:
+        conferences: The number of conferences.
+        divisions: The number of divisions in each conference.
+        teams: The number of teams in each division.
+        intradiv: The number of games against each division rival.
+        intraconf: The number of games against each other conference rival.
+        interconf: The number of games against each team outside the 
+            conference.
             
-        Returns:
-            A list of lists of lists representing three days, each of which
-            has two matchups.
-        """
-        s = [
-            [[d[0], d[1]], [d[2], d[3]]], 
-            [[d[0], d[2]], [d[1], d[3]]],
-            [[d[0], d[3]], [d[1], d[2]]]
-            ]
-        return s
+    Returns:
+        A list of lists of lists; the middle list represents days, and the 
+        innermost list represents matchups on that day, in integers.
+    """
+    divs = [list(range(d * teams, (d + 1) * teams)) for d in range(conferences * divisions)]
+    confs = [list(range(c * divisions, (c + 1) * divisions)) for c in range(conferences)]
     
-    def get_intradiv_round():
-        """Get the schedule for an intravidisional round for the league.
+    def get_days(div_rounds):
+        """Get the days in which the paired divisions of each round meet.
         
         Args:
-            None
-            
+            div_rounds: A list of lists (rounds) of pairs of division 
+                numbers.
+                
         Returns:
-            All of the matches for an intradivisional round for the league in
-            the form of a list of lists (days) of lists (games) - two integers
-            representing the matchup.
+            A list of days, teams days per round.
         """
-        t = [i for i in range(32)]
-        s = [[] for i in range(3)]
-        i = 0
-        while i < 32:
-            games = get_intradiv(t[i:i+4])
-            for j in range(3):
-                s[j] += games[j]
-            i += 4
-        return s
+        days = []
+        for pairs in div_rounds:
+            rotations = [get_rotation(divs[d1], divs[d2]) for d1, d2 in pairs]
+            for r in range(teams):
+                days.append([game for rotation in rotations for game in rotation[r]])
+        return days
+    
+    intradiv_round = [[game for games in day for game in games]
+        for day in zip(*[get_round_robin(div) for div in divs])]
+    interdiv_round = get_days([[pair for pairs in rounds for pair in pairs]
+        for rounds in zip(*[get_round_robin(conf) for conf in confs])])
+    interconf_round = []
+    for conf_pairs in get_round_robin(confs):
+        rotations = [get_rotation(c1, c2) for c1, c2 in conf_pairs]
+        interconf_round += get_days([[pair for rotation in rotations for pair in rotation[r]]
+            for r in range(divisions)])
+    schedule = intradiv_round * intradiv + interdiv_round * intraconf + interconf_round * interconf
+    return [day for day in schedule if day]
+    
+def check_schedule(schedule, conferences, divisions, teams, intradiv = 4, 
+    intraconf = 3, interconf = 2):
+    """Check a numeric schedule against the league it is meant for.
+    
+    This checks that no team plays twice in a day, that every team plays 
+    the right number of games, and that every pair of teams meets the right
+    number of times (see get_league_schedule for the numbering and counts).
+    
+    Args:
+        schedule: A list of lists (days) of lists (matchups) of two team 
+            numbers.
+        conferences: The number of conferences.
+        divisions: The number of divisions in each conference.
+        teams: The number of teams in each division.
+        intradiv: The number of games against each division rival.
+        intraconf: The number of games against each other conference rival.
+        interconf: The number of games against each team outside the 
+            conference.
+            
+    Returns:
+        None
         
-    def get_interdiv(d1, d2):
-        """Get the schedule for an interdivisional round for two divisions.
+    Raises:
+        ValueError: the schedule does not fit the league.
+    """
+    n = conferences * divisions * teams
+    conf_size = divisions * teams
+    counts = [0] * n
+    pairs = {}
+    for d, day in enumerate(schedule):
+        playing = set()
+        for team1, team2 in day:
+            if not (0 <= team1 < n and 0 <= team2 < n) or team1 == team2:
+                raise ValueError("day %d has the matchup %r" % (d, [team1, team2]))
+            if team1 in playing or team2 in playing:
+                raise ValueError("a team plays twice on day %d" % d)
+            playing.add(team1)
+            playing.add(team2)
+            counts[team1] += 1
+            counts[team2] += 1
+            pair = (team1, team2) if team1 < team2 else (team2, team1)
+            pairs[pair] = pairs.get(pair, 0) + 1
+    games = (intradiv * (teams - 1) + intraconf * (divisions - 1) * teams + 
+        interconf * (conferences - 1) * conf_size)
+    for team, count in enumerate(counts):
+        if count != games:
+            raise ValueError("team %d plays %d games, not %d" % (team, count, games))
+    for (team1, team2), count in pairs.items():
+        if team1 // teams == team2 // teams:
+            expected = intradiv
+        elif team1 // conf_size == team2 // conf_size:
+            expected = intraconf
+        else:
+            expected = interconf
+        if count != expected:
+            raise ValueError("teams %d and %d meet %d times, not %d" % 
+                (team1, team2, count, expected))
+    
+def get_schedule_template(conferences = 2, divisions = 4, teams = 4):
+    """Get the numeric regular season schedule for a league shape, computing 
+    it the first time.
+    
+    The schedule from get_league_schedule never changes for a shape, so it 
+    is built once and kept as two flat arrays: day d has games starts[d] 
+    thru starts[d + 1] - 1, and game g is teams matchups[2 * g] and 
+    matchups[2 * g + 1].
+    
+    Args:
+        conferences: The number of conferences.
+        divisions: The number of divisions in each conference.
+        teams: The number of teams in each division.
         
-        That is, for the two lists of four items, get a list of lists; each
-        middle list represents a day, and each innermost list represents a
-        matchup.
+    Returns:
+        A tuple of an array of team indices, game by game, and an array of 
+        the first game of each day (and the number of games at the end).
+    """
+    shape = (conferences, divisions, teams)
+    if shape not in schedule_templates:
+        schedule = get_league_schedule(conferences, divisions, teams)
+        typecode = "H" if conferences * divisions * teams <= 65536 else "I"
+        matchups = array.array(typecode, 
+            [team for day in schedule for match in day for team in match])
+        starts = array.array("I", itertools.accumulate([len(day) for day in schedule], initial = 0))
+        schedule_templates[shape] = (matchups, starts)
+    return schedule_templates[shape]
+    
+schedule_templates = {}
+
+def derive_rng(seed, *keys):
+    """Get an independent random stream from a root seed and keys.
+    
+    The stream is seeded with a string of the seed and the keys, which
+    random.Random hashes (with SHA-512), so it does not depend on the order
+    streams are made in, on other streams, or on the process.
+    
+    Args:
+        seed: The root seed, an integer or string.
+        keys: The integers and strings naming the stream.
         
-        Args:
-            d1: A list of four items to be matched up against d2.
-            d2: A list of four items to be matched up against d1.
+    Returns:
+        A random.Random.
+    """
+    return random.Random("/".join(str(k) for k in (seed,) + keys))
+    
+def write_array(f, values):
+    """Write an array to a binary file.
+    
+    The array is written as its typecode, item size and length, then its 
+    items, always little-endian so the file reads the same on any machine.
+    
+    Args:
+        f: A file opened for binary writing.
+        values: An array.array.
         
-        Returns:
-            A list of lists of lists representing four days, each of which has
-            four matchups.
-        """
-        s = [
-            [[d1[0], d2[0]], [d1[1], d2[1]], [d1[2], d2[2]], [d1[3], d2[3]]],
-            [[d1[0], d2[1]], [d1[1], d2[2]], [d1[2], d2[3]], [d1[3], d2[0]]],
-            [[d1[0], d2[2]], [d1[1], d2[3]], [d1[2], d2[0]], [d1[3], d2[1]]],
-            [[d1[0], d2[3]], [d1[1], d2[0]], [d1[2], d2[1]], [d1[3], d2[2]]]
-            ] 
-        return s
+    Returns:
+        None
+    """
+    if sys.byteorder != "little":
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    f.write(struct.pack("<cBQ", values.typecode.encode(), values.itemsize, len(values)))
+    values.tofile(f)
+    
+def read_array(f):
+    """Read an array written by write_array.
+    
+    Args:
+        f: A file opened for binary reading.
         
-    def get_interdiv_round():
-        """Get the schedule for an interdivisional round for the league.
+    Returns:
+        An array.array.
         
-        Args:
-            None
-            
-        Returns:
-            All the matches for an interdivisional round for the league in the
-            form of a list of lists (days) of lists (games) - two integers 
-            representing the matchup.
-        """
-        s = [[] for i in range(12)]
-        divs = [list(range(0 + 4*i, 4 + 4*i)) for i in range(8)]
-        am_div_matchups = get_intradiv([0,1,2,3])
-        na_div_matchups = get_intradiv([4,5,6,7])
-        div_matchups = [am_div_matchups[i] + na_div_matchups[i] for i in range(3)]
-        counter = 0
-        for div_matchup in div_matchups:
-            for pair in div_matchup:
-                matches = get_interdiv(divs[pair[0]], divs[pair[1]])
-                for i in range(4):
-                    s[i + (4 * counter)] += matches[i]
-            counter += 1
-        return s
+    Raises:
+        ValueError: the array's items are not the size they are here.
+        EOFError: the file ends before the array does.
+    """
+    typecode, itemsize, n = struct.unpack("<cBQ", f.read(10))
+    values = array.array(typecode.decode())
+    if values.itemsize != itemsize:
+        raise ValueError("Array items of %d bytes cannot be read as %r" % (itemsize, values.typecode))
+    values.fromfile(f, n)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+    
+def write_strings(f, strings):
+    """Write a list of strings to a binary file.
+    
+    The strings are written as their number and the byte length of their
+    UTF-8 text, then the text, with a NUL between strings.
+    
+    Args:
+        f: A file opened for binary writing.
+        strings: A list of strings without NULs in them.
         
-    def get_interconf_round():
-        """Get the schedule for an interconference round for the league.
+    Returns:
+        None
+    """
+    text = "\0".join(strings).encode("utf-8")
+    f.write(struct.pack("<QQ", len(strings), len(text)))
+    f.write(text)
+    
+def read_strings(f):
+    """Read a list of strings written by write_strings.
+    
+    Args:
+        f: A file opened for binary reading.
         
-        Args:
-            None
+    Returns:
+        A list of strings.
+    """
+    n, size = struct.unpack("<QQ", f.read(16))
+    if n == 0:
+        return []
+    return f.read(size).decode("utf-8").split("\0")
+    
+def add_group(values, items, ids):
+    """Add a list of players or teams to an array by their numbers.
+    
+    The length of the list is added first; an empty spot (None) is added
+    as -1.
+    
+    Args:
+        values: The array.array to extend.
+        items: A list of Players or Teams (or None).
+        ids: A dictionary of the form {item: its number}.
+        
+    Returns:
+        None
+    """
+    values.append(len(items))
+    values.extend(-1 if item is None else ids[item] for item in items)
+    
+def read_group(values, items):
+    """Read a list added by add_group.
+    
+    Args:
+        values: An iterator over the array's numbers, at the group's length.
+        items: The list of the Players or Teams, by number.
+        
+    Returns:
+        A list of Players or Teams (or None).
+    """
+    return [None if i < 0 else items[i] for i in itertools.islice(values, next(values))]
+    
+def simulate_scheduled_game(task):
+    """Simulate a scheduled game from its shot tables.
+    
+    This is what League.play_day runs in its worker processes, so it only 
+    takes and returns plain data.
+    
+    Args:
+        task: A tuple of the two shot tables (as for Game.simulate_tables),
+            the era, the engine, the league's seed, and the game's date.
             
-        Returns:
-            All the matches for an interconference round for the league in the
-            form of a list of lists (days) of lists (games) - two integers 
-            representing the matchup.
-        """
-        s = [[] for i in range(16)]
-        divs = [list(range(0 + 4*i, 4 + 4*i)) for i in range(8)]
-        div_matchups = get_interdiv([0,1,2,3], [4,5,6,7])
-        counter = -1
-        for matchup in div_matchups:
-            counter += 1
-            for pair in matchup:
-                matches = get_interdiv(divs[pair[0]], divs[pair[1]])
-                for i in range(4):
-                    s[i + (4 * counter)] += matches[i]
-        return s
+    Returns:
+        A two-element list of tallies, one per team, as from 
+        Game.simulate_lineups.
+    """
+    table1, table2, era, engine, seed, date = task
+    rng = derive_rng(seed, "game", date[0], date[1], date[2])
+    return Game.simulate_tables(table1, table2, era, engine, rng)
+    
+def get_series_probability(p, wins1 = 0, wins2 = 0, needed = 4):
+    """Get the exact probability of winning a series from its score.
+    
+    The first team wins the series if it takes its remaining needed games
+    before losing the other team's; with k of those losses along the way, 
+    that is a negative binomial term.
+    
+    Args:
+        p: The probability that the first team wins any one game.
+        wins1: The first team's wins so far.
+        wins2: The second team's wins so far.
+        needed: The number of wins that takes the series (4 of 7).
+        
+    Returns:
+        A float, the probability that the first team wins the series.
+    """
+    a = needed - wins1
+    b = needed - wins2
+    if a <= 0:
+        return 1.0
+    if b <= 0:
+        return 0.0
+    return sum(math.comb(a - 1 + k, k) * p ** a * (1 - p) ** k for k in range(b))
+    
+def get_round_outcomes(teams, series, prob):
+    """Get every way a playoff round can end for a conference.
+    
+    Args:
+        teams: A list of the conference's teams still in, in seed order.
+        series: A list of tuples of two teams and the probability that the 
+            first wins their series.
+        prob: The probability of reaching this round as it stands.
+        
+    Returns:
+        A list of tuples of the teams left (still in seed order) and the 
+        probability of that outcome.
+    """
+    outcomes = [(teams, prob)]
+    for team1, team2, p in series:
+        new = []
+        for remaining, q in outcomes:
+            if p > 0:
+                new.append(([t for t in remaining if t is not team2], q * p))
+            if p < 1:
+                new.append(([t for t in remaining if t is not team1], q * (1 - p)))
+        outcomes = new
+    return outcomes
+    
+def get_projected_seeds(keys, align):
+    """Get a conference's playoff seeds from projected records.
+    
+    This follows League.get_playoff_teams: division winners first (the best
+    eight, if there are more), then the next teams up to eight, each ranked
+    as in the Standings.
+    
+    Args:
+        keys: A list of sort keys per team index, as (-points, -wins, 
+            -goal differential, index); the smallest key ranks first.
+        align: A list (per division) of lists of team indices.
         
-    schedule = []
-    intradiv_round = get_intradiv_round()
-    interdiv_round = get_interdiv_round()
-    interconf_round = get_interconf_round()
-    for i in range(4):
-        schedule += intradiv_round
-    for i in range(3):
-        schedule += interdiv_round
-    for i in range(2):
-        schedule += interconf_round
-    return schedule
+    Returns:
+        A list of eight team indices in seed order.
+    """
+    div_winners = []
+    non_div_winners = []
+    for div in align:
+        r = sorted(div, key = keys.__getitem__)
+        div_winners.append(r.pop(0))
+        non_div_winners += r
+    seeds = sorted(div_winners, key = keys.__getitem__)[:8]
+    seeds += sorted(non_div_winners, key = keys.__getitem__)[:8 - len(seeds)]
+    return seeds
     
+def project_replicas(task):
+    """Play out the rest of a year for a range of replicas.
     
-def create_random_league():
+    This is what League.project runs in its worker processes, so it only 
+    takes and returns plain data.
+    
+    Args:
+        task: A tuple of the state (from League.get_projection_state) and the
+            first and last (exclusive) replica numbers.
+            
+    Returns:
+        A tuple of four lists, one entry per team: dictionaries of 
+        {wins: count}, {points: count}, and {seed: count}, and lists of the 
+        counts of reaching each playoff round and winning the final.
+    """
+    state, first, last = task
+    seed = state["seed"]
+    year, day, game = state["date"]
+    align = state["align"]
+    remaining = state["remaining"]
+    season_margins = state["season_margins"]
+    playoff_probs = state["playoff_probs"]
+    n = len(state["wins"])
+    win_counts = [{} for i in range(n)]
+    point_counts = [{} for i in range(n)]
+    seed_counts = [{} for i in range(n)]
+    round_counts = [[0] * 5 for i in range(n)]
+    pairings = {1: ((0, 7), (1, 6), (2, 5), (3, 4)), 2: ((0, 3), (1, 2)), 3: ((0, 1),)}
+    for replica in range(first, last):
+        rng = derive_rng(seed, "project", year, day, game, replica)
+        wins = list(state["wins"])
+        ties = list(state["ties"])
+        differentials = list(state["differentials"])
+        for i, j in remaining:
+            cumulative = season_margins[(i, j)]
+            margin = min(bisect.bisect_right(cumulative, rng.random()), 120) - 60
+            if margin > 0:
+                wins[i] += 1
+            elif margin < 0:
+                wins[j] += 1
+            else:
+                ties[i] += 1
+                ties[j] += 1
+            differentials[i] += margin
+            differentials[j] -= margin
+        points = [2 * wins[t] + ties[t] for t in range(n)]
+        keys = [(-points[t], -wins[t], -differentials[t], t) for t in range(n)]
+        am = get_projected_seeds(keys, align[0])
+        na = get_projected_seeds(keys, align[1])
+        seeds = [None] * n
+        for teams in (am, na):
+            for k, t in enumerate(teams):
+                seeds[t] = k + 1
+        if state["playoff"] is None:
+            rnd = 1
+            reached = [0 if s is None else 1 for s in seeds]
+            series = [(teams[a], teams[b], 0, 0) for teams in (am, na) for a, b in pairings[1]]
+        else:
+            rnd, am, na, series, reached = state["playoff"]
+            am = list(am)
+            na = list(na)
+            reached = list(reached)
+        while True:
+            for i, j, wi, wj in series:
+                p = playoff_probs[i][j]
+                while wi < 4 and wj < 4:
+                    if rng.random() < p:
+                        wi += 1
+                    else:
+                        wj += 1
+                loser = j if wi == 4 else i
+                if loser in am:
+                    am.remove(loser)
+                else:
+                    na.remove(loser)
+            for t in am + na:
+                reached[t] = max(reached[t], rnd + 1)
+            if rnd == 4:
+                break
+            rnd += 1
+            if rnd == 4:
+                series = [(am[0], na[0], 0, 0)]
+            else:
+                series = [(teams[a], teams[b], 0, 0) for teams in (am, na) for a, b in pairings[rnd]]
+        for t in range(n):
+            win_counts[t][wins[t]] = win_counts[t].get(wins[t], 0) + 1
+            point_counts[t][points[t]] = point_counts[t].get(points[t], 0) + 1
+            seed_counts[t][seeds[t]] = seed_counts[t].get(seeds[t], 0) + 1
+            for r in range(reached[t]):
+                round_counts[t][r] += 1
+    return (win_counts, point_counts, seed_counts, round_counts)
+    
+def create_random_league(seed = None, n_teams = 32, div_names = None, context = None):
     """Create a random league.
     
-    This creates a random 32 team league.
+    This creates a random league, 32 teams by default. Its players and teams
+    are registered in their own LeagueContext, so any number of leagues can
+    be made in one process; leagues made from the same seed are the same.
     
     Args:
-        None
+        seed: The root seed of the league (see League); the teams and players
+            are drawn from it too. If None, one is chosen at random.
+        n_teams: The number of teams in the league.
+        div_names: A list of strings, the division names in each conference
+            (see League); if None, League.div_names.
+        context: The LeagueContext.LeagueContext to make the teams and 
+            players in; if None, a new one.
         
     Returns:
-        A league consisting of 32 randomly-generated teams consisting of 
+        A league consisting of n_teams randomly-generated teams consisting of 
         randomly-generated players.
     """
-    teams = [Team.create_random_team() for i in range(32)]
-    l = League(teams)
+    if seed is None:
+        seed = random.getrandbits(64)
+    if context is None:
+        context = LeagueContext.LeagueContext()
+    rng = derive_rng(seed, "create")
+    teams = [Team.create_random_team(rng, context) for i in range(n_teams)]
+    l = League(teams, seed, div_names = div_names, context = context)
     return l
\ No newline at end of file
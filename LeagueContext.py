@@ -0,0 +1,87 @@
+import Team
+
+class LeagueContext(object):
+    
+    """The LeagueContext class.
+    
+    This is the class that holds what the players and teams of one league
+    share: the registries of their names and the pool of team names still
+    free. Players and Teams made with a context are registered in it rather
+    than in the Player.player_dict and Team.team_dictionary class variables,
+    so many independent leagues can be made in one process, and a league
+    and its context can be dropped together. Players and Teams made without
+    one use the class variables, as before.
+    
+    Class Attributes:
+        None
+    
+    Attributes:
+        players: A dictionary of the form {player.name: player} for the
+            players made in this context.
+        player_name_counts: A dictionary of the form {name: count} with the
+            number of players given each name (see Player.get_unique_name).
+        teams: A dictionary of the form {team.name: team} for the teams made
+            in this context.
+        team_names: The list of team names not yet used in this context.
+        team_name_round: An integer, the number of times team_names has run
+            out; the names are then used again with a number after them.
+    """
+    
+    __slots__ = ("players", "player_name_counts", "teams", "team_names", "team_name_round")
+    
+    def __init__(self):
+        """Inits a LeagueContext with empty registries and every team name.
+        
+        Args:
+            None
+        
+        Returns:
+            None
+        """
+        self.players = {}
+        self.player_name_counts = {}
+        self.teams = {}
+        self.team_names = list(Team.team_names)
+        self.team_name_round = 0
+    
+    def generate_team_name(self, rng = None):
+        """Pop a random unused team name.
+        
+        When every name has been used, the names are used again with a
+        number after them ("Bears 2", then "Bears 3", and so on), so the
+        names never run out.
+        
+        Args:
+            rng: A random.Random to choose the name with; if None, the random
+                module is used.
+        
+        Returns:
+            A string to be used as a team name.
+        """
+        if not self.team_names:
+            self.team_name_round += 1
+            suffix = " " + str(self.team_name_round + 1)
+            self.team_names = [name + suffix for name in Team.team_names]
+        return Team.generate_name(rng, self.team_names)
+    
+    def get_player(self, name):
+        """Get a player of this context by name.
+        
+        Args:
+            name: A string, the player's name.
+        
+        Returns:
+            The Player, or None if there is none by that name.
+        """
+        return self.players.get(name)
+    
+    def get_team(self, name):
+        """Get a team of this context by name.
+        
+        Args:
+            name: A string, the team's name.
+        
+        Returns:
+            The Team, or None if there is none by that name.
+        """
+        return self.teams.get(name)
@@ -0,0 +1,34 @@
+"""
+Memory benchmark: bytes per player, team, and league.
+"""
+
+import tracemalloc
+
+def measure(make, n):
+    """Get the average memory kept by the objects made by make.
+
+    Args:
+        make: A function of no arguments making one object.
+        n: The number of objects to make.
+
+    Returns:
+        A float, the bytes allocated (and still held) per object.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [make() for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return size / n
+
+def __main__():
+    import Player
+    import Team
+    import League
+
+    print("Player:".ljust(26) + str(round(measure(Player.create_random_player, 2000))).rjust(10) + " bytes")
+    print("Team (with its roster):".ljust(26) + str(round(measure(Team.create_random_team, 100))).rjust(10) + " bytes")
+    print("League:".ljust(26) + str(round(measure(League.create_random_league, 1))).rjust(10) + " bytes")
+
+__main__()
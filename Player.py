@@ -9,12 +9,14 @@ class Player(object):
     
     This is the class representing a hockey player. For v1, it includes
     all positions, skaters and goalies. There is a single skill rating.
-    Players age, but do not retire. All names are in the used_names class
-    variable.
+    Players age, but do not retire. All names are in the player_dict class
+    variable, or in the LeagueContext the player was made in.
     
     Class Attributes:
         player_dict:  A dictionary of the form {player.name: player} to get
-            players by their names.
+            players made without a LeagueContext by their names.
+        name_counts: A dictionary of the form {name: count} with the number
+            of players in player_dict given each name (see get_unique_name).
         
     Attributes:
         name: A string representing the player's first and last name, separated
@@ -40,12 +42,16 @@ class Player(object):
         Separate Goalies and Skaters/All positions
     """
    
+    __slots__ = ("name", "age", "position", "rating", "team", "stats", "__weakref__")
+    
     player_dict = dict()
+    name_counts = dict()
    
-    def __init__(self, name, age, position, rating, team = None):
+    def __init__(self, name, age, position, rating, team = None, context = None):
         """Inits Player with name, age, position, rating.
         
-        Initializes a Player with blank stats.
+        Initializes a Player with blank stats. If the name is taken, a 
+        number is added to it (see get_unique_name).
         
         Args:
             name: A string representin the player's first and last name 
@@ -56,21 +62,23 @@ class Player(object):
             rating: An integer we expect to be in [0,100) representing the
                 player's skill.
             team: A Team object or None representing the team the player is on.
-            stats: A Stats.PlayerStats object containing the player's
-                statistics for each 'era' (season, playoff, career).
+            context: The LeagueContext.LeagueContext to register the player 
+                in; if None, it goes in player_dict.
         
         Returns:
             None
         """
-        while name in Player.player_dict:
-            name += " Jr"
-        self.name = name
-        Player.player_dict[self.name] = self
+        if context is None:
+            players, counts = Player.player_dict, Player.name_counts
+        else:
+            players, counts = context.players, context.player_name_counts
+        self.name = get_unique_name(name, players, counts)
+        players[self.name] = self
         self.age = age
         self.position = position
         self.rating = rating
         self.team = team
-        self.stats = Stats.PlayerStats()
+        self.stats = Stats.PlayerStats(self)
         
     def __repr__(self):
         """Repr of the Player.
@@ -184,7 +192,7 @@ class Player(object):
         """
         self.stats.update_stats(fromera, toera)
        
-    def age_year(self):
+    def age_year(self, rng = None, stats = True):
         """Completes the year for the player.
         
         This adds a year to the player's age, adjusts the player's rating by
@@ -193,19 +201,25 @@ class Player(object):
         resets their season stats.
         
         Args:
-            None
+            rng: A random.Random to draw the rating change from; if None, the
+                random module is used.
+            stats: If False, the stats are left alone (a League rolls over 
+                its whole stats store at once instead).
             
         Returns:
             None
         """
+        if rng is None:
+            rng = random
         self.age += 1
-        self.rating += random.randrange(-5,6)
+        self.rating += rng.randrange(-5,6)
         if self.rating < 0:
             self.rating = 0
         if self.rating > 99:
             self.rating = 99
-        self.update_stats("season", "career")
-        self.stats.zero_stats("playoff")
+        if stats:
+            self.update_stats("season", "career")
+            self.stats.zero_stats("playoff")
 
  
 def get_possible_names():
@@ -232,26 +246,72 @@ def get_possible_names():
     except FileNotFoundError:
         print("PlayerNames.txt not found - random players cannot be created")
        
-def generate_name():
+def generate_name(rng = None):
     """Create a random name for a new player.
     
     This chooses two names from the global variable player_name_list and 
     combines them to generate a new name for a player.
     
     Args:
-        None
+        rng: A random.Random to choose the names with; if None, the random
+            module is used.
         
     Returns:
         A string meant to be used as a player's name (first name and last name
         separated by a space).
     """
     global player_name_list
-    fn = random.choice(player_name_list)
-    ln = random.choice(player_name_list)
+    if rng is None:
+        rng = random
+    fn = rng.choice(player_name_list)
+    ln = rng.choice(player_name_list)
     name = fn + " " + ln
     return name
            
-def create_random_player(pos = None):
+def generate_names(n, rng = None):
+    """Create random names for n new players at once.
+    
+    This is generate_name for many players, drawing every name part from 
+    player_name_list in one call.
+    
+    Args:
+        n: The number of names.
+        rng: A random.Random to choose the names with; if None, the random
+            module is used.
+        
+    Returns:
+        A list of n strings meant to be used as players' names.
+    """
+    if rng is None:
+        rng = random
+    parts = rng.choices(player_name_list, k = 2 * n)
+    return [parts[i] + " " + parts[i + 1] for i in range(0, 2 * n, 2)]
+    
+def get_unique_name(name, players, counts):
+    """Get a name no player in a registry has, from the name asked for.
+    
+    The first player given a name keeps it; the next ones get a number after
+    it (" 2", " 3", and so on). counts remembers how many players have been
+    given each name, so this takes the same time however many there are.
+    
+    Args:
+        name: A string, the name asked for.
+        players: A dictionary of the form {name: player}, the registry.
+        counts: A dictionary of the form {name: count} for the registry; it 
+            is updated.
+        
+    Returns:
+        A string, the name to use.
+    """
+    count = counts.get(name, 0)
+    unique = name if count == 0 else name + " " + str(count + 1)
+    while unique in players:
+        count += 1
+        unique = name + " " + str(count + 1)
+    counts[name] = count + 1
+    return unique
+           
+def create_random_player(pos = None, rng = None, context = None):
     """Create a random player.
     
     This generates a random player with a random position unless one is 
@@ -260,16 +320,57 @@ def create_random_player(pos = None):
     Args:
         pos = None: This is a string representing the player's position; if none
         is given, a random position is chosen. Positions are: C, LW, RW, D, G.
+        rng = None: A random.Random to draw from, so that the player can be 
+        recreated from its seed; if None, the random module is used.
+        context = None: The LeagueContext.LeagueContext to register the 
+        player in; if None, it goes in Player.player_dict.
         
     Returns:
         A Player object.
     """
-    age = random.randrange(18,40)
+    if rng is None:
+        rng = random
+    age = rng.randrange(18,40)
     if not pos:
-        pos = random.choice(["C", "LW", "RW", "D", "G"])
-    rating = random.randrange(40, 90)
-    name = generate_name()
-    player = Player(name, age, pos, rating)
+        pos = rng.choice(["C", "LW", "RW", "D", "G"])
+    rating = rng.randrange(40, 90)
+    name = generate_name(rng)
+    player = Player(name, age, pos, rating, context = context)
     return player
+    
+def create_random_players(n, positions = None, rng = None, context = None):
+    """Create n random players at once.
+    
+    This is create_random_player for many players: the ages, ratings, 
+    positions and names are each drawn for every player in one call, and 
+    then the players are made. The draws are not the ones n calls to 
+    create_random_player would make.
+    
+    Args:
+        n: The number of players.
+        positions = None: A list of n strings, the players' positions; if 
+        None, a random position is chosen for each player.
+        rng = None: A random.Random to draw from; if None, the random module
+        is used.
+        context = None: The LeagueContext.LeagueContext to register the 
+        players in; if None, they go in Player.player_dict.
+        
+    Returns:
+        A list of n Player objects.
+        
+    Raises:
+        ValueError: positions does not have n entries.
+    """
+    if rng is None:
+        rng = random
+    if positions is None:
+        positions = rng.choices(["C", "LW", "RW", "D", "G"], k = n)
+    elif len(positions) != n:
+        raise ValueError("Expected " + str(n) + " positions")
+    ages = rng.choices(range(18, 40), k = n)
+    ratings = rng.choices(range(40, 90), k = n)
+    names = generate_names(n, rng)
+    Stats.PlayerStats.default_store.reserve(n)
+    return [Player(names[i], ages[i], positions[i], ratings[i], context = context) for i in range(n)]
    
 get_possible_names()
\ No newline at end of file
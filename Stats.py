@@ -1,70 +1,360 @@
+import array, bisect, functools, operator, weakref
+
+# Era IDs: the columns of a StatsStore, in StatsStore.eras order.
+GAME, SEASON, PLAYOFF, CAREER = range(4)
+# Player stat IDs, in PlayerStats.stat_names order.
+GOALS, ASSISTS, MINUTES, SHOTS, SAVES, GOALS_ALLOWED = range(6)
+# Team stat IDs, in TeamStats.stat_names order.
+WINS, LOSSES, TIES, GOALS_FOR, GOALS_AGAINST = range(5)
+
+
+class StatsStore(object):
+    
+    """The StatsStore class.
+    
+    This is the class that holds the statistics of many players (or many 
+    teams) together. Each era is one flat array of integers with a row of 
+    stats per owner, so moving a whole era (like season into career at the 
+    end of a year) is a single pass over one array rather than a walk over
+    every owner's dictionaries. PlayerStats and TeamStats are views onto a
+    row of a store.
+    
+    Class Attributes:
+        eras: The list of strings with the era names, in column order.
+        era_index: A dictionary of the form {era: index in eras}.
+        typecode: The array typecode of the stat amounts (32-bit integers).
+        
+    Attributes:
+        stats: The list of strings with the stat names, in row order.
+        stat_index: A dictionary of the form {stat: index in stats}.
+        width: The number of stats in a row.
+        columns: A list with an array of integers per era; the stats of row r
+            are at r * width thru (r + 1) * width - 1.
+        owners: A list of the owner (Player or Team) of each row, or None for
+            a free row; in a weak store, weak references to the owners (see
+            get_owner).
+        free: A list of the rows that are free to be reused.
+        dirty: A set of the rows changed since take_dirty was last called, 
+            or None if take_dirty has never been called (nothing is watching
+            the store, so changes are not tracked).
+        all_dirty: True if a whole era has changed since take_dirty was last
+            called.
+        weak: True if the store does not keep its owners alive; the row of 
+            an owner that is collected is freed.
+    """
+    
+    __slots__ = ("stats", "stat_index", "width", "columns", "owners", "free", "dirty", "all_dirty",
+        "weak")
+    
+    eras = ["game", "season", "playoff", "career"]
+    era_index = {era: i for i, era in enumerate(eras)}
+    typecode = "i"
+    
+    def __init__(self, stats, weak = False):
+        """Inits an empty StatsStore.
+        
+        Args:
+            stats: The list of strings with the stat names kept.
+            weak: True to hold the owners by weak references (see weak).
+            
+        Returns:
+            None
+        """
+        self.stats = list(stats)
+        self.stat_index = {stat: i for i, stat in enumerate(self.stats)}
+        self.width = len(self.stats)
+        self.columns = [array.array(StatsStore.typecode) for era in StatsStore.eras]
+        self.owners = []
+        self.free = []
+        self.dirty = None
+        self.all_dirty = False
+        self.weak = weak
+        
+    def add_row(self, owner = None):
+        """Get a row of zeroed stats for an owner.
+        
+        Args:
+            owner: The Player or Team the row belongs to.
+            
+        Returns:
+            An integer, the new row.
+        """
+        if self.free:
+            row = self.free.pop()
+        else:
+            row = len(self.owners)
+            self.owners.append(None)
+            zeros = get_zeros(self.width)
+            for column in self.columns:
+                column.extend(zeros)
+        if self.weak and owner is not None:
+            owner = weakref.ref(owner, functools.partial(self.release_collected, row))
+        self.owners[row] = owner
+        if self.dirty is not None:
+            self.dirty.add(row)
+        return row
+        
+    def get_owner(self, row):
+        """Get the owner of a row.
+        
+        Args:
+            row: The row.
+            
+        Returns:
+            The Player or Team, or None for a free row.
+        """
+        owner = self.owners[row]
+        if self.weak and owner is not None:
+            return owner()
+        return owner
+        
+    def release_collected(self, row, ref):
+        """Free the row of an owner that has been collected.
+        
+        This is the callback of the weak references of a weak store; if the
+        row has since been freed or given to another owner, it is left alone.
+        
+        Args:
+            row: The row of the owner.
+            ref: The weak reference to the owner.
+            
+        Returns:
+            None
+        """
+        if self.owners[row] is ref:
+            self.release_row(row)
+        
+    def reserve(self, n):
+        """Make room for n more rows at once.
+        
+        Only the rows the free list cannot cover are added, zeroed and free,
+        so making many owners grows each era's array at most once. add_row
+        hands out the rows that were already free first, then the new ones
+        in order.
+        
+        Args:
+            n: The number of rows.
+            
+        Returns:
+            None
+        """
+        n -= len(self.free)
+        if n <= 0:
+            return
+        start = len(self.owners)
+        self.owners.extend([None] * n)
+        zeros = get_zeros(self.width * n)
+        for column in self.columns:
+            column.extend(zeros)
+        self.free[0:0] = range(start + n - 1, start - 1, -1)
+        
+    def release_row(self, row):
+        """Zero the given row and free it for reuse.
+        
+        Args:
+            row: The row to free.
+            
+        Returns:
+            None
+        """
+        for era in range(len(StatsStore.eras)):
+            self.zero_row(row, era)
+        self.owners[row] = None
+        self.free.append(row)
+        if self.dirty is not None:
+            self.dirty.add(row)
+        
+    def adopt(self, view):
+        """Move a stats view's row into this store.
+        
+        The view's stats are copied into a new row here and its old row is
+        freed, so the view keeps working with the same stats.
+        
+        Args:
+            view: The PlayerStats or TeamStats to move.
+            
+        Returns:
+            None
+        """
+        if view.store is self:
+            return
+        old_store = view.store
+        old_row = view.row
+        row = self.add_row(old_store.get_owner(old_row))
+        start = row * self.width
+        old_start = old_row * self.width
+        for era in range(len(StatsStore.eras)):
+            self.columns[era][start:start + self.width] = (
+                old_store.columns[era][old_start:old_start + self.width])
+        old_store.release_row(old_row)
+        view.store = self
+        view.row = row
+        
+    def add(self, row, era, stat, amount):
+        """Add the given amount to a stat.
+        
+        Args:
+            row: The row of the owner.
+            era: The integer index of the era.
+            stat: The integer index of the stat.
+            amount: The amount to add to the stat.
+            
+        Returns:
+            None
+        """
+        self.columns[era][row * self.width + stat] += amount
+        if self.dirty is not None:
+            self.dirty.add(row)
+        
+    def get(self, row, era, stat):
+        """Get the amount of a stat.
+        
+        Args:
+            row: The row of the owner.
+            era: The integer index of the era.
+            stat: The integer index of the stat.
+            
+        Returns:
+            An integer, the amount of the stat.
+        """
+        return self.columns[era][row * self.width + stat]
+        
+    def zero_row(self, row, era):
+        """Zero one row's stats for the given era.
+        
+        Args:
+            row: The row of the owner.
+            era: The integer index of the era.
+            
+        Returns:
+            None
+        """
+        start = row * self.width
+        self.columns[era][start:start + self.width] = get_zeros(self.width)
+        if self.dirty is not None:
+            self.dirty.add(row)
+        
+    def update_row(self, row, fromera, toera):
+        """Add one row's stats in fromera to toera and zero fromera.
+        
+        Args:
+            row: The row of the owner.
+            fromera: The integer index of the era to get statistics from.
+            toera: The integer index of the era to add statistics to.
+            
+        Returns:
+            None
+        """
+        start = row * self.width
+        source = self.columns[fromera]
+        target = self.columns[toera]
+        for i in range(start, start + self.width):
+            target[i] += source[i]
+        self.zero_row(row, fromera)
+        
+    def zero_era(self, era):
+        """Zero every row's stats for the given era.
+        
+        Args:
+            era: A string for the era to zero:
+                game, season, playoff, career
+                
+        Returns:
+            None
+        """
+        e = StatsStore.era_index[era]
+        self.columns[e] = get_zeros(len(self.columns[e]))
+        self.all_dirty = True
+        
+    def update_era(self, fromera, toera):
+        """Add every row's stats in fromera to toera and zero fromera.
+        
+        Args:
+            fromera: A string for the era to get statistics from:
+                game, season, playoff, career
+            toera: A string for the era to add statistics to:
+                game, season, playoff, career
+                
+        Returns:
+            None
+        """
+        f = StatsStore.era_index[fromera]
+        t = StatsStore.era_index[toera]
+        self.columns[t] = array.array(StatsStore.typecode, map(operator.add, self.columns[t], self.columns[f]))
+        self.zero_era(fromera)
+        
+    def take_dirty(self):
+        """Get what has changed since the last call, and start afresh.
+        
+        Args:
+            None
+            
+        Returns:
+            A tuple of the set of changed rows and True if a whole era has 
+            changed (then every row should be taken as changed). The first
+            call starts the tracking, so it always says everything changed.
+        """
+        dirty = self.dirty
+        all_dirty = self.all_dirty or dirty is None
+        self.dirty = set()
+        self.all_dirty = False
+        return (dirty, all_dirty)
+        
+
 
 class ParentStats(object):
     
     """The Stats class.
     
     This is the class that contains statistics. It is a parent to PlayerStats
-    and TeamStats.
+    and TeamStats. The stats themselves are kept in a row of a StatsStore; 
+    a new object gets a row in its class's default store, and a League moves
+    its players' and teams' rows into stores of its own.
     
     Class Attributes:
-        None
+        stat_names: The list of strings with the stat names kept; set by the
+            child class.
+        default_store: The StatsStore new objects of the class are kept in;
+            set by the child class.
         
     Attributes:
-        game_stats: A dictionary whose keys are strings with stat names and
-            whose values are the integer amounts of those for the game.
-        season_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the season.
-        playoff_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the playoff.
-        career_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the 
-            career.
-        stats: A list with game_stats, season_stats, playoff_stats, and 
-            career_stats.
+        store: The StatsStore holding the stats.
+        row: The integer row of these stats in the store.
             
     Future:
         Career playoff stats
         Stats season over season
     """
     
-    def __init__(self):
+    __slots__ = ("store", "row")
+    
+    def __init__(self, owner = None, store = None):
         """Inits a Stats class.
         
         Args:
-            None
+            owner: The Player or Team the stats belong to.
+            store: The StatsStore to keep the stats in; if None, the class's
+                default_store is used.
             
         Returns:
             None
         """
-        self.game_stats = self.get_blank_stats()
-        self.season_stats = self.get_blank_stats()
-        self.playoff_stats = self.get_blank_stats()
-        self.career_stats = self.get_blank_stats()
-        self.stats = {
-            "game": self.game_stats, 
-            "season": self.season_stats, 
-            "playoff": self.playoff_stats,
-            "career": self.career_stats
-            }
+        if store is None:
+            store = self.default_store
+        self.store = store
+        self.row = store.add_row(owner)
             
     def get_blank_stats(self):
         """Get an empty stats dictionary.
         
-        This is an abstract method; it must be implemented by the child
-        class, as children all have different stats.
-        
         Args:
             None
             
         Returns:
             A stats dictionary whose keys are strings for the stats kept
             and whose values are 0.
-        
-        Raises:
-            NotImplementedError: This method must be overridden in the child
-            class.
         """
-        raise NotImplementedError("Must be implemented in child class.")
+        return {stat: 0 for stat in self.stat_names}
             
     def add_stat(self, era, stat, amount):
         """Add the given amount to the given stat for the given era.
@@ -80,7 +370,7 @@ class ParentStats(object):
         Returns:
             None
         """
-        self.stats[era][stat] += amount
+        self.store.add(self.row, StatsStore.era_index[era], self.store.stat_index[stat], amount)
             
     def get_stat(self, era, stat):
         """Get the amount of the given stat for the given era.
@@ -96,7 +386,54 @@ class ParentStats(object):
             An integer representing the amount of the given stat for the 
             given era.
         """
-        return self.stats[era][stat]
+        return self.store.get(self.row, StatsStore.era_index[era], self.store.stat_index[stat])
+        
+    def add_stat_id(self, era, stat, amount):
+        """Add the given amount to a stat given by IDs.
+        
+        This is the fast path of add_stat, for when the IDs are known.
+        
+        Args:
+            era: An era ID (GAME, SEASON, PLAYOFF, or CAREER).
+            stat: A stat ID of the child class (like GOALS or WINS).
+            amount: The amount to add to the statistic.
+            
+        Returns:
+            None
+        """
+        store = self.store
+        store.columns[era][self.row * store.width + stat] += amount
+        if store.dirty is not None:
+            store.dirty.add(self.row)
+        
+    def get_stat_id(self, era, stat):
+        """Get the amount of a stat given by IDs.
+        
+        This is the fast path of get_stat, for when the IDs are known.
+        
+        Args:
+            era: An era ID (GAME, SEASON, PLAYOFF, or CAREER).
+            stat: A stat ID of the child class (like GOALS or WINS).
+            
+        Returns:
+            An integer representing the amount of the stat.
+        """
+        return self.store.columns[era][self.row * self.store.width + stat]
+        
+    def get_stats(self, era):
+        """Get a dictionary of all the stats for the given era.
+        
+        Args:
+            era: A string for the era to get statistics for:
+                game, season, playoff, career
+                
+        Returns:
+            A dictionary whose keys are strings with stat names and whose
+            values are the integer amounts of those for the era.
+        """
+        start = self.row * self.store.width
+        values = self.store.columns[StatsStore.era_index[era]][start:start + self.store.width]
+        return dict(zip(self.store.stats, values))
         
     def show_stats(self, era):
         """Get a printable string of the team's stats for the given era.
@@ -146,8 +483,7 @@ class ParentStats(object):
         Returns:
             None
         """
-        for stat in self.stats[era]:
-            self.stats[era][stat] = 0
+        self.store.zero_row(self.row, StatsStore.era_index[era])
             
     def update_stats(self, fromera, toera):
         """Add stats in the given fromera to the given toera.
@@ -161,9 +497,7 @@ class ParentStats(object):
         Returns;
             None
         """
-        for stat in self.stats[fromera]:
-            self.add_stat(toera, stat, self.stats[fromera][stat])
-        self.zero_stats(fromera)
+        self.store.update_row(self.row, StatsStore.era_index[fromera], StatsStore.era_index[toera])
         
 
 class PlayerStats(ParentStats):
@@ -175,17 +509,14 @@ class PlayerStats(ParentStats):
     Goals, Assists, Minutes, Shots, Saves, and Goals Allowed.
     
     Class Attributes:
-        None
+        stat_names: The list of strings with the stat names kept.
+        default_store: The StatsStore players' stats are kept in until a 
+            League adopts them; it is weak, so the rows of discarded
+            players are reused.
         
     Attributes:
-        season_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the season.
-        playoff_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the playoff.
-        career_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the 
-            player's career.
-        stats: A list with season_stats, playoff_stats, and career_stats.
+        store: The StatsStore holding the stats.
+        row: The integer row of these stats in the store.
         
     Future:
         More stats
@@ -197,32 +528,22 @@ class PlayerStats(ParentStats):
         Relevant stats for each era
     """
     
-    def __init__(self):
+    stat_names = ["Goals", "Assists", "Minutes", "Shots", "Saves", "Goals Allowed"]
+    
+    __slots__ = ()
+    
+    def __init__(self, owner = None, store = None):
         """Inits a PlayerStats class.
         
         Args:
-            None
+            owner: The Player the stats belong to.
+            store: The StatsStore to keep the stats in; if None, the 
+                default_store is used.
             
         Returns:
             None
         """
-        super().__init__()
-        
-    def get_blank_stats(self):
-        """Get a blank stats.
-        
-        For v1, the stats kept are Goals, Assists, Minutes, Shots, Saves,
-        and Goals Allowed.
-        
-        Args:
-            None
-        
-        Returns:
-            A dictionary whose keys are strings that are stat names and whose
-            values are 0.
-        """
-        stats = {"Goals": 0, "Assists": 0, "Minutes": 0, "Shots": 0, "Saves": 0, "Goals Allowed": 0}
-        return stats
+        super().__init__(owner, store)
         
     def show_stats(self, era):
         """Get a printable string of the player's stats for the given era.
@@ -235,7 +556,7 @@ class PlayerStats(ParentStats):
             A printable string showing the player's statistics for the given
             era.
         """
-        cur_stats = self.stats[era]
+        cur_stats = self.get_stats(era)
         s = ""
         points = cur_stats["Goals"] + cur_stats["Assists"]
         s += "GAP: " + str(cur_stats["Goals"]) + "-" + str(cur_stats["Assists"]) + "-" + str(points)
@@ -256,16 +577,17 @@ class PlayerStats(ParentStats):
         Returns:
             A string summary of the player's stats for the given era.
         """
-        goals = self.stats[era]["Goals"]
-        assists = self.stats[era]["Assists"]
+        cur_stats = self.get_stats(era)
+        goals = cur_stats["Goals"]
+        assists = cur_stats["Assists"]
         points = goals + assists
         s = str(goals).rjust(6)
         s += str(assists).rjust(6)
         s += str(points).rjust(6)
-        s += str(self.stats[era]["Shots"]).rjust(6)
-        s += str(self.stats[era]["Minutes"]).rjust(7)
-        s += str(self.stats[era]["Saves"]).rjust(8)
-        s += str(self.stats[era]["Goals Allowed"]).rjust(7)
+        s += str(cur_stats["Shots"]).rjust(6)
+        s += str(cur_stats["Minutes"]).rjust(7)
+        s += str(cur_stats["Saves"]).rjust(8)
+        s += str(cur_stats["Goals Allowed"]).rjust(7)
         return s
         
 
@@ -278,17 +600,14 @@ class TeamStats(ParentStats):
     Wins, Losses, Ties, Goals For, and Goals Against.
     
     Class Attributes:
-        None
+        stat_names: The list of strings with the stat names kept.
+        default_store: The StatsStore teams' stats are kept in until a 
+            League adopts them; it is weak, so the rows of discarded
+            teams are reused.
         
     Attributes:
-        season_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the season.
-        playoff_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the playoff.
-        career_stats: A dictionary whose keys are strings with stat names
-            and whose values are the integer amounts of those for the 
-            player's career.
-        stats: A list with season_stats, playoff_stats, and career_stats.
+        store: The StatsStore holding the stats.
+        row: The integer row of these stats in the store.
         
     Future:
         More stats
@@ -298,36 +617,22 @@ class TeamStats(ParentStats):
         Relevant stats for each era
     """
     
-    def __init__(self):
+    stat_names = ["Wins", "Losses", "Ties", "Goals For", "Goals Against"]
+    
+    __slots__ = ()
+    
+    def __init__(self, owner = None, store = None):
         """Inits a TeamStats class.
         
         Args:
-            None
+            owner: The Team the stats belong to.
+            store: The StatsStore to keep the stats in; if None, the 
+                default_store is used.
             
         Returns:
             None
         """
-        super().__init__()
-        
-    def get_blank_stats(self):
-        """Get a blank stats.
-        
-        For v1, the stats kept are Wins, Losses, Ties, Goals For, and Goals
-        Against.
-        
-        Args:
-            None
-        
-        Returns:
-            A dictionary whose keys are strings that are stat names and whose
-            values are 0.
-        """
-        stats = {"Wins": 0, 
-            "Losses": 0, 
-            "Ties": 0, 
-            "Goals For": 0, 
-            "Goals Against": 0}
-        return stats
+        super().__init__(owner, store)
         
     def show_stats(self, era):
         """Get a printable string of the team's stats for the given era.
@@ -340,17 +645,18 @@ class TeamStats(ParentStats):
             A printable string showing the team's statistics for the given
             era.
         """
+        cur_stats = self.get_stats(era)
         s = ""
         s += "Record: " 
-        s += str(self.stats[era]["Wins"])
+        s += str(cur_stats["Wins"])
         s += "-" 
-        s += str(self.stats[era]["Losses"]) 
+        s += str(cur_stats["Losses"]) 
         s += "-" 
-        s += str(self.stats[era]["Ties"])
-        points = 2 * self.stats[era]["Wins"] + self.stats[era]["Ties"]
+        s += str(cur_stats["Ties"])
+        points = 2 * cur_stats["Wins"] + cur_stats["Ties"]
         s += "\nPoints: " + str(points)
-        s += "\nGoals For: " + str(self.stats[era]["Goals For"])
-        s += "\nGoals Against: " + str(self.stats[era]["Goals Against"])
+        s += "\nGoals For: " + str(cur_stats["Goals For"])
+        s += "\nGoals Against: " + str(cur_stats["Goals Against"])
         return s
         
     def get_statline(self):
@@ -366,4 +672,400 @@ class TeamStats(ParentStats):
             A string summary of the team's stats for the given era.
         """
         pass #TODO: v2
-                
\ No newline at end of file
+                        
+
+class Leaderboard(object):
+    
+    """The Leaderboard class.
+    
+    This is the class that ranks the owners in a StatsStore by one stat in 
+    one era. The ranking is kept sorted as stats change: only the rows that
+    changed are moved, so reading the top k is a slice.
+    
+    Class Attributes:
+        None
+        
+    Attributes:
+        store: The StatsStore being ranked.
+        era: The era ID ranked.
+        stat: The stat ID ranked.
+        keys: A sorted list of (-amount, row) for every owned row; ties are
+            in row order.
+        amounts: A dictionary of the form {row: amount in keys}.
+    """
+    
+    __slots__ = ("store", "era", "stat", "keys", "amounts")
+    
+    def __init__(self, store, era, stat):
+        """Inits a Leaderboard class.
+        
+        Args:
+            store: The StatsStore to rank.
+            era: The era ID to rank.
+            stat: The stat ID to rank.
+            
+        Returns:
+            None
+        """
+        self.store = store
+        self.era = era
+        self.stat = stat
+        self.rebuild()
+        
+    def rebuild(self):
+        """Rank every owned row afresh.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        column = self.store.columns[self.era]
+        width = self.store.width
+        self.amounts = {row: column[row * width + self.stat] 
+            for row, owner in enumerate(self.store.owners) if owner is not None}
+        self.keys = sorted((-amount, row) for row, amount in self.amounts.items())
+        
+    def update(self, rows):
+        """Move the given rows to their current places.
+        
+        Args:
+            rows: An iterable of rows that may have changed.
+            
+        Returns:
+            None
+        """
+        column = self.store.columns[self.era]
+        width = self.store.width
+        owners = self.store.owners
+        keys = self.keys
+        for row in rows:
+            old = self.amounts.get(row)
+            new = column[row * width + self.stat] if owners[row] is not None else None
+            if old == new:
+                continue
+            if old is not None:
+                del keys[bisect.bisect_left(keys, (-old, row))]
+                del self.amounts[row]
+            if new is not None:
+                bisect.insort(keys, (-new, row))
+                self.amounts[row] = new
+                
+    def get_leaders(self, n = float('inf'), include = None):
+        """Get the owners with the most of the stat.
+        
+        Args:
+            n: The number of owners to get; float('inf') for all of them.
+            include: A function taking an owner and returning True if it may
+                be listed; if None, every owner may be.
+            
+        Returns:
+            A list of owners (Players or Teams) from most to least.
+        """
+        owners = self.store.owners
+        if include is None:
+            keys = self.keys if n == float('inf') else self.keys[:n]
+            return [owners[row] for amount, row in keys]
+        leaders = []
+        for amount, row in self.keys:
+            if len(leaders) >= n:
+                break
+            if include(owners[row]):
+                leaders.append(owners[row])
+        return leaders
+        
+        
+class Leaderboards(object):
+    
+    """The Leaderboards class.
+    
+    This is the class that keeps a Leaderboard for every (era, stat) asked
+    about for one StatsStore, and brings them up to date from the store's 
+    changed rows before each read.
+    
+    Class Attributes:
+        None
+        
+    Attributes:
+        store: The StatsStore being ranked.
+        boards: A dictionary of the form {(era ID, stat ID): Leaderboard}.
+    """
+    
+    __slots__ = ("store", "boards")
+    
+    def __init__(self, store):
+        """Inits a Leaderboards class.
+        
+        Args:
+            store: The StatsStore to rank.
+            
+        Returns:
+            None
+        """
+        self.store = store
+        self.boards = {}
+        
+    def refresh(self):
+        """Bring every leaderboard up to date with the store.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        rows, all_dirty = self.store.take_dirty()
+        for board in self.boards.values():
+            if all_dirty:
+                board.rebuild()
+            elif rows:
+                board.update(rows)
+                
+    def get_leaders(self, era, stat, n = float('inf'), include = None):
+        """Get the owners with the most of the given stat in the given era.
+        
+        Args:
+            era: The era, a string (game, season, playoff, career) or an ID.
+            stat: The stat, a string (like Goals) or an ID.
+            n: The number of owners to get; float('inf') for all of them.
+            include: A function taking an owner and returning True if it may
+                be listed; if None, every owner may be.
+            
+        Returns:
+            A list of owners (Players or Teams) from most to least.
+        """
+        self.refresh()
+        era = get_era_id(era)
+        if not isinstance(stat, int):
+            stat = self.store.stat_index[stat]
+        board = self.boards.get((era, stat))
+        if board is None:
+            board = Leaderboard(self.store, era, stat)
+            self.boards[(era, stat)] = board
+        return board.get_leaders(n, include)
+        
+
+PlayerStats.default_store = StatsStore(PlayerStats.stat_names, weak = True)
+TeamStats.default_store = StatsStore(TeamStats.stat_names, weak = True)
+
+
+class Scoreboard(object):
+    
+    """The Scoreboard class.
+    
+    This is the class that keeps the statistics for a game (or a batch of
+    games) as they happen. Rather than updating each Player and Team as 
+    every minute is played, the counts are kept in a flat list with a slot 
+    per player and added to the players' and teams' stats once at the end.
+    
+    Class Attributes:
+        player_stats: The list of strings with the player stat names, in slot
+            order (so a player stat ID is its offset in the slot).
+        team_stats: The list of strings with the team stat names, in order
+            (so a team stat ID is its index).
+        
+    Attributes:
+        players: A list of the Players with a slot, in slot order.
+        slots: A dictionary of the form {player: index of the player's first 
+            stat in counts}.
+        counts: A list of integers; the stats of the player in slot s are at
+            s * len(player_stats) thru (s + 1) * len(player_stats) - 1.
+        teams: A dictionary of the form {team: list of team stat amounts}.
+    """
+    
+    __slots__ = ("players", "slots", "counts", "teams")
+    
+    player_stats = PlayerStats.stat_names
+    team_stats = TeamStats.stat_names
+    player_index = {stat: i for i, stat in enumerate(player_stats)}
+    team_index = {stat: i for i, stat in enumerate(team_stats)}
+    
+    def __init__(self):
+        """Inits an empty Scoreboard.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.clear()
+        
+    def clear(self):
+        """Remove every player, team, and count from the scoreboard.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.players = []
+        self.slots = {}
+        self.counts = []
+        self.teams = {}
+        
+    def get_slot(self, player):
+        """Get the index of the given player's first stat in counts.
+        
+        Players are given a slot the first time they are seen.
+        
+        Args:
+            player: The Player to get the slot for.
+            
+        Returns:
+            An integer, the index in counts of the player's first stat.
+        """
+        slot = self.slots.get(player)
+        if slot is None:
+            slot = len(self.counts)
+            self.slots[player] = slot
+            self.players.append(player)
+            self.counts += [0] * len(Scoreboard.player_stats)
+        return slot
+        
+    def add_stat(self, player, stat, amount):
+        """Add the given amount to the given player stat.
+        
+        Args:
+            player: The Player to add the stat for.
+            stat: The statistic to be adjusted:
+                Goals, Assists, Minutes, Shots, Saves, Goals Allowed
+            amount: The amount to add to the statistic.
+            
+        Returns:
+            None
+        """
+        self.counts[self.get_slot(player) + Scoreboard.player_index[stat]] += amount
+        
+    def add_stat_id(self, player, stat, amount):
+        """Add the given amount to the player stat with the given ID.
+        
+        Args:
+            player: The Player to add the stat for.
+            stat: A player stat ID (like GOALS).
+            amount: The amount to add to the statistic.
+            
+        Returns:
+            None
+        """
+        self.counts[self.get_slot(player) + stat] += amount
+        
+    def get_stat(self, player, stat):
+        """Get the amount of the given player stat so far.
+        
+        Args:
+            player: The Player to get the stat for.
+            stat: The statistic to be returned:
+                Goals, Assists, Minutes, Shots, Saves, Goals Allowed
+                
+        Returns:
+            An integer, the amount of the stat the player has on this 
+            scoreboard (0 for players who have not played).
+        """
+        slot = self.slots.get(player)
+        if slot is None:
+            return 0
+        return self.counts[slot + Scoreboard.player_index[stat]]
+        
+    def add_team_stat(self, team, stat, amount):
+        """Add the given amount to the given team stat.
+        
+        Args:
+            team: The Team to add the stat for.
+            stat: The statistic to be adjusted:
+                Wins, Losses, Ties, Goals For, Goals Against
+            amount: The amount to add to the statistic.
+            
+        Returns:
+            None
+        """
+        self.add_team_stat_id(team, Scoreboard.team_index[stat], amount)
+        
+    def add_team_stat_id(self, team, stat, amount):
+        """Add the given amount to the team stat with the given ID.
+        
+        Args:
+            team: The Team to add the stat for.
+            stat: A team stat ID (like GOALS_FOR).
+            amount: The amount to add to the statistic.
+            
+        Returns:
+            None
+        """
+        counts = self.teams.get(team)
+        if counts is None:
+            counts = [0] * len(Scoreboard.team_stats)
+            self.teams[team] = counts
+        counts[stat] += amount
+        
+    def get_team_stat(self, team, stat):
+        """Get the amount of the given team stat so far.
+        
+        Args:
+            team: The Team to get the stat for.
+            stat: The statistic to be returned:
+                Wins, Losses, Ties, Goals For, Goals Against
+                
+        Returns:
+            An integer, the amount of the stat the team has on this 
+            scoreboard.
+        """
+        if team not in self.teams:
+            return 0
+        return self.teams[team][Scoreboard.team_index[stat]]
+        
+    def flush(self, era):
+        """Add everything on the scoreboard to the given era and clear it.
+        
+        Only the players who played (have a slot) are touched.
+        
+        Args:
+            era: The era to add statistics to, a string (game, season, 
+                playoff, career) or an era ID.
+                
+        Returns:
+            None
+        """
+        era = get_era_id(era)
+        n = len(Scoreboard.player_stats)
+        counts = self.counts
+        for player in self.players:
+            slot = self.slots[player]
+            stats = player.stats
+            for i in range(n):
+                if counts[slot + i]:
+                    stats.add_stat_id(era, i, counts[slot + i])
+        for team, team_counts in self.teams.items():
+            stats = team.stats
+            for i in range(len(Scoreboard.team_stats)):
+                if team_counts[i]:
+                    stats.add_stat_id(era, i, team_counts[i])
+        self.clear()
+        
+
+def get_era_id(era):
+    """Get the ID of an era.
+    
+    Args:
+        era: A string for the era (game, season, playoff, career), or an era
+            ID, which is returned as is.
+            
+    Returns:
+        An integer, the era ID.
+    """
+    if isinstance(era, int):
+        return era
+    return StatsStore.era_index[era]
+    
+def get_zeros(n):
+    """Get an array of n zeroed stat amounts.
+    
+    Args:
+        n: The length of the array.
+        
+    Returns:
+        An array.array of StatsStore.typecode with n zeros.
+    """
+    return array.array(StatsStore.typecode, bytes(array.array(StatsStore.typecode).itemsize * n))
@@ -10,7 +10,7 @@ class Team(object):
     
     Class Attributes:
         team_dictionary: A dictionary of the form {team.name: team} to get
-            teams by their name.
+            teams made without a LeagueContext by their name.
         
     Attributes:
         name: A string representing the team's name.
@@ -18,6 +18,12 @@ class Team(object):
             lines) on the team.
         stats: A TeamStats object containing the stats the player has
             accumulated for each 'era': Season, Playoff, Career.
+        player_store: The Stats.StatsStore the stats of the players on the
+            roster are kept in (the league's), or None if the team is in no
+            league; players who join the team are moved into it.
+        released: A list of the players removed from the team since the 
+            league last recorded a season (kept only for a team in a league),
+            so the season's history can still credit their lines to it.
             
     Future:
         Awards
@@ -29,25 +35,35 @@ class Team(object):
         Team Philosophy
     """
     
+    __slots__ = ("name", "roster", "stats", "player_store", "released", "__weakref__")
+    
     team_dictionary = dict()
     
-    def __init__(self, name):
+    def __init__(self, name, context = None):
         """Inits a Team with a name.
         
         Initializes a team with blank stats and an empty roster.
         
         Args:
             name: A string representing the team's name.
+            context: The LeagueContext.LeagueContext to register the team in;
+                if None, it goes in team_dictionary.
             
         Returns:
             None
+            
+        Raises:
+            NameError: the name is already used in the registry.
         """
-        if name in Team.team_dictionary:
+        teams = Team.team_dictionary if context is None else context.teams
+        if name in teams:
             raise NameError("Name already used")
         self.name = name
-        Team.team_dictionary[self.name] = self
+        teams[self.name] = self
         self.roster = Roster()
-        self.stats = Stats.TeamStats()
+        self.stats = Stats.TeamStats(self)
+        self.player_store = None
+        self.released = []
         
     def __repr__(self):
         """Repr of the Team.
@@ -79,7 +95,8 @@ class Team(object):
         """Adds the given player to the team's roster.
         
         Note that the player is added to the Scratch line. This also sets the 
-        player's team attribute to this team.
+        player's team attribute to this team, and moves the player's stats 
+        into the team's player_store, if it has one.
         
         Args:
             player: The Player object to be added to the team's roster.
@@ -89,12 +106,52 @@ class Team(object):
         """
         self.roster.add_player(player)
         player.team = self
+        if self.player_store is not None:
+            self.player_store.adopt(player.stats)
+        
+    def add_players(self, players):
+        """Adds the given players to the team's roster at once.
+        
+        This is add_player for many players: the roster is sorted and the 
+        Scratch line rebuilt once rather than once per player. 
+        
+        Args:
+            players: A list of the Player objects to be added to the team's 
+                roster.
+        
+        Returns:
+            None
+        """
+        self.roster.add_players(players)
+        for player in players:
+            player.team = self
+            if self.player_store is not None:
+                self.player_store.adopt(player.stats)
+        
+    @classmethod
+    def from_players(cls, name, players, context = None):
+        """Make a team with the given players and default lines.
+        
+        Args:
+            name: A string representing the team's name.
+            players: A list of the Player objects to put on the roster.
+            context: The LeagueContext.LeagueContext to register the team in;
+                if None, it goes in team_dictionary.
+            
+        Returns:
+            The new Team, with its lines set by generate_default_lines.
+        """
+        team = cls(name, context)
+        team.add_players(players)
+        team.generate_default_lines()
+        return team
         
     def remove_player(self, player):
         """Removes the given player from the team's roster.
         
         Note that the player is also removed from any lines they are on, and 
-        that the player's team attribute is set to None.
+        that the player's team attribute is set to None. A team in a league
+        keeps the player in released.
         
         Args:
             player: The Player object to be removed from the team's roster.
@@ -104,6 +161,8 @@ class Team(object):
         """
         self.roster.remove_player(player)
         player.team = None
+        if self.player_store is not None:
+            self.released.append(player)
         
     def get_full_roster(self):
         """Gets a list of the players on the team's roster.
@@ -194,6 +253,46 @@ class Team(object):
         """
         return self.roster.show_lines()
         
+    def get_line_strengths(self):
+        """Get the summed ratings of every combination of lines.
+        
+        The table is cached and only recomputed after the lines or the 
+        players' ratings change.
+        
+        Args:
+            None
+            
+        Returns:
+            A list of 12 integers; entry o * 3 + d is the sum of the ratings
+            of offensive line o (L1 is 0) and defensive line d (D1 is 0).
+        """
+        return self.roster.get_line_strengths()
+        
+    def get_goalie_strength(self):
+        """Get the rating of the goalie on the G line.
+        
+        Args:
+            None
+            
+        Returns:
+            An integer, the rating of the team's goalie.
+        """
+        return self.roster.get_goalie_strength()
+        
+    def invalidate_strengths(self):
+        """Mark the cached line strengths as out of date.
+        
+        This happens automatically when the lines or roster change; it only 
+        needs to be called if a player's rating is changed directly.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.roster.invalidate_strengths()
+        
     def add_stat(self, era, stat, amount):
         """Adds to the accumulated statistics for the team.
         
@@ -342,22 +441,26 @@ class Team(object):
         """
         self.stats.update_stats(fromera, toera)
 
-    def age_year(self):
+    def age_year(self, rng = None, stats = True):
         """Complete end of year tasks and cleanup.
         
         Add season stats to career stats. Zero season stats and playoff
         stats. Age each player on the roster.
         
         Args:
-            None
+            rng: A random.Random to draw the players' rating changes from; if
+                None, the random module is used.
+            stats: If False, the team's and players' stats are left alone (a
+                League rolls over its whole stats stores at once instead).
             
         Returns:
             None
         """
-        self.update_stats("season", "career")
-        self.stats.zero_stats("playoff")
+        if stats:
+            self.update_stats("season", "career")
+            self.stats.zero_stats("playoff")
         for player in self.get_full_roster():
-            player.age_year()
+            player.age_year(rng, stats)
         self.roster.age_year()
             
             
@@ -377,6 +480,8 @@ class Roster(object):
         roster at that position. Those lists are sorted by player rating.
     """
     
+    __slots__ = ("roster", "lines")
+    
     positions = ["C", "LW", "RW", "D", "G"]
     
     def __init__(self):
@@ -419,6 +524,28 @@ class Roster(object):
         self.roster[player.position].append(player)
         self.sort_position(player.position)
         self.lines.update_scratches(self.get_full_roster())
+        self.lines.invalidate_strengths()
+        
+    def add_players(self, players):
+        """Adds the given players to the roster at once.
+        
+        Every player is put in place first; then each position is sorted and
+        the Scratch line rebuilt only once.
+        
+        Args:
+            players: A list of the Player objects to be added to the roster.
+        
+        Returns:
+            None
+        """
+        positions = set()
+        for player in players:
+            self.roster[player.position].append(player)
+            positions.add(player.position)
+        for position in positions:
+            self.sort_position(position)
+        self.lines.update_scratches(self.get_full_roster())
+        self.lines.invalidate_strengths()
         
     def remove_player(self, player):
         """Removes the given player from the roster.
@@ -549,6 +676,40 @@ class Roster(object):
         """
         return self.lines.show_lines()
         
+    def get_line_strengths(self):
+        """Get the summed ratings of every combination of lines.
+        
+        Args:
+            None
+            
+        Returns:
+            A list of 12 integers; entry o * 3 + d is the sum of the ratings
+            of offensive line o and defensive line d.
+        """
+        return self.lines.get_line_strengths()
+        
+    def get_goalie_strength(self):
+        """Get the rating of the goalie on the G line.
+        
+        Args:
+            None
+            
+        Returns:
+            An integer, the rating of the goalie.
+        """
+        return self.lines.get_goalie_strength()
+        
+    def invalidate_strengths(self):
+        """Mark the cached line strengths as out of date.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.lines.invalidate_strengths()
+        
     def get_stat_total(self, era, stat):
         """Get the total of the roster's players' given stat in the given era.
         
@@ -580,10 +741,34 @@ class Roster(object):
         for pos in Roster.positions:
             self.sort_position(pos)
         self.generate_default_lines()
+        self.lines.invalidate_strengths()
 
 
 class Lines(object):
     
+    """The Lines class.
+    
+    This is the class representing the lines a team dresses.
+    
+    Class Attributes:
+        olines: A list of strings, the names of the offensive lines.
+        dlines: A list of strings, the names of the defensive lines.
+    
+    Attributes:
+        lines: A dictionary whose keys are strings for the lines (L1, L2, L3,
+            L4, D1, D2, D3, G, Scratch) and whose values are lists of Players.
+        strengths: A list of 12 integers with the summed ratings of each 
+            offensive and defensive line combination, or None if it has to
+            be recomputed.
+        goalie_strength: The rating of the goalie, or None if it has to be
+            recomputed.
+    """
+    
+    __slots__ = ("lines", "strengths", "goalie_strength")
+    
+    olines = ["L1", "L2", "L3", "L4"]
+    dlines = ["D1", "D2", "D3"]
+    
     def __init__(self):
         """Inits a Lines with no players and empty lines.
         
@@ -594,6 +779,8 @@ class Lines(object):
             None
         """
         self.lines = self.get_initial_lines()
+        self.strengths = None
+        self.goalie_strength = None
         
     def get_initial_lines(self):
         """Gets blank lines.
@@ -650,6 +837,7 @@ class Lines(object):
         self.lines["D3"] = roster["D"][4:6]
         self.lines["G"] = [roster["G"][0]]
         self.lines["Scratch"] = roster["C"][4:] + roster["LW"][4:] + roster["RW"][4:] + roster["D"][6:] + roster["G"][1:]
+        self.invalidate_strengths()
         
     def remove_player(self, player):
         """Remove the given player from all lines.
@@ -667,6 +855,7 @@ class Lines(object):
             for p in self.lines[line]:
                 if p == player:
                     self.lines[line][self.lines[line].index(p)] = None
+        self.invalidate_strengths()
         
     def set_line(self, line, players):
         """Set the given line to the given list of players.
@@ -684,26 +873,23 @@ class Lines(object):
             None
         """
         self.lines[line] = players
+        self.invalidate_strengths()
         
     def update_scratches(self, players):
         """Put any players on roster but not on any other line in Scratch.
         
         Args:
-            players: The list of {layers to be put checked.
+            players: The list of Players to be checked, in the order the 
+                Scratch line should keep.
             
         Returns:
             None
         """
-        to_remove = set()
+        lined = set()
         for line in self.lines:
             if line != "Scratch":
-                if (type(self.lines[line])) == "Player":
-                    print(line)
-                for p in self.lines[line]:
-                    to_remove.add(p)
-        for p in to_remove:
-            players.remove(p)
-        self.lines["Scratch"] = players
+                lined.update(self.lines[line])
+        self.lines["Scratch"] = [p for p in players if p not in lined]
         
     def get_line(self, line):
         """Get a list of the players on the given line.
@@ -719,6 +905,63 @@ class Lines(object):
         """
         return self.lines[line]
         
+    def invalidate_strengths(self):
+        """Mark the cached line strengths as out of date.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.strengths = None
+        self.goalie_strength = None
+        
+    def get_line_rating(self, line):
+        """Get the sum of the ratings of the players on the given line.
+        
+        Empty spots on the line (None) count as 0.
+        
+        Args:
+            line: A string for the line to get; L1, L2, L3, L4, D1, D2, D3, G
+            
+        Returns:
+            An integer, the sum of the ratings on the line.
+        """
+        return sum(p.rating for p in self.lines[line] if p is not None)
+        
+    def get_line_strengths(self):
+        """Get the summed ratings of every combination of lines.
+        
+        The table is computed on the first call after the lines change and 
+        cached until they change again.
+        
+        Args:
+            None
+            
+        Returns:
+            A list of 12 integers; entry o * 3 + d is the sum of the ratings
+            of offensive line o and defensive line d.
+        """
+        if self.strengths is None:
+            oratings = [self.get_line_rating(l) for l in Lines.olines]
+            dratings = [self.get_line_rating(l) for l in Lines.dlines]
+            self.strengths = [o + d for o in oratings for d in dratings]
+        return self.strengths
+        
+    def get_goalie_strength(self):
+        """Get the rating of the goalie on the G line.
+        
+        Args:
+            None
+            
+        Returns:
+            An integer, the rating of the goalie (cached like the lines).
+        """
+        if self.goalie_strength is None:
+            self.goalie_strength = self.get_line_rating("G")
+        return self.goalie_strength
+        
     def show_lines(self):
         """Get a printable string showing each line.
         
@@ -742,16 +985,20 @@ class Lines(object):
         return s
 
 
-def get_team_names():
+def get_team_names(rng = None):
     """Generate the list of team names.
     
-    This opens the file TeamNames.txt and uses the names inside to create a
-    global variable, team_name_list. We expect TeamNames.txt to have one
-    name per line, each of which is a plural team name. This is called
-    when this module is imported or ran.
+    This opens the file TeamNames.txt and uses the names inside to create the
+    global variables team_names, a tuple of every name, and team_name_list,
+    the names not yet used outside a LeagueContext. We expect TeamNames.txt 
+    to have one name per line, each of which is a plural team name. This is
+    called when this module is imported or ran. The names are left in file order 
+    (generate_name draws from them at random) so that a seeded draw gives
+    the same name in every process.
     
     Args:
-        None
+        rng: A random.Random to shuffle the names with; if None, they are not
+            shuffled.
         
     Returns:
         None
@@ -759,58 +1006,74 @@ def get_team_names():
     Raises:
         FileNotFoundError: the file TeamNames.txt was not in the directory
     """
-    global team_name_list
+    global team_names, team_name_list
     try:
         with open('TeamNames.txt', 'r') as f:
-            team_name_list = [line.rstrip() for line in f]
+            team_names = tuple(line.rstrip() for line in f)
     except FileNotFoundError:
         print("TeamNames.txt not found - random teams cannot be created")
+        team_names = ()
         return
-    random.shuffle(team_name_list)
+    team_name_list = list(team_names)
+    if rng is not None:
+        rng.shuffle(team_name_list)
        
-def generate_name():
-    """Pop a team name from team_name_list.
+def generate_name(rng = None, names = None):
+    """Pop a random team name from team_name_list.
     
     This is expected to be used to generate a random team name in 
     create_random_team. If there are no more team names remaining,
     then this will print that fact and return with no name.
     
     Args:
-        None
+        rng: A random.Random to choose the name with; if None, the random
+            module is used.
+        names: The list of names to pop from; if None, team_name_list.
     
     Returns:
         A string to be used as a random team name.
     """
-    global team_name_list
-    if len(team_name_list) == 0:
+    if names is None:
+        names = team_name_list
+    if len(names) == 0:
         print("No more team names found - random teams cannot be created")
         return
-    tname = team_name_list.pop()
+    if rng is None:
+        rng = random
+    tname = names.pop(rng.randrange(len(names)))
     return tname
            
-def create_random_team():
+def create_random_team(rng = None, context = None):
     """Generate a random team.
     
     This creates a random team with 4 each of C, LW, RW, 6 D, and 2 G.
     
     Args:
-        None
+        rng: A random.Random to draw the team's name and players from; if 
+            None, the random module is used.
+        context: The LeagueContext.LeagueContext to take the name from and
+            register the team and players in; if None, the global 
+            team_name_list and registries are used.
         
     Returns:
         A randomly generated Team.
     """
-    name = generate_name()
+    if context is None:
+        name = generate_name(rng)
+    else:
+        name = context.generate_team_name(rng)
     if name == None:
         return
-    team = Team(name)
+    if name in (Team.team_dictionary if context is None else context.teams):
+        raise NameError("Name already used")
+    players = []
     for i in range(4):
         for pos in ["C", "LW", "RW"]:
-            team.add_player(Player.create_random_player(pos))
+            players.append(Player.create_random_player(pos, rng, context))
     for j in range(6):
-        team.add_player(Player.create_random_player("D"))
+        players.append(Player.create_random_player("D", rng, context))
     for k in range(2):
-        team.add_player(Player.create_random_player("G"))
-    team.generate_default_lines()
-    return team
+        players.append(Player.create_random_player("G", rng, context))
+    return Team.from_players(name, players, context)
    
 get_team_names()
\ No newline at end of file
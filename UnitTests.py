@@ -36,6 +36,68 @@ def player_tests():
     assert p.get_stat("season", "Assists") == 0
     assert p.get_stat("career", "Assists") == 5
     
+    #checking: stats live in a store and can move between stores
+    import Stats
+    store = Stats.StatsStore(Stats.PlayerStats.stat_names)
+    store.adopt(p.stats)
+    assert p.stats.store is store
+    assert p.get_stat("career", "Assists") == 5
+    q = Player.create_random_player()
+    store.adopt(q.stats)
+    q.add_stat("season", "Goals", 3)
+    q.add_stat("playoff", "Goals", 1)
+    store.update_era("season", "career")
+    store.zero_era("playoff")
+    assert q.get_stat("career", "Goals") == 3 and q.get_stat("season", "Goals") == 0
+    assert q.get_stat("playoff", "Goals") == 0
+    assert p.get_stat("career", "Assists") == 5 and p.get_stat("career", "Saves") == 30
+    
+    #checking: integer IDs reach the same stats as the names
+    assert Stats.PlayerStats.stat_names[Stats.GOALS_ALLOWED] == "Goals Allowed"
+    assert Stats.TeamStats.stat_names[Stats.GOALS_FOR] == "Goals For"
+    assert Stats.StatsStore.eras[Stats.PLAYOFF] == "playoff"
+    q.stats.add_stat_id(Stats.SEASON, Stats.SAVES, 4)
+    assert q.get_stat("season", "Saves") == 4
+    assert q.stats.get_stat_id(Stats.CAREER, Stats.GOALS) == 3
+
+    #checking: names stay unique without growing
+    import LeagueContext, random
+    context = LeagueContext.LeagueContext()
+    names = [Player.Player("Al Ek", 20, "C", 50, context = context).name for i in range(3)]
+    assert names == ["Al Ek", "Al Ek 2", "Al Ek 3"]
+    assert Player.Player("Al Ek 4", 20, "C", 50, context = context).name == "Al Ek 4"
+    assert Player.Player("Al Ek", 20, "C", 50, context = context).name == "Al Ek 5"
+    assert context.get_player("Al Ek 2").name == "Al Ek 2"
+    names = Player.generate_names(50, random.Random(2))
+    assert len(names) == 50 and all(len(name.split(" ")) == 2 for name in names)
+
+    #checking: players made in bulk are like ones made one at a time
+    players = Player.create_random_players(30, ["G"] * 30, random.Random(3), context)
+    assert len(players) == 30 and len(context.players) == 35
+    assert all(p.position == "G" and 18 <= p.age < 40 and 40 <= p.rating < 90 for p in players)
+    assert len(set(p.stats.row for p in players)) == 30
+    players[-1].add_stat("season", "Saves", 7)
+    assert players[-1].get_stat("season", "Saves") == 7 and players[0].get_stat("season", "Saves") == 0
+    again = Player.create_random_players(30, ["G"] * 30, random.Random(3), LeagueContext.LeagueContext())
+    assert [p.name for p in again] == [p.name for p in players]
+    assert len(Player.create_random_players(4)) == 4
+    
+    #checking: players nobody keeps give their stats rows back
+    import gc
+    store = Stats.PlayerStats.default_store
+    temp = LeagueContext.LeagueContext()
+    rows = set(Player.Player("Temp " + str(i), 20, "C", 50, context = temp).stats.row for i in range(10))
+    assert len(rows) == 10 and all(store.get_owner(row) is not None for row in rows)
+    del temp
+    gc.collect()
+    assert all(store.get_owner(row) is None for row in rows) and rows <= set(store.free)
+    size = len(store.owners)
+    store.reserve(len(store.free))
+    kept = Player.create_random_players(len(store.free), context = LeagueContext.LeagueContext())
+    assert len(store.owners) == size and not store.free
+    store.reserve(3)
+    assert len(store.owners) == size + 3 and store.free == [size + 2, size + 1, size]
+
     print("Player Tests Passed")
     
 def team_tests():
@@ -85,7 +147,34 @@ def team_tests():
     t.remove_player(p)
     assert t.get_line("L1")[0] == None
     assert p.team == None
-    
+
+    #checking: from_players matches adding the players one by one
+    players = [Player.create_random_player(pos) for pos in ["C", "LW", "RW"] * 5 + ["D"] * 7 + ["G"] * 3]
+    bulk = Team.Team.from_players(Team.generate_name(), players)
+    single = Team.Team(Team.generate_name())
+    for p in players:
+        single.add_player(p)
+    single.generate_default_lines()
+    assert bulk.get_full_roster() == single.get_full_roster()
+    for line in ["L1", "D3", "G", "Scratch"]:
+        assert bulk.get_line(line) == single.get_line(line)
+    assert len(bulk.get_line("Scratch")) == 6
+    assert all(p.team == single for p in players)
+
+    #line strengths are cached and follow line changes
+    t.generate_default_lines()
+    strengths = t.get_line_strengths()
+    assert len(strengths) == 12
+    l1 = sum(p.rating for p in t.get_line("L1"))
+    d2 = sum(p.rating for p in t.get_line("D2"))
+    assert strengths[1] == l1 + d2
+    assert t.get_line_strengths() is strengths
+    assert t.get_goalie_strength() == t.get_line("G")[0].rating
+    t.set_line("L1", t.get_line("L4"))
+    assert t.get_line_strengths()[0] == t.get_line_strengths()[9]
+    t.age_year()
+    assert t.get_line_strengths()[1] == sum(p.rating for p in t.get_line("L1") + t.get_line("D2"))
+
     print("Team Tests Passed")
     
 def game_tests():
@@ -138,39 +227,42 @@ def game_tests():
     lines = setup_lines(g)
     g.process_result(g.team1, g.team2, lines[0], lines[1], "Miss")
     for player in lines[0]:
-        assert player.get_stat("game", "Minutes") == 1
-        assert player.get_stat("game", "Shots") in (0, 1)
-        assert player.get_stat("game", "Goals") == 0
-    assert g.team1.get_roster_total("game", "Minutes") == 6
-    assert g.team1.get_roster_total("game", "Shots") == 1
-    assert g.team1.get_roster_total("game", "Goals") == 0
+        assert g.get_player_stat(player, "Minutes") == 1
+        assert g.get_player_stat(player, "Shots") in (0, 1)
+        assert g.get_player_stat(player, "Goals") == 0
+    assert g.get_roster_total(g.team1, "Minutes") == 6
+    assert g.get_roster_total(g.team1, "Shots") == 1
+    assert g.get_roster_total(g.team1, "Goals") == 0
     for player in lines[1]:
-        assert player.get_stat("game", "Minutes") == 1
-        assert player.get_stat("game", "Saves") in (0, 1)
-        assert player.get_stat("game", "Goals Allowed") == 0
-    assert g.team2.get_roster_total("game", "Minutes") == 6
-    assert g.team2.get_roster_total("game", "Saves") == 1
-    assert g.team2.get_roster_total("game", "Goals Allowed") == 0
+        assert g.get_player_stat(player, "Minutes") == 1
+        assert g.get_player_stat(player, "Saves") in (0, 1)
+        assert g.get_player_stat(player, "Goals Allowed") == 0
+    assert g.get_roster_total(g.team2, "Minutes") == 6
+    assert g.get_roster_total(g.team2, "Saves") == 1
+    assert g.get_roster_total(g.team2, "Goals Allowed") == 0
     #checking: player, team stats tracked correctly, game, goal
     g = setup_game()
     lines = setup_lines(g)
     g.process_result(g.team1, g.team2, lines[0], lines[1], "Goal")
     for player in lines[0]:
-        assert player.get_stat("game", "Minutes") == 1
-        assert player.get_stat("game", "Shots") in (0, 1)
-        assert player.get_stat("game", "Goals") in (0, 1)
-    assert g.team1.get_roster_total("game", "Minutes") == 6
-    assert g.team1.get_roster_total("game", "Shots") == 1
-    assert g.team1.get_roster_total("game", "Goals") == 1
+        assert g.get_player_stat(player, "Minutes") == 1
+        assert g.get_player_stat(player, "Shots") in (0, 1)
+        assert g.get_player_stat(player, "Goals") in (0, 1)
+    assert g.get_roster_total(g.team1, "Minutes") == 6
+    assert g.get_roster_total(g.team1, "Shots") == 1
+    assert g.get_roster_total(g.team1, "Goals") == 1
     for player in lines[1]:
-        assert player.get_stat("game", "Minutes") == 1
-        assert player.get_stat("game", "Saves") == 0
-        assert player.get_stat("game", "Goals Allowed") in (0, 1)
-    assert g.team2.get_roster_total("game", "Minutes") == 6
-    assert g.team2.get_roster_total("game", "Saves") == 0
-    assert g.team2.get_roster_total("game", "Goals Allowed") == 1
+        assert g.get_player_stat(player, "Minutes") == 1
+        assert g.get_player_stat(player, "Saves") == 0
+        assert g.get_player_stat(player, "Goals Allowed") in (0, 1)
+    assert g.get_roster_total(g.team2, "Minutes") == 6
+    assert g.get_roster_total(g.team2, "Saves") == 0
+    assert g.get_roster_total(g.team2, "Goals Allowed") == 1
     #checking: player, team stats tracked correctly, game, season
+    assert g.get_team_stat(g.team1, "Goals For") == 1
+    assert g.team1.get_stat("game", "Goals For") == 0
     g.update_stats()
+    assert g.get_roster_total(g.team1, "Minutes") == 0
     for player in lines[0]:
         assert player.get_stat("season", "Minutes") == 1
         assert player.get_stat("season", "Shots") in (0, 1)
@@ -207,7 +299,76 @@ def game_tests():
     assert g.team2.get_roster_total("playoff", "Goals Allowed") == 0
     #want to check: overtime triggered correctly
     #cannot figure out how to check this without altering class methods
+
+    #checking: shot probabilities come from the table
+    import math
+    assert Game.get_shot_prob(0) == 0.5
+    assert abs(Game.get_shot_prob(40) - 1 / (1 + math.exp(2))) < 1e-12
+    assert abs(Game.get_shot_prob(10000) - 1 / (1 + math.exp(500))) < 1e-12
+    Game.set_shot_coefficient(0.1)
+    assert abs(Game.get_shot_prob(-40) - 1 / (1 + math.exp(-4))) < 1e-12
+    Game.set_shot_coefficient(5)
+    assert Game.get_shot_prob(Game.max_advantage) == 0.0 and Game.get_shot_prob(-Game.max_advantage) == 1.0
+    assert abs(Game.get_shot_prob(-0.5) - 1 / (1 + math.exp(-2.5))) < 1e-12
+    assert Game.get_shot_prob(10 ** 6) == 0.0 and Game.get_shot_prob(-10 ** 6) == 1.0
+    Game.set_shot_coefficient(0.05)
+
+    #checking: the event engine plays the same game
+    g = setup_game()
+    g.engine = "event"
+    g.era = "playoff"
+    g.play_game()
+    assert g.team1.get_stat("game", "Goals For") == 0
+    assert g.team1.get_stat("playoff", "Ties") == 0
+    assert g.team1.get_stat("playoff", "Wins") + g.team1.get_stat("playoff", "Losses") == 1
+    assert g.team1.get_roster_total("playoff", "Goals") == g.team1.get_stat("playoff", "Goals For")
+    assert g.team2.get_roster_total("playoff", "Goals Allowed") == g.team1.get_stat("playoff", "Goals For")
+    minutes = g.team1.get_line("G")[0].get_stat("playoff", "Minutes")
+    assert minutes >= 60
+    assert g.team1.get_roster_total("playoff", "Minutes") == 6 * minutes
+    shots = g.team1.get_roster_total("playoff", "Shots") + g.team2.get_roster_total("playoff", "Shots")
+    assert shots == minutes
+    scores = Game.play_games_batch([[g.team1, g.team2]] * 10, engine = "event")
+    assert g.team1.get_stat("season", "Goals For") == sum(s[0] for s in scores)
+
+    #checking: batch games go straight into the era's stats
+    g = setup_game()
+    scores = Game.play_games_batch([[g.team1, g.team2], [g.team2, g.team1]])
+    assert len(scores) == 2
+    assert g.team1.get_stat("game", "Goals For") == 0
+    assert g.team1.get_stat("season", "Goals For") == scores[0][0] + scores[1][1]
+    assert g.team1.get_roster_total("season", "Goals") == g.team1.get_stat("season", "Goals For")
+    games = g.team1.get_stat("season", "Wins") + g.team1.get_stat("season", "Losses") + g.team1.get_stat("season", "Ties")
+    assert games == 2
+    shots = g.team1.get_roster_total("season", "Shots") + g.team2.get_roster_total("season", "Shots")
+    minutes = g.team1.get_line("G")[0].get_stat("season", "Minutes")
+    assert shots == minutes
+    assert g.team2.get_roster_total("season", "Saves") + g.team2.get_stat("season", "Goals Against") == g.team1.get_roster_total("season", "Shots")
+
+    #checking: exact result probabilities
+    margin = Game.get_margin_distribution(0.1, 0.2, 2)
+    assert [round(x, 12) for x in margin] == [0.04, 0.28, 0.53, 0.14, 0.01]
+    win, loss, tie = Game.get_result_probabilities(0.1, 0.2)
+    assert abs(win + loss + tie - 1) < 1e-12 and win < loss
+    win, loss, tie = Game.get_result_probabilities(0.1, 0.1, "playoff")
+    assert abs(win - 0.5) < 1e-12 and tie < 1e-12
     
+    final = Game.get_final_margin_distribution(0.1, 0.1, "playoff")
+    assert abs(sum(final) - 1) < 1e-12 and final[60] < 1e-12
+    
+    #checking: the exact game distribution agrees with the engines
+    import random
+    g = setup_game()
+    d = Game.get_matchup_distribution(g.team1, g.team2)
+    assert abs(sum(d["Scores"].values()) - 1) < 1e-9
+    assert abs(sum(p for s, p in d["Scores"].items() if s[0] > s[1]) - d["Wins"]) < 1e-9
+    assert abs(sum(d["Goals For"]) - 1) < 1e-9
+    scores = Game.play_games_batch([[g.team1, g.team2]] * 2000, rng = random.Random(1))
+    for result, n in [("Wins", sum(a > b for a, b in scores)), ("Ties", sum(a == b for a, b in scores))]:
+        p = d[result]
+        assert abs(n - 2000 * p) < 5 * (2000 * p * (1 - p)) ** 0.5 + 1
+    mean = sum(n * p for n, p in enumerate(d["Goals For"]))
+    assert abs(sum(s[0] for s in scores) / 2000 - mean) < 0.2
     
     print("Game Tests Passed")
 
@@ -222,12 +383,267 @@ def league_tests():
     
     l = League.create_random_league()
     
+    #checking: each league has its own registries and name pool
+    import LeagueContext, Player, Team
+    players, teams = len(Player.Player.player_dict), len(Team.Team.team_dictionary)
+    a = League.create_random_league(seed = 5)
+    b = League.create_random_league(seed = 5)
+    assert [t.name for t in a.teams] == [t.name for t in b.teams]
+    assert a.teams[0] is not b.teams[0] and a.context.get_team(a.teams[0].name) is a.teams[0]
+    assert len(a.context.players) == 32 * 20
+    assert (len(Player.Player.player_dict), len(Team.Team.team_dictionary)) == (players, teams)
+    context = LeagueContext.LeagueContext()
+    names = [context.generate_team_name() for i in range(len(Team.team_names) + 1)]
+    assert len(set(names)) == len(names) and names[-1].endswith(" 2")
+    
+    #checking: games replay from their seeds
+    l = League.create_random_league(seed = 7)
+    l.simulate_to_day([0, 1, 0])
+    for game in range(16):
+        g = l.replay_game([0, 0, game])
+        for team in (g.team1, g.team2):
+            assert g.get_team_stat(team, "Goals For") == team.get_stat("season", "Goals For")
+            assert g.get_team_stat(team, "Wins") == team.get_stat("season", "Wins")
+        for player in g.team1.get_full_roster():
+            assert g.get_player_stat(player, "Shots") == player.get_stat("season", "Shots")
+    assert l.get_rng("season", 3).random() == League.derive_rng(7, "season", 3).random()
+    assert all(team.stats.store is l.team_stats for team in l.teams)
+    assert all(p.stats.store is l.player_stats for p in l.teams[0].get_full_roster())
+    
+    #checking: seasons are shuffles of the cached schedule template
+    matchups, starts = League.get_schedule_template()
+    assert len(matchups) == 80 * 16 * 2 and list(starts) == list(range(0, 80 * 16 + 1, 16))
+    assert l.season.matchups is matchups
+    template = League.RegularSeasonSchedule()
+    for day in range(80):
+        games = l.season.schedule[day]
+        assert games == l.season.get_day(day)
+        assert games[5] == l.season.get_next_game([0, day, 5])
+        assert [[l.teams.index(t) for t in game] for game in games] == template[l.season.day_order[day]]
+    
+    #checking: the calendar's slots, rounds, and hooks
+    calendar = l.calendar
+    assert calendar.round_starts == [0, 80, 87, 94, 101, 108]
+    assert len(calendar.days) == 80 * 16 + 7 * (8 + 4 + 2 + 1)
+    assert calendar.get_slot(80, 0) == 1280 and calendar.get_date(1283) == (80, 3)
+    assert calendar.get_slot(80, 9) == calendar.get_slot(81, 0)
+    assert calendar.hooks[1280] == ["start_playoffs"]
+    assert calendar.hooks[calendar.get_slot(87, 0)] == ["start_next_playoff_round"]
+    assert calendar.get_next_hook(0) == 1280 and l.slot == calendar.get_slot(*l.date[1:])
+    
+    #checking: schedules for other shapes of league
+    for shape in [(2, 4, 4), (2, 3, 3), (3, 5, 7), (1, 1, 5)]:
+        League.check_schedule(League.get_league_schedule(*shape), *shape)
+    schedule = League.get_league_schedule(2, 2, 2)
+    schedule[0] = schedule[-1]
+    try:
+        League.check_schedule(schedule, 2, 2, 2)
+        assert False
+    except ValueError:
+        pass
+    small = League.create_random_league(seed = 3, n_teams = 18, div_names = ["East", "Central", "West"])
+    assert [len(small.team_align["National"][div]) for div in small.div_names] == [3, 3, 3]
+    assert small.season.days == 57
+    assert len(small.get_playoff_teams("American")) == 8
+    small.simulate_to_day([1, 0, 0])
+    games = 4 * 2 + 3 * 6 + 2 * 9
+    assert all(team.get_stat("career", "Wins") + team.get_stat("career", "Losses") + 
+        team.get_stat("career", "Ties") == games for team in small.teams)
+    
+    #checking: a day played by workers is the same as one game at a time
+    before = {team: team.get_stat("season", "Goals For") for team in l.teams}
+    l.play_day(workers = 2)
+    l.close()
+    assert l.date == [0, 2, 0]
+    for game in range(16):
+        g = l.replay_game([0, 1, game])
+        for team in (g.team1, g.team2):
+            goals = team.get_stat("season", "Goals For") - before[team]
+            assert g.get_team_stat(team, "Goals For") == goals
+    
+    #checking: leaderboards follow the stats
+    players = []
+    for team in l.teams:
+        players += team.get_full_roster()
+    for stat in ("Goals", "Saves"):
+        leaders = l.get_league_leaders("season", stat)
+        assert len(leaders) == len(players)
+        amounts = [p.get_stat("season", stat) for p in leaders]
+        assert amounts == sorted(amounts, reverse = True)
+    top = l.get_league_leaders("season", "Goals", 3)
+    top[2].add_stat("season", "Goals", 1000)
+    assert l.get_league_leaders("season", "Goals", 1) == [top[2]]
+    top[2].add_stat("season", "Goals", -1000)
+    assert l.get_league_leaders("season", "Goals", 3) == top
+    
+    #checking: only players on the league's teams lead
+    import Player
+    extra = Player.create_random_player("D", context = l.context)
+    l.teams[1].add_player(extra)
+    extra.add_stat("season", "Goals", 1000)
+    assert l.get_league_leaders("season", "Goals", 1) == [extra]
+    assert len(l.get_league_leaders("season", "Goals")) == len(players) + 1
+    l.teams[1].remove_player(extra)
+    assert l.get_league_leaders("season", "Goals", 3) == top
+    assert "None" not in l.show_league_leaders("season", "Goals", 3)
+    assert extra not in l.get_league_leaders("season", "Goals")
+    
+    #checking: reads with no changes in between do not rebuild
+    import Stats
+    board = l.leaders.boards[(Stats.SEASON, Stats.GOALS)]
+    keys = board.keys
+    l.get_league_leaders("season", "Goals", 3)
+    assert board.keys is keys and l.player_stats.dirty == set()
+    l.standings.get_ranking()
+    groups = l.standings.groups
+    l.standings.get_ranking()
+    assert l.standings.groups is groups and l.team_stats.dirty == set()
+    top[0].add_stat("season", "Goals", 1)
+    assert l.player_stats.dirty == {top[0].stats.row}
+    l.get_league_leaders("season", "Goals", 3)
+    assert board.keys is keys
+    top[0].add_stat("season", "Goals", -1)
+    
+    #checking: projections
+    p = l.project(50)
+    for team in l.teams:
+        assert min(p[team]["Wins"]) >= team.get_stat("season", "Wins")
+        assert abs(sum(p[team]["Seed"].values()) - 1) < 1e-9
+    for r, teams in enumerate([16, 8, 4, 2, 1]):
+        assert abs(sum(p[team]["Rounds"][r] for team in l.teams) - teams) < 1e-9
+    
+    #checking: exact series and bracket probabilities
+    assert League.get_series_probability(0.5) == 0.5
+    assert League.get_series_probability(0.5, 3, 0) == 0.9375
+    assert abs(League.get_series_probability(0.6, 2, 3) - 0.36) < 1e-12
+    assert League.get_series_probability(0.1, 4, 2) == 1.0
+    l.simulate_to_day([0, 80, 0])
+    
+    #checking: standings rank by points, wins, and goal differential
+    def record(team):
+        wins = team.get_stat("season", "Wins")
+        points = 2 * wins + team.get_stat("season", "Ties")
+        differential = team.get_stat("season", "Goals For") - team.get_stat("season", "Goals Against")
+        return (points, wins, differential)
+    ranking = l.standings.get_ranking("American")
+    assert len(ranking) == 16
+    for a, b in zip(ranking, ranking[1:]):
+        assert record(a) >= record(b)
+    division = l.team_align["National"]["East"]
+    ranking = l.standings.get_ranking("National", "East")
+    assert sorted(ranking, key = l.teams.index) == division
+    assert l.standings.get_rank(ranking[2], "National", "East") == 2
+    assert l.get_playoff_teams("National")[:4] == l.order_teams_by_record(
+        [l.standings.get_ranking("National", div)[0] for div in League.League.div_names])
+    
+    a = l.playoff.get_advancement_probabilities()
+    assert len(a) == 16
+    for r, teams in enumerate([16, 8, 4, 2, 1]):
+        assert abs(sum(a[team][r] for team in a) - teams) < 1e-9
+    for team, p in l.playoff.get_series_probabilities().items():
+        assert abs(a[team][1] - p) < 1e-12
+    
+    #checking: playoff series follow their games
+    l.simulate_to_day([0, 85, 0])
+    assert len(l.playoff.series) == 8
+    for game, series in enumerate(l.playoff.series):
+        for team in (series.team1, series.team2):
+            assert series.get_wins(team) == team.get_stat("playoff", "Wins")
+        if series.winner is not None:
+            assert series.get_games_remaining() == 0
+            assert series.get_loser() not in l.playoff.am_teams + l.playoff.na_teams
+            assert l.playoff.get_next_game([0, 85, game]) == [None, None]
+        else:
+            assert series.wins1 + series.wins2 + series.get_games_remaining() == 7
+            assert l.playoff.get_next_game([0, 85, game]) == [series.team1, series.team2]
+    
+    #checking: a player who joins a league team has stats kept by the league
+    import Player
+    joined = Player.create_random_player("C", context = l.context)
+    l.teams[0].add_player(joined)
+    assert joined.stats.store is l.player_stats
+    joined.add_stat("season", "Minutes", 5)
+    
+    #checking: a player removed mid-season keeps the season in the history
+    scorer = max(l.teams[2].get_full_roster(), key = lambda p: p.get_stat("season", "Goals"))
+    scored = {stat: scorer.get_stat("season", stat) for stat in ("Goals", "Assists", "Minutes")}
+    l.teams[2].remove_player(scorer)
+    l.teams[2].add_player(Player.create_random_player(scorer.position, context = l.context))
+    l.teams[2].generate_default_lines()
+    
+    #checking: a saved league loads as it was
+    import os, tempfile
+    path = os.path.join(tempfile.mkdtemp(), "league.bin")
+    l.save(path)
+    copy = League.League.load(path)
+    assert copy.date == l.date and copy.slot == l.slot and copy.seed == l.seed
+    assert [t.name for t in copy.teams] == [t.name for t in l.teams]
+    assert copy.teams[3].show_lines() == l.teams[3].show_lines()
+    assert copy.teams[3].get_line("L1")[0].team is copy.teams[3]
+    assert copy.show_standings() == l.show_standings()
+    assert [(s.team1.name, s.wins1, s.wins2) for s in copy.playoff.series] == [
+        (s.team1.name, s.wins1, s.wins2) for s in l.playoff.series]
+    with open(path, "wb") as f:
+        f.write(b"not a league")
+    try:
+        League.League.load(path)
+        assert False
+    except ValueError:
+        pass
+    
+    #checking: finished seasons go into the history
+    l.simulate_to_day([1, 0, 0])
+    team = l.teams[5]
+    player = team.get_full_roster()[0]
+    assert l.history.get_stat(player, "Goals") == [(0, player.get_stat("career", "Goals"))]
+    lines = l.history.get_team_history(team)
+    assert len(lines) == 1 and lines[0]["Year"] == 0
+    assert lines[0]["season"]["Wins"] == team.get_stat("career", "Wins")
+    assert team.get_stat("playoff", "Wins") == 0
+    assert all(line["Team"] is team for line in l.history.get_team_players(team, 0))
+    teams, players = l.history.get_season(0)
+    assert len(teams) == 32
+    assert sum(line["playoff"]["Wins"] - line["playoff"]["Losses"] for line in teams) == 0
+    assert [line["playoff"]["Wins"] for line in teams].count(16) == 1
+    leaders = l.history.get_season_leaders(0, "Goals", n = 2)
+    assert leaders[0][1] >= leaders[1][1]
+    assert joined.get_stat("career", "Minutes") >= 5 and joined.get_stat("season", "Minutes") == 0
+    lines = l.history.get_player_history(scorer)
+    assert len(lines) == 1 and lines[0]["Team"] is l.teams[2] and scored["Goals"] > 0
+    assert all(lines[0]["season"][stat] == n for stat, n in scored.items())
+    assert scorer.get_stat("career", "Goals") == scored["Goals"] and l.teams[2].released == []
+    
+    #checking: a loaded league carries on as the original did
+    copy.simulate_to_day([1, 0, 0])
+    copy.save(path)
+    copy = League.League.load(path)
+    assert copy.teams[5].name == team.name
+    assert copy.history.get_stat(copy.teams[5].get_full_roster()[0], "Goals") == l.history.get_stat(player, "Goals")
+    assert [(p.name, n) for p, n in copy.history.get_season_leaders(0, "Goals")] == [
+        (p.name, n) for p, n in l.history.get_season_leaders(0, "Goals")]
+    assert [p.rating for p in copy.teams[9].get_full_roster()] == [p.rating for p in l.teams[9].get_full_roster()]
+    assert copy.show_league_leaders("career", "Assists", 5) == l.show_league_leaders("career", "Assists", 5)
+    
+    #checking: a player removed from their team keeps their stats through a save
+    gone = l.teams[6].get_full_roster()[2]
+    l.teams[6].remove_player(gone)
+    l.save(path)
+    copy = League.League.load(path)
+    moved = [p for p in copy.history.players.owners if p.name == gone.name][0]
+    assert moved.team is None and moved.stats.store is copy.player_stats
+    assert copy.player_stats.owners[moved.stats.row] is moved
+    for stat in ("Goals", "Minutes"):
+        assert moved.get_stat("career", stat) == gone.get_stat("career", stat)
+    assert moved.get_stat("career", "Minutes") > 0
+    assert all(p is None or p.stats.store.owners[p.stats.row] is p for p in copy.player_stats.owners)
     
+    print("League Tests Passed")
     
 
 def __main__():
     player_tests()
     team_tests()
     game_tests()
+    league_tests()
     
 __main__()
\ No newline at end of file